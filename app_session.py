@@ -0,0 +1,158 @@
+"""
+Uygulama oturumu: süreç boyunca yaşayan veritabanı bağlantısı ve hayvan önbelleği.
+
+Bağlantı ve sürü listesi, kullanıcı giriş ekranındayken arka planda hazırlanır.
+Çıkış yapıp tekrar girildiğinde aynı bağlantı ve önbellek kullanılır.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from config import CACHE_CONFIG
+from database import get_database
+from database.animal_cache import AnimalCache
+from database.snapshot import HerdSnapshot
+from models.animal import Animal
+
+
+class _WarmupWorker(QThread):
+    """Bağlantıyı kurar ve sürü listesini arka planda okur."""
+    herd_loaded = pyqtSignal(object, object)  # db, List[Animal] (hata varsa None)
+
+    def __init__(self, db=None, snapshot: Optional[HerdSnapshot] = None,
+                 on_connected: Optional[Callable] = None):
+        super().__init__()
+        self.db = db
+        self.snapshot = snapshot
+        # Bağlantı denemesi biter bitmez (bu thread'den) çağrılır; sürü listesi beklenmez
+        self.on_connected = on_connected
+
+    def run(self):
+        animals: Optional[List[Animal]] = None
+        try:
+            if self.db is None:
+                self.db = get_database()
+        except Exception as e:
+            print(f"Veritabanı hazırlanırken hata: {e}")
+        finally:
+            if self.on_connected is not None:
+                self.on_connected(self.db)
+        if self.db is None:
+            self.herd_loaded.emit(None, None)
+            return
+        try:
+            animals = self.db.get_all_animals()
+            # Bir sonraki açılışta ağ beklenmeden gösterilecek kopya
+            if self.snapshot is not None:
+                self.snapshot.save(animals)
+        except Exception as e:
+            print(f"Veritabanı hazırlanırken hata: {e}")
+        self.herd_loaded.emit(self.db, animals)
+
+
+class AppSession(QObject):
+    """Dashboard'lar arasında paylaşılan bağlantı + önbellek."""
+
+    # Sürü listesi (yeniden) yüklendiğinde yayılır
+    herd_ready = pyqtSignal(list)
+    # Canlı liste alınamadığında yayılır
+    herd_failed = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.db = None
+        self.animal_cache = AnimalCache(CACHE_CONFIG["animal_ttl_seconds"])
+        self.herd_loaded_at: Optional[float] = None
+        self.snapshot = HerdSnapshot(CACHE_CONFIG["herd_snapshot_file"])
+        # Sadece arayüz thread'inde değişir; thread bitene (finished) kadar referans tutulur
+        self._worker: Optional[_WarmupWorker] = None
+        # Bağlantı denemesi bittiğinde kurulur; arka plan görevleri bunu bekler
+        self._db_lock = threading.Lock()
+        self._db_ready = threading.Event()
+        self._herd_requested_at: Optional[float] = None
+
+    @property
+    def herd(self) -> Optional[List[Animal]]:
+        """
+        Güncel sürü listesi (canlı liste henüz gelmediyse None).
+        Önbellekten türetilir; ekleme/düzenleme/silme önbelleğe yazıldığı için listeye de yansır.
+        """
+        if self.herd_loaded_at is None:
+            return None
+        return self.animal_cache.all()
+
+    def warm_up(self):
+        """
+        Bağlantı yoksa kur, sürü listesi yoksa veya eskidiyse arka planda yeniden oku.
+        Zaten çalışan bir hazırlık varsa tekrar başlatılmaz. Sadece arayüz thread'inden çağrılır.
+        """
+        if self._worker is not None:
+            return
+        if not self.is_herd_stale():
+            return
+        if self.db is None:
+            self._db_ready.clear()
+        self._herd_requested_at = time.monotonic()
+        self._worker = _WarmupWorker(self.db, self.snapshot, self._on_connected)
+        self._worker.herd_loaded.connect(self._on_herd_loaded)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+
+    def is_herd_stale(self) -> bool:
+        if self.herd_loaded_at is None:
+            return True
+        return time.monotonic() - self.herd_loaded_at > self.animal_cache.ttl_seconds
+
+    def load_snapshot(self) -> Optional[Tuple[List[Animal], datetime]]:
+        """Son kaydedilen sürü listesini diskten oku (canlı veri gelene kadar gösterilir)"""
+        return self.snapshot.load()
+
+    def find_by_rfid(self, rfid: str) -> Optional[Animal]:
+        """
+        Okunan karta ait hayvan: önce bellekteki dizin, yoksa veritabanı
+        (veritabanı yolu bloklar; arka plan görevinden çağrılmalı).
+        """
+        animal = self.animal_cache.get_by_rfid(rfid)
+        if animal is not None:
+            return animal
+        animal = self.wait_for_db().get_animal_by_rfid(rfid)
+        if animal is not None:
+            self.animal_cache.put(animal)
+        return animal
+
+    def is_connected(self) -> bool:
+        return self.db is not None
+
+    def wait_for_db(self):
+        """
+        Bağlantıyı döndür; kuruluyorsa bitmesini bekle (sürü listesi beklenmez).
+        Her thread'den çağrılabilir; hazırlık yalnız arayüz thread'inden başlatılır.
+        """
+        if self.db is None:
+            if threading.current_thread() is threading.main_thread():
+                self.warm_up()
+            self._db_ready.wait()
+        return self.db
+
+    def _on_connected(self, db):
+        """(Hazırlık thread'inde) bağlantı denemesi bitti; bekleyenleri bırak"""
+        with self._db_lock:
+            if self.db is None:
+                self.db = db
+        self._db_ready.set()
+
+    def _on_worker_finished(self):
+        self._worker = None
+
+    def _on_herd_loaded(self, db, animals):
+        if animals is None:
+            self.herd_failed.emit()
+            return
+        self.herd_loaded_at = time.monotonic()
+        # Canlı liste yetkilidir: sadece diskteki kopyada kalan (başka istemcide silinmiş)
+        # satırlar önbellekten ve kart dizininden çıkar; okuma sürerken yapılan değişiklikler korunur
+        self.animal_cache.replace_all(animals, keep_since=self._herd_requested_at)
+        self.herd_ready.emit(self.herd)
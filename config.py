@@ -59,3 +59,144 @@ ANIMAL_FIELDS = {
     "notlar": "Notlar"
 }
 
+
+# Sağlık kuralları (HealthAnalyzer). Eşikler °C; kilo kaybı profil kilosuna göre yüzde.
+# Tabloda olmayan türler "default" eşiklerini kullanır. "bands" ile yaş bandına
+# göre (age_bands sınırlarına göre 0: 1 yaş altı, 1: 1 yaş ve üstü) geçersiz kılınabilir;
+# yaşı girilmemiş (0) hayvanlar yetişkin kabul edilir.
+HEALTH_RULES = {
+    "age_bands": [1],
+    "default": {"warning_temp": 38.5, "critical_temp": 39.5, "weight_loss_pct": 10},
+    "species": {
+        "İnek": {"warning_temp": 39.3, "critical_temp": 40.0,
+                 "bands": {0: {"warning_temp": 39.6, "critical_temp": 40.3}}},
+        "Boğa": {"warning_temp": 39.3, "critical_temp": 40.0},
+        "Manda": {"warning_temp": 39.3, "critical_temp": 40.0},
+        "Koyun": {"warning_temp": 40.0, "critical_temp": 40.5,
+                  "bands": {0: {"warning_temp": 40.3, "critical_temp": 40.8}}},
+        "Keçi": {"warning_temp": 40.0, "critical_temp": 40.5,
+                 "bands": {0: {"warning_temp": 40.3, "critical_temp": 40.8}}},
+        "At": {"warning_temp": 38.3, "critical_temp": 39.0, "weight_loss_pct": 8},
+        "Eşek": {"warning_temp": 38.3, "critical_temp": 39.0, "weight_loss_pct": 8},
+        "Tavuk": {"warning_temp": 42.5, "critical_temp": 43.5, "weight_loss_pct": 15},
+        "Ördek": {"warning_temp": 42.5, "critical_temp": 43.5, "weight_loss_pct": 15},
+        "Kaz": {"warning_temp": 42.0, "critical_temp": 43.0, "weight_loss_pct": 15},
+        "Hindi": {"warning_temp": 42.0, "critical_temp": 43.0, "weight_loss_pct": 15},
+    },
+}
+
+# Hayvanın kendi geçmişine göre anomali tespiti (utils.anomaly_detector)
+ANOMALY_CONFIG = {
+    "alpha": 0.2,  # EWMA ağırlığı (büyük: son ölçümlere daha hızlı uyum)
+    "min_samples": 5,  # Bu kadar ölçümden önce sapma işaretlenmez
+    "z_threshold": 3.0,  # Ortalamadan kaç standart sapma uzaklık olağandışı sayılır
+    "min_std": {"temperature": 0.2, "weight": 2.0},  # Çok kararlı geçmişte aşırı hassasiyeti önler
+    "slope_window": 5,  # Eğim için son N ölçüm
+    "temperature_slope_per_day": 0.5,  # °C/gün ve üstü sürekli artış işaretlenir
+    "weight_slope_pct_per_day": 1.0,  # Günde ortalamanın %1'i ve üstü sürekli kayıp işaretlenir
+    "checkpoint_file": "data/anomaly_state.json",
+    "checkpoint_interval_seconds": 30  # Değişen durum en fazla bu sıklıkta diske yazılır (çıkışta da)
+}
+
+# Sürü düzeyinde salgın taraması (utils.outbreak_detector)
+OUTBREAK_CONFIG = {
+    "lookback_days": 365,  # Taramaya alınan geçmiş ölçümler
+    "baseline_days": 14,  # Günlük oran, aynı türün önceki N günüyle karşılaştırılır
+    "min_animals": 3,  # Aynı gün en az bu kadar ateşli hayvan yoksa grup uyarısı verilmez
+    "min_rate": 0.05,  # Ölçülen hayvanların en az bu oranı ateşli olmalı
+    "baseline_floor": 0.02,  # Geçmişte hiç ateş yoksa beklenen oran için alt sınır
+    # Önceki penceresinde bundan az ölçüm olan gün değerlendirilmez (taban çizgisi oturmamış)
+    "min_baseline_measurements": 30,
+    "z_threshold": 3.0  # Beklenenden kaç standart sapma fazlası salgın şüphesi sayılır
+}
+
+# Önbellek ayarları
+CACHE_CONFIG = {
+    # Bellekteki hayvan satırı bu süreden eskiyse seçimde arka planda tazelenir
+    "animal_ttl_seconds": 120,
+    # Son sürü listesinin diskteki kopyası; açılışta ağ beklenmeden bundan çizilir
+    "herd_snapshot_file": "data/herd_snapshot.json",
+    # Kayıtlı sağlık durumlarının hangi girdi/kural sürümüyle hesaplandığı (utils.health_status_sync)
+    "health_status_state_file": "data/health_status_state.json",
+    # RFID ile okunan hayvan için önceden hazırlananlar (grafik dialog'unun varsayılan aralığı,
+    # fotoğraf dialog'unun ilk küçük resimleri) ve bellekte tutulan en fazla hayvan sayısı
+    "scan_prefetch_log_days": 7,
+    "scan_prefetch_photos": 6,
+    "scan_prefetch_max_animals": 20,
+    # Önceden okunan sağlık geçmişi bu süreden eskiyse kullanılmaz (başka istemcinin ölçümleri)
+    "scan_prefetch_ttl_seconds": 120
+}
+
+# Fotoğraf indirme / önbellek ayarları
+PHOTO_CONFIG = {
+    "cache_dir": "data/photo_cache",
+    "cache_max_mb": 200,  # Disk önbelleği üst sınırı (aşılınca en eski kullanılanlar silinir)
+    "max_workers": 4,  # Aynı anda yapılacak en fazla indirme
+    "timeout": 10,
+    "thumbnail_sizes": [160, 350],  # Diske bir kez üretilen küçük resim genişlikleri (px)
+    "list_thumbnail_width": 350,  # Fotoğraf listesinde gösterilen küçük resim genişliği
+    "pixmap_cache_mb": 64,  # Süreç geneli QPixmapCache bellek bütçesi
+    "page_size": 100,  # list_photos ile tek seferde listelenen dosya sayısı
+    "prefetch_rows": 6  # Görünür alanın altında önceden hazırlanacak küçük resim sayısı
+}
+
+# RFID okuyucu (Arduino) seri port ayarları
+SERIAL_CONFIG = {
+    # Sabit okuyucular (kapı/geçit başına bir tane), ör.
+    # [{"id": "Giriş Kapısı", "port": "/dev/ttyUSB0"}, {"id": "Sağım Geçidi", "port": "COM4"}]
+    # Boşsa takılı tüm okuyucular otomatik bulunur ve her biri ayrı açılır.
+    # Okuyucu başına farklı biçim/hız için: {"id": ..., "port": ..., "protocol": "rdm6300", "baudrate": 9600}
+    "readers": [],
+    # Okuyucunun gönderdiği çerçeve biçimi: "line", "rdm6300" veya "binary" (utils.rfid_frames)
+    "protocol": "line",
+    "protocol_options": {
+        "line": {"tag_pattern": None},  # None: 4-32 karakter harf/rakam (arada boşluk, ':' ve '-')
+        "binary": {"start_byte": 0xAA, "min_length": 4, "max_length": 16},
+        # Tartı: hayvan başına bir kez, ağırlık oturunca bildirilir (tartım istasyonu)
+        "scale": {"empty_kg": 5.0, "stable_readings": 3, "stable_tolerance_kg": 0.5}
+    },
+    "port_cache_file": "data/serial_ports.txt",  # Son çalışan portlar; açılışta tarama yapılmaz
+    "rescan_interval_seconds": 2,  # pyudev yoksa takılan cihaz için port listesi karşılaştırma aralığı
+    "baudrate": 9600,
+    "reset_delay_seconds": 2,  # Port açılınca Arduino'nun yeniden başlaması için (bağlantı başına bir kez)
+    "reconnect_seconds": 3,  # Bağlantı koparsa yeniden deneme aralığı
+    "read_timeout_seconds": 1.0,  # Bloklayan okuma bu sürede bir uyanıp durdurma isteğine bakar
+    "read_chunk_bytes": 256,  # Tek okumada alınabilecek en fazla bayt (yeniden kullanılan tampon)
+    "max_frame_bytes": 64,  # Satır sonu gelmeden bu kadar veri birikirse atılır (line biçimi)
+    "dedup_seconds": 2.0,  # Aynı kart aynı okuyucuda bu süre içinde tekrar okunursa yok sayılır
+    "batch_interval_ms": 50  # Okumalar arayüze bu aralıkla toplu teslim edilir
+}
+
+# Tartım istasyonu: tartı/termometre okumaları son okunan RFID kartıyla eşleştirilir
+STATION_CONFIG = {
+    # Cihaz yoksa None, ör. {"port": "/dev/ttyUSB1", "protocol": "scale", "baudrate": 9600}
+    "scale": None,
+    "thermometer": None,  # ör. {"port": "COM5", "protocol": "thermometer"}
+    "pair_window_seconds": 8,  # Okuma, bu süre içinde okunan karta (önce veya sonra) bağlanır
+    "weight_range_kg": [1, 2000],  # Dışındaki okumalar reddedilir
+    "temperature_range_c": [30.0, 45.0],
+    "max_weight_change": 0.3,  # Kayıtlı kilodan bu oranda fazla sapan tartım şüpheli sayılır
+    "batch_size": 25,  # Bu kadar ölçüm birikince (veya flush_seconds dolunca) toplu yazılır
+    "flush_seconds": 5,
+    "recent_rows": 200  # Ekranda gösterilen son ölçüm sayısı
+}
+
+# Sürü yoklaması (utils.roll_call)
+ROLL_CALL_CONFIG = {
+    "sessions_dir": "data/roll_calls",  # Oturum başına bir JSON dosyası
+    "keep_sessions": 50,  # Daha eskileri silinir
+    "duplicate_gap_seconds": 60,  # Aynı kart bu kadar aradan sonra tekrar okunursa çift sayılır
+    "autosave_seconds": 30,  # Yoklama sürerken yarım oturum bu aralıkla diske yazılır
+    "refresh_ms": 500  # Sayaçların ekranda güncellenme aralığı
+}
+
+# Arka plan görev havuzu (veritabanı işlemleri)
+TASK_CONFIG = {
+    "max_workers": 4  # Aynı anda çalışacak en fazla veritabanı işlemi
+}
+
+# Açılış süresi bütçeleri (ms) - aşılırsa konsola uyarı yazılır
+STARTUP_CONFIG = {
+    "login_budget_ms": 1000,
+    "dashboard_budget_ms": 2500
+}
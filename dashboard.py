@@ -1,38 +1,69 @@
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
-from serial_reader import SerialReader
-import requests
+from serial_reader import SerialReader, get_rfid_service
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QLineEdit, QPushButton, QMessageBox, QListWidget, 
-                             QListWidgetItem, QComboBox, QGroupBox, QGridLayout, QTextEdit,
+                             QListWidgetItem, QComboBox, QGroupBox, QTextEdit,
                              QDialog, QDialogButtonBox, QFormLayout, QFileDialog, QDateEdit,
-                             QScrollArea, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal, QRegExp, QDate
+                             QScrollArea, QFrame, QListView, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QTabWidget)
+from PyQt5.QtCore import (Qt, pyqtSignal, QRegExp, QDate, QThread, QAbstractListModel,
+                          QModelIndex, QSize, QTimer, QPoint)
 from PyQt5.QtGui import QFont, QColor, QRegExpValidator, QPixmap
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import pandas as pd
 
-from database import get_database
+from app_session import AppSession
 from models.animal import Animal
-from config import APP_CONFIG, ANIMAL_TYPES, GENDERS
+from config import (APP_CONFIG, ANIMAL_TYPES, CACHE_CONFIG, GENDERS, PHOTO_CONFIG, OUTBREAK_CONFIG,
+                    ROLL_CALL_CONFIG, STATION_CONFIG)
 from utils.validators import validate_animal_data
 from utils.health_analyzer import HealthAnalyzer
+from detail_panel import AnimalDetailPanel
+from ui_resources import preload_assets
+from workers import get_task_runner
+from utils.anomaly_detector import get_anomaly_detector
+from utils.outbreak_detector import OutbreakDetector
+from utils.health_status_sync import get_health_status_sync
+from utils.weighing_station import MeasurementQueue, TEMPERATURE, WEIGHT, WeighingStation
+from utils.roll_call import RollCallSession, RollCallStore, diff_summaries, herd_tag_index
+from utils.rfid_frames import normalize_tag
 
 class Dashboard(QMainWindow):
-    def __init__(self, username, on_logout=None):
+    def __init__(self, username, on_logout=None, session=None):
         super().__init__()
         self.username = username
         self.on_logout = on_logout
-        self.db = get_database()
-        self.db.connect()
+        # Bağlantı ve önbellek oturuma aittir; giriş ekranında ısıtılır, çıkışta korunur
+        self.session = session or AppSession()
+        self.session.warm_up()
         self.selected_animal_id = None
-        self.rfid_reader_thread = None  # RFID okuma thread'i için
+        # Listede yüklü satırlar (id -> Animal); detaylar buradan anında çizilir
+        self.animal_cache = self.session.animal_cache
+        # Veritabanı işlemleri arayüz thread'ini bloklamadan bu havuzda çalışır
+        self.tasks = get_task_runner()
+        self._busy_tasks = 0
+        # Her ölçümde hayvanın kendi geçmişine göre olağandışılık kontrolü
+        self.anomaly_detector = get_anomaly_detector()
+        self.status_sync = get_health_status_sync()
+        self.health_trend_dialog = None  # Grafik dialog'u (canvas) açılışlar arasında yeniden kullanılır
+        # Süreç boyunca açık kalan RFID okuyucu; arama modu açıkken okunan her kart aranır
+        self.rfid_service = get_rfid_service()
+        self.rfid_scanning = False
+        self.rfid_service.connection_changed.connect(self.on_rfid_connection_changed)
+        # Arduino açılışta yeniden başlar (~2 sn); port önceden açılırsa ilk okuma beklemez
+        self.rfid_service.start()
         # Hayvan listesindeki tür gruplarının (inek, koyun vs.) açık/kapalı durumları
         self.group_states: Dict[str, bool] = {}
+        # Listedeki hayvan satırları (id -> öğe); okunan kartın satırı aranmadan bulunur
+        self._list_items: Dict[str, QListWidgetItem] = {}
+        # RFID ile okunan hayvanların önceden okunmuş sağlık geçmişi (id -> (kayıtlar, okunma anı))
+        self._prefetched_logs: Dict[str, tuple] = {}
+        # Hayvan başına geçersizleştirme sayacı; yolda olan eski okuma önbelleğe geri yazılmaz
+        self._prefetch_generation: Dict[str, int] = {}
         
         self.setWindowTitle(f"{APP_CONFIG['title']} - Admin Dashboard")
         self.setMinimumSize(APP_CONFIG['width'], APP_CONFIG['height'])
@@ -44,8 +75,97 @@ class Dashboard(QMainWindow):
             (screen.height() - APP_CONFIG['height']) // 2
         )
         
+        # Ortak ikonları bir kez yükle (detay paneli her seçimde diskten okumasın)
+        preload_assets()
+        
         self.init_ui()
-        self.load_animal_list()
+        self.session.herd_ready.connect(self.on_herd_ready)
+        self.session.herd_failed.connect(self.on_herd_failed)
+        if self.session.herd is not None:
+            # Hazırlık bitmişse liste beklemeden çizilir
+            self.load_animal_list(self.session.herd)
+        else:
+            self.show_herd_snapshot()
+
+    @property
+    def db(self):
+        """Oturumun bağlantısı (hazırlık sürüyorsa bitmesi beklenir)."""
+        return self.session.wait_for_db()
+
+    def show_herd_snapshot(self):
+        """Canlı liste gelene kadar diskteki son kopyayı 'yenileniyor' notuyla göster."""
+        snapshot = self.session.load_snapshot()
+        if snapshot is None:
+            self.set_list_status("🔄 Liste yükleniyor...")
+            return
+        animals, saved_at = snapshot
+        self.load_animal_list(animals, stale=True)
+        self.set_list_status(f"🔄 Yenileniyor... (son kayıt: {saved_at.strftime('%d.%m.%Y %H:%M')})")
+
+    def set_list_status(self, text=None):
+        """Liste başlığının altındaki durum notunu göster/gizle"""
+        self.list_status_label.setText(text or "")
+        self.list_status_label.setVisible(bool(text))
+
+    def begin_task(self, text):
+        """Arka plan işlemi başlarken liste altındaki notu göster"""
+        self._busy_tasks += 1
+        self.set_list_status(text)
+
+    def end_task(self):
+        """Arka plan işlemi bitince (başka işlem kalmadıysa) notu gizle"""
+        self._busy_tasks = max(self._busy_tasks - 1, 0)
+        if not self._busy_tasks:
+            self.set_list_status(None)
+
+    def on_herd_ready(self, animals):
+        """Arka planda okunan sürü listesini göster (arama/filtre yoksa)."""
+        self.set_list_status(None)
+        if not self.search_entry.text().strip() and not self.get_filters():
+            self.load_animal_list(animals)
+        self.sync_health_statuses(animals)
+        # Seçili hayvanın detayları canlı satırla güncellenir
+        if self.selected_animal_id is not None:
+            animal = self.animal_cache.get(self.selected_animal_id)
+            if animal is not None:
+                self.show_animal_details(animal)
+
+    def sync_health_statuses(self, animals):
+        """Kayıtlı sağlık durumu kurallardan kopmuş hayvanları arka planda düzelt"""
+        if self.tasks.is_pending("health_status_sync"):
+            return
+        self.tasks.submit(self.status_sync.sync, self.db, animals, key="health_status_sync").then(
+            self.on_health_statuses_synced
+        )
+
+    def sync_animal_statuses(self, animals):
+        """Kaydedilen hayvanların kayıtlı durumunu arka planda kurallarla eşitle"""
+        animals = [animal for animal in animals if animal.id is not None]
+        if not animals:
+            return
+        for animal in animals:
+            self.status_sync.mark_dirty(animal.id)
+        self.tasks.submit(self.status_sync.sync, self.db, animals).then(self.on_health_statuses_synced)
+
+    def on_health_statuses_synced(self, updates):
+        """Yazılan durumları bellekteki satırlara uygula (satırlar sadece arayüz thread'inde değişir)"""
+        if not updates:
+            return
+        for animal_id, label in updates.items():
+            animal = self.animal_cache.get(animal_id)
+            if animal is not None:
+                animal.saglik_durumu = label
+        if self.selected_animal_id is not None and str(self.selected_animal_id) in updates:
+            animal = self.animal_cache.get(self.selected_animal_id)
+            if animal is not None:
+                self.show_animal_details(animal)
+
+    def on_herd_failed(self):
+        """Canlı liste alınamadı; ekrandaki (varsa) son kopya kalır"""
+        if self.animal_list.count():
+            self.set_list_status("⚠ Bağlantı kurulamadı, son kayıt gösteriliyor")
+        else:
+            self.set_list_status("⚠ Bağlantı kurulamadı")
     
     def init_ui(self):
         # Ana widget (login sayfası ile uyumlu arka plan)
@@ -204,9 +324,6 @@ class Dashboard(QMainWindow):
         
         layout.addLayout(search_layout)
         
-        # RFID reader thread için değişken
-        self.rfid_reader_thread = None
-        
         # Filtreler
         filter_group = QGroupBox("Filtreler")
         filter_group.setFont(QFont("Arial", 11, QFont.Bold))
@@ -291,6 +408,13 @@ class Dashboard(QMainWindow):
         list_label.setStyleSheet("color: #3E2C1C; padding-top: 5px; background: transparent; border: none;")
         layout.addWidget(list_label)
         
+        # Disk kopyası gösterilirken "yenileniyor" notu
+        self.list_status_label = QLabel()
+        self.list_status_label.setFont(QFont("Arial", 10))
+        self.list_status_label.setStyleSheet("color: #7f8c8d; background: transparent; border: none;")
+        self.list_status_label.hide()
+        layout.addWidget(self.list_status_label)
+        
         # Hayvan listesi
         self.animal_list = QListWidget()
         self.animal_list.setFont(QFont("Arial", 11))
@@ -316,6 +440,8 @@ class Dashboard(QMainWindow):
             }
         """)
         self.animal_list.itemClicked.connect(self.on_animal_select)
+        # Ok tuşlarıyla gezinirken de detayları göster
+        self.animal_list.currentItemChanged.connect(self.on_current_item_changed)
         layout.addWidget(self.animal_list, 1)
         
         # Butonlar
@@ -384,6 +510,66 @@ class Dashboard(QMainWindow):
         delete_btn.clicked.connect(self.delete_animal)
         button_layout.addWidget(delete_btn)
         
+        outbreak_btn = QPushButton("🦠 Salgın Taraması")
+        outbreak_btn.setFont(QFont("Arial", 11))
+        outbreak_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FFF1D6;
+                color: #8A5A00;
+                padding: 12px;
+                border: none;
+                border-radius: 16px;
+            }
+            QPushButton:hover {
+                background-color: #FFE6B8;
+            }
+            QPushButton:pressed {
+                background-color: #FFDB9A;
+            }
+        """)
+        outbreak_btn.clicked.connect(self.scan_outbreaks)
+        button_layout.addWidget(outbreak_btn)
+        
+        station_btn = QPushButton("⚖ Tartım İstasyonu")
+        station_btn.setFont(QFont("Arial", 11))
+        station_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #E6E0F5;
+                color: #4B3B7A;
+                padding: 12px;
+                border: none;
+                border-radius: 16px;
+            }
+            QPushButton:hover {
+                background-color: #D9D0EF;
+            }
+            QPushButton:pressed {
+                background-color: #CBBFE8;
+            }
+        """)
+        station_btn.clicked.connect(self.open_station_dialog)
+        button_layout.addWidget(station_btn)
+        
+        roll_call_btn = QPushButton("📋 Sürü Yoklaması")
+        roll_call_btn.setFont(QFont("Arial", 11))
+        roll_call_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #DDF1F0;
+                color: #1D5C58;
+                padding: 12px;
+                border: none;
+                border-radius: 16px;
+            }
+            QPushButton:hover {
+                background-color: #CAE8E6;
+            }
+            QPushButton:pressed {
+                background-color: #B6DFDC;
+            }
+        """)
+        roll_call_btn.clicked.connect(self.open_roll_call_dialog)
+        button_layout.addWidget(roll_call_btn)
+        
         layout.addLayout(button_layout)
         
         return panel
@@ -404,13 +590,14 @@ class Dashboard(QMainWindow):
         detail_label.setStyleSheet("color: #3E2C1C; background: transparent; border: none;")
         layout.addWidget(detail_label)
         
-        # Detay alanı (scrollable)
-        self.detail_widget = QWidget()
-        self.detail_layout = QVBoxLayout()
-        self.detail_widget.setLayout(self.detail_layout)
+        # Detay alanı (scrollable) - widget'lar bir kez oluşturulur, seçimde sadece veri bağlanır
+        self.detail_panel = AnimalDetailPanel()
+        self.detail_panel.photos_requested.connect(self.open_photo_dialog)
+        self.detail_panel.trend_requested.connect(self.open_health_trend_dialog)
+        self.detail_panel.log_requested.connect(self.open_health_log_dialog)
         
         scroll = QScrollArea()
-        scroll.setWidget(self.detail_widget)
+        scroll.setWidget(self.detail_panel)
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("border: none;")
         
@@ -420,10 +607,14 @@ class Dashboard(QMainWindow):
         
         return panel
     
-    def load_animal_list(self, animals=None):
-        """Hayvan listesini yükle ve türlere göre grupla"""
+    def load_animal_list(self, animals=None, stale=False):
+        """
+        Hayvan listesini yükle ve türlere göre grupla.
+        stale=True: satırlar diskteki kopyadan geliyor, canlı veriyle tazelenecek.
+        """
         if animals is None:
             animals = self.db.get_all_animals()
+        self.animal_cache.put_many(animals, stale=stale)
 
         # Tür ve isimlere göre sırala ki gruplar düzgün gelsin
         animals_sorted = sorted(
@@ -431,19 +622,32 @@ class Dashboard(QMainWindow):
             key=lambda a: ((a.tur or "").lower(), (a.isim or "").lower()),
         )
 
-        # Listeyi temizle
+        # Sağlık analizi tüm liste için tek geçişte (mesajlar burada gerekmez)
+        try:
+            statuses = HealthAnalyzer.analyze_herd(
+                *HealthAnalyzer.herd_columns(animals_sorted)
+            ).status_names()
+        except Exception as e:
+            print(f"Sağlık analizi hatası: {e}")
+            statuses = ["GOOD"] * len(animals_sorted)
+
+        # Listeyi temizle (yeniden çizerken seçim sinyalleri tetiklenmesin)
+        self.animal_list.blockSignals(True)
         self.animal_list.clear()
+        self._list_items = {}
         current_type = None
+        selected_item = None
 
-        for animal in animals_sorted:
+        for index, animal in enumerate(animals_sorted):
             animal_type = animal.tur or "Diğer"
 
             # Yeni bir tür grubuna geçiyorsak başlık ekle
             if animal_type != current_type:
                 current_type = animal_type
 
-                # Başlangıçta tüm gruplar kapalı: ok sağa bakan (▶)
-                header_item = QListWidgetItem(f"▶ {current_type}")
+                # Kullanıcının açtığı gruplar yeniden çizimde açık kalır (▼), diğerleri kapalı (▶)
+                expanded = self.group_states.get(animal_type, False)
+                header_item = QListWidgetItem(f"{'▼' if expanded else '▶'} {current_type}")
                 header_font = header_item.font()
                 header_font.setBold(True)
                 header_item.setFont(header_font)
@@ -456,14 +660,7 @@ class Dashboard(QMainWindow):
                 header_item.setForeground(QColor("#3E2C1C"))
                 self.animal_list.addItem(header_item)
 
-            # Önce sağlık analizini yap
-            try:
-                temp = getattr(animal, "temperature", None)
-                current_weight = float(animal.kilo) if animal.kilo else None
-                analysis = HealthAnalyzer.analyze_health(animal, temp, current_weight)
-                status = analysis.get("health_status", "GOOD")
-            except Exception:
-                status = "GOOD"
+            status = statuses[index]
 
             # İkonu durumuna göre belirle
             prefix_icon = ""
@@ -493,68 +690,142 @@ class Dashboard(QMainWindow):
                 font.setBold(True)
                 item.setFont(font)
 
-            # İlk yüklemede tüm gruplar kapalı: tüm hayvanları gizle
-            item.setHidden(True)
+            # Kapalı grupların hayvanlarını gizle
+            item.setHidden(not expanded)
 
             self.animal_list.addItem(item)
+            self._list_items[str(animal.id)] = item
+            if self.selected_animal_id is not None and str(animal.id) == str(self.selected_animal_id):
+                selected_item = item
+
+        if selected_item is not None:
+            self.animal_list.setCurrentItem(selected_item)
+        self.animal_list.blockSignals(False)
     
     def on_search(self):
-        """Arama yap"""
+        """Arama yap (arka planda; yazarken sadece son aramanın sonucu gösterilir)"""
         query = self.search_entry.text()
         filters = self.get_filters()
-        results = self.db.search_animals(query, filters)
-        self.load_animal_list(results)
+        self.tasks.submit(
+            lambda: self.db.search_animals(query, filters), key="search"
+        ).then(self.load_animal_list)
     
     def start_rfid_search(self):
-        """RFID okuma işlemini başlat"""
-        # Eğer zaten bir okuma işlemi varsa durdur
-        if self.rfid_reader_thread and self.rfid_reader_thread.isRunning():
-            self.rfid_reader_thread.stop()
-            self.rfid_reader_thread.wait()
-        
-        # Butonu devre dışı bırak
-        self.rfid_search_btn.setEnabled(False)
-        self.rfid_search_btn.setText("Okunuyor...")
-        
-        # Yeni reader thread oluştur
-        self.rfid_reader_thread = SerialReader()
-        self.rfid_reader_thread.rfid_read.connect(self.on_rfid_search_found)
-        self.rfid_reader_thread.error_occurred.connect(self.on_rfid_search_error)
-        self.rfid_reader_thread.start()
+        """RFID arama modunu aç/kapat (açıkken okunan her kart aranır)"""
+        if self.rfid_scanning:
+            self.stop_rfid_search()
+            return
+        self.rfid_scanning = True
+        self.rfid_search_btn.setText("⏹ Durdur")
+        self.rfid_service.subscribe(self.on_rfid_search_found, self.on_rfid_search_error)
+
+    def stop_rfid_search(self):
+        """Arama modunu kapat (port açık kalır; sonraki okuma beklemeden başlar)"""
+        self.rfid_service.unsubscribe(self.on_rfid_search_found, self.on_rfid_search_error)
+        self.rfid_scanning = False
+        self.rfid_search_btn.setText("📡 RFID Oku")
     
     def on_rfid_search_found(self, rfid_id):
-        """RFID okunduğunda arama kutusuna yaz ve ara"""
-        # Thread'i durdur
-        if self.rfid_reader_thread:
-            self.rfid_reader_thread.stop()
-            self.rfid_reader_thread.wait()
-            self.rfid_reader_thread = None
-        
-        # Butonu tekrar aktif et
-        self.rfid_search_btn.setEnabled(True)
-        self.rfid_search_btn.setText("📡 RFID Oku")
-        
-        # RFID'yi arama kutusuna yaz (otomatik arama yapılacak textChanged signal ile)
-        self.search_entry.setText(rfid_id)
-        self.search_entry.setFocus()
-        
-        # Başarı mesajı
-        QMessageBox.information(self, "RFID Okundu", f"RFID: {rfid_id}\nArama yapılıyor...")
+        """
+        Okunan kartın hayvanını göster. Kart bellekteki dizinde tam eşleşmeyle aranır;
+        arama kutusu, liste araması ve onay pencereleri atlanır.
+        """
+        animal = self.animal_cache.get_by_rfid(rfid_id)
+        if animal is not None:
+            self.show_scanned_animal(animal, rfid_id)
+            return
+        # Dizinde yok (liste henüz gelmedi veya kart yeni): veritabanında tam eşleşme
+        self.set_list_status(f"📡 {rfid_id} aranıyor...")
+        self.tasks.submit(self.session.find_by_rfid, rfid_id, key="rfid_lookup").then(
+            lambda animal: self.on_rfid_animal_looked_up(animal, rfid_id),
+            self.on_rfid_search_error,
+        )
+
+    def on_rfid_animal_looked_up(self, animal, rfid_id):
+        if animal is None:
+            self.set_list_status(f"📡 Kayıtlı olmayan kart: {rfid_id}")
+            return
+        self.show_scanned_animal(animal, rfid_id)
+
+    def show_scanned_animal(self, animal: Animal, rfid_id):
+        """Okunan hayvanı listede seç, detaylarını göster ve sonraki adımları hazırla"""
+        self.set_list_status(f"📡 {animal.isim} ({rfid_id})")
+        self.prefetch_animal(animal)
+        item = self._list_items.get(str(animal.id))
+        if item is not None:
+            self.animal_list.blockSignals(True)
+            self.animal_list.setCurrentItem(item)
+            self.animal_list.blockSignals(False)
+            if not item.isHidden():
+                self.animal_list.scrollToItem(item)
+        self.select_animal(animal.id)
+
+    def prefetch_animal(self, animal: Animal):
+        """
+        (Arka planda) okunan hayvanın grafik için sağlık geçmişini ve ilk fotoğraflarının
+        küçük resimlerini hazırla; kullanıcı açtığında beklemeden gösterilir.
+        """
+        animal_id = str(animal.id)
+        # Aynı hayvan tekrar okunduysa zaten hazır (veya yolda)
+        if (self.get_prefetched_logs(animal_id) is not None
+                or self.tasks.is_pending(f"prefetch_logs:{animal_id}")):
+            return
+        generation = self._prefetch_generation.get(animal_id, 0)
+        self.tasks.submit(
+            self.fetch_health_logs, animal_id, CACHE_CONFIG["scan_prefetch_log_days"],
+            key=f"prefetch_logs:{animal_id}",
+        ).then(lambda logs: self._store_prefetched_logs(animal_id, logs, generation))
+        self.tasks.submit(
+            lambda: self.db.list_photos(animal_id, limit=CACHE_CONFIG["scan_prefetch_photos"]),
+            key=f"prefetch_photos:{animal_id}",
+        ).then(self._prefetch_thumbnails)
+
+    def _store_prefetched_logs(self, animal_id, logs, generation):
+        # İstek gönderildikten sonra yeni ölçüm yazıldıysa bu okuma eskidir
+        if self._prefetch_generation.get(animal_id, 0) != generation:
+            return
+        prefetched = self._prefetched_logs
+        prefetched.pop(animal_id, None)
+        prefetched[animal_id] = (logs or [], time.monotonic())
+        # En eski okunan hayvanlar atılır
+        while len(prefetched) > CACHE_CONFIG["scan_prefetch_max_animals"]:
+            del prefetched[next(iter(prefetched))]
+
+    def get_prefetched_logs(self, animal_id):
+        """Önceden okunmuş ve süresi dolmamış sağlık geçmişi (yoksa None)"""
+        entry = self._prefetched_logs.get(str(animal_id))
+        if entry is None:
+            return None
+        logs, fetched_at = entry
+        if time.monotonic() - fetched_at > CACHE_CONFIG["scan_prefetch_ttl_seconds"]:
+            return None
+        return logs
+
+    def invalidate_prefetched_logs(self, animal_ids):
+        """Yeni ölçüm yazılan/silinen hayvanların önceden okunmuş geçmişini at"""
+        for animal_id in animal_ids:
+            animal_id = str(animal_id)
+            self._prefetched_logs.pop(animal_id, None)
+            self._prefetch_generation[animal_id] = self._prefetch_generation.get(animal_id, 0) + 1
+
+    def _prefetch_thumbnails(self, photos):
+        if not photos:
+            return
+        from photo_loader import get_photo_loader
+        loader = get_photo_loader()
+        width = PHOTO_CONFIG["list_thumbnail_width"]
+        for photo in photos:
+            url = photo.get('url', '')
+            if url and loader.cached_pixmap(url, width) is None:
+                loader.request_thumbnail(url, width)
     
     def on_rfid_search_error(self, error_msg):
-        """RFID okuma hatası"""
-        # Thread'i durdur
-        if self.rfid_reader_thread:
-            self.rfid_reader_thread.stop()
-            self.rfid_reader_thread.wait()
-            self.rfid_reader_thread = None
-        
-        # Butonu tekrar aktif et
-        self.rfid_search_btn.setEnabled(True)
-        self.rfid_search_btn.setText("📡 RFID Oku")
-        
-        # Hata mesajı
-        QMessageBox.warning(self, "RFID Okuma Hatası", error_msg)
+        """RFID okuma hatası: okuyucu cihaz takılınca/yeniden bağlanınca kendiliğinden devam eder"""
+        self.set_list_status(f"⚠ {error_msg}")
+
+    def on_rfid_connection_changed(self, connected):
+        if connected and self.rfid_scanning:
+            self.set_list_status(None)
     
     def on_filter(self):
         """Filtre uygula"""
@@ -592,6 +863,7 @@ class Dashboard(QMainWindow):
                 new_text = current_text.replace("▼", "▶")
                 item.setText(new_text)
                 should_hide = True  # GİZLE
+            self.group_states[group_type] = not should_hide
 
             # LİSTEDEKİ DİĞER ELEMANLARI BUL VE GİZLE/GÖSTER
             # ListWidget'taki tüm satırları tek tek geziyoruz
@@ -606,417 +878,65 @@ class Dashboard(QMainWindow):
             return
 
         # Eğer başlığa değil de hayvana tıklandıysa normal işlemleri yap
-        animal_id = role
+        self.select_animal(role)
+    
+    def on_current_item_changed(self, current, previous):
+        """Klavye ile (ok tuşları) seçilen hayvanın detaylarını göster"""
+        if current is None or current.data(Qt.UserRole + 2) != "CHILD":
+            return
+        self.select_animal(current.data(Qt.UserRole))
+    
+    def select_animal(self, animal_id):
+        """Hayvanı seçili yap ve detaylarını göster"""
+        if animal_id == self.selected_animal_id and self.detail_panel.animal is not None:
+            return
         self.selected_animal_id = animal_id
-        animal = self.db.get_animal_by_id(animal_id)
+        # Detaylar bellekteki satırdan anında çizilir; satır eskiyse arka planda tazelenir
+        # (Bağlantı henüz hazır değilse canlı liste zaten yolda)
+        if (self.session.is_connected() and animal_id in self.animal_cache
+                and self.animal_cache.is_stale(animal_id)):
+            self.refresh_animal_in_background(animal_id)
+        animal = self.get_cached_animal(animal_id)
         if animal:
             self.show_animal_details(animal)
+        else:
+            # Satır arka planda okunuyor; gelince on_animal_refreshed çizer
+            self.show_welcome_message()
+    
+    def refresh_animal_in_background(self, animal_id):
+        """Eskimiş satırı arka planda tazele; seçili hayvansa detayları güncelle"""
+        key = f"refresh:{animal_id}"
+        if self.tasks.is_pending(key):
+            return
+        self.tasks.submit(
+            lambda: self.db.get_animal_by_id(animal_id), key=key
+        ).then(self.on_animal_refreshed)
+    
+    def on_animal_refreshed(self, animal: Animal):
+        """Arka plandaki tazeleme tamamlandığında"""
+        if animal is None:
+            return
+        self.animal_cache.put(animal)
+        if str(animal.id) == str(self.selected_animal_id):
+            self.show_animal_details(animal)
+    
+    def get_cached_animal(self, animal_id):
+        """
+        Bellekteki hayvanı döndür. Yoksa None döner ve satır arka planda okunur
+        (arayüz thread'i ağ/bağlantı beklemez; seçiliyse gelince detayları çizilir).
+        """
+        animal = self.animal_cache.get(animal_id)
+        if animal is None and animal_id is not None:
+            self.refresh_animal_in_background(animal_id)
+        return animal
     
     def show_welcome_message(self):
         """Hoş geldin mesajı"""
-        self.clear_details()
-        
-        welcome_label = QLabel("Lütfen listeden bir hayvan seçin veya yeni hayvan ekleyin")
-        welcome_label.setFont(QFont("Arial", 12))
-        welcome_label.setStyleSheet("color: #7f8c8d;")
-        welcome_label.setAlignment(Qt.AlignCenter)
-        self.detail_layout.addWidget(welcome_label)
-        self.detail_layout.addStretch()
-    
-    def clear_details(self):
-        """Detay alanını temizle"""
-        while self.detail_layout.count():
-            child = self.detail_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.detail_panel.show_welcome()
     
     def show_animal_details(self, animal: Animal):
-        """Hayvan detaylarını göster"""
-        self.clear_details()
-        
-        # AI Health Analysis - Sağlık durumunu analiz et
-        current_temperature = getattr(animal, 'temperature', None)
-        current_weight = float(animal.kilo) if animal.kilo else None
-        health_analysis = HealthAnalyzer.analyze_health(animal, current_temperature, current_weight)
-        
-        # Hayvan adı - daha soft, login paletine uygun kart
-        name_container = QWidget()
-        name_container.setStyleSheet("""
-            QWidget {
-                background-color: #E3F3E8;
-                border-radius: 18px;
-                padding: 20px;
-                border: none;
-            }
-        """)
-
-        # Üst satır: isim + sağlık rozeti
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
-
-        name_label = QLabel(f"🐄 {animal.isim}")
-        name_label.setFont(QFont("Arial", 26, QFont.Bold))
-        name_label.setFrameShape(QFrame.NoFrame)
-        name_label.setStyleSheet("color: #3E2C1C; background: transparent; border: none;")
-        header_layout.addWidget(name_label)
-        header_layout.addStretch()
-
-        # Sağlık durumu badge'i (sağ üstte)
-        health_badge = QLabel()
-        health_badge.setFont(QFont("Arial", 13, QFont.Bold))
-        health_badge.setAlignment(Qt.AlignCenter)
-        # Boyutu Qt'ya bırak, sadece minimum genişlik ver
-        health_badge.setMinimumWidth(110)
-
-        if health_analysis["health_status"] == "CRITICAL":
-            health_badge.setText("KRİTİK")
-            # Çerçeveyi kaldır, sadece yumuşak arka plan kalsın
-            health_badge.setStyleSheet("""
-                QLabel {
-                    background-color: #FCE4E4;
-                    color: #C62828;
-                    border-radius: 18px;
-                    padding: 6px 20px;
-                    border: none;
-                }
-            """)
-        elif health_analysis["health_status"] == "WARNING":
-            health_badge.setText("UYARI")
-            health_badge.setStyleSheet("""
-                QLabel {
-                    background-color: #FFF2DD;
-                    color: #E65100;
-                    border-radius: 18px;
-                    padding: 6px 20px;
-                    border: none;
-                }
-            """)
-        else:
-            health_badge.setText("İYİ")
-            health_badge.setStyleSheet("""
-                QLabel {
-                    background-color: #E3F3E8;
-                    color: #2E7D32;
-                    border-radius: 18px;
-                    padding: 6px 20px;
-                    border: none;
-                }
-            """)
-        header_layout.addWidget(health_badge)
-
-        # Alt satır: tür / cinsiyet / yaş özeti
-        summary_label = QLabel(
-            f"{animal.tur or 'Tür belirtilmemiş'} • "
-            f"{animal.cinsiyet or 'Cinsiyet belirtilmemiş'} • "
-            f"{animal.yas} yaşında"
-        )
-        summary_label.setFrameShape(QFrame.NoFrame)
-        summary_label.setStyleSheet(
-            "color: #5D4B3A; background: transparent; border: none; font-size: 15px;"
-        )
-
-        name_main_layout = QVBoxLayout()
-        name_main_layout.setContentsMargins(15, 10, 15, 5)
-        name_main_layout.setSpacing(6)
-        name_main_layout.addLayout(header_layout)
-        name_main_layout.addWidget(summary_label)
-
-        name_container.setLayout(name_main_layout)
-        self.detail_layout.addWidget(name_container)
-        
-        # Spacing
-        self.detail_layout.addSpacing(10)
-        
-        # AI Uyarıları Göster (CRITICAL ve WARNING) - daha soft kart tasarımı
-        if health_analysis["alerts"]:
-            # Başlık - Daha belirgin
-            alerts_title = QLabel("⚠️ Sağlık Uyarıları")
-            alerts_title.setFont(QFont("Arial", 18, QFont.Bold))
-            alerts_title.setStyleSheet("color: #2c3e50; padding: 10px 0px 5px 0px;")
-            self.detail_layout.addWidget(alerts_title)
-            
-            # Her uyarı için sade kart tasarımı
-            for alert in health_analysis["alerts"]:
-                is_critical = alert["type"] == "CRITICAL"
-
-                bg_color = "#FCE4E4" if is_critical else "#FFF2DD"
-                text_color = "#C62828" if is_critical else "#E65100"
-                border_color = "#F5B7B1" if is_critical else "#F8C471"
-
-                # Ana container (arka plan kalsın, çerçeve çizgisi olmasın)
-                alert_container = QWidget()
-                alert_container.setStyleSheet(f"""
-                    QWidget {{
-                        background-color: {bg_color};
-                        border: none;
-                        border-radius: 8px;
-                        padding: 0px;
-                    }}
-                """)
-                alert_layout = QHBoxLayout()
-                alert_container.setLayout(alert_layout)
-                alert_layout.setContentsMargins(12, 8, 12, 8)
-                alert_layout.setSpacing(12)
-                
-                # İkon (sol tarafta, sade)
-                icon_label = QLabel()
-                icon_label.setStyleSheet("background: transparent;")
-                icon_label.setAlignment(Qt.AlignCenter)
-                icon_label.setFixedWidth(28)
-
-                icon_text = alert.get("icon", "⚠️")
-                # Ateş uyarılarında termometre ikonunu kullan
-                if icon_text in ("🔥", "🌡️"):
-                    pix = QPixmap("assets/termometre.png")
-                    if not pix.isNull():
-                        icon_label.setPixmap(
-                            pix.scaled(22, 22, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        )
-                    else:
-                        icon_label.setText("🌡️")
-                        icon_label.setFont(QFont("Arial", 18))
-                # Kilo kaybı uyarılarında özel ikon kullan
-                elif icon_text in ("⚖️",):
-                    pix = QPixmap("assets/kilo_kayip.png")
-                    if not pix.isNull():
-                        icon_label.setPixmap(
-                            pix.scaled(22, 22, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        )
-                    else:
-                        icon_label.setText("⚖️")
-                        icon_label.setFont(QFont("Arial", 18))
-                else:
-                    icon_label.setText(icon_text)
-                    icon_label.setFont(QFont("Arial", 18))
-
-                alert_layout.addWidget(icon_label)
-                
-                # Mesaj (sağ tarafta, tek satır kalın metin)
-                message_label = QLabel(alert["message"])
-                message_label.setFont(QFont("Arial", 15, QFont.Bold))
-                message_label.setStyleSheet(f"color: {text_color}; background: transparent;")
-                message_label.setWordWrap(True)
-                message_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                alert_layout.addWidget(message_label, 1)
-                
-                alert_container.setMinimumHeight(40)
-                self.detail_layout.addWidget(alert_container)
-                self.detail_layout.addSpacing(6)
-        
-        # Detay bilgileri - Modern kart tasarımı
-        details_title = QLabel("📋 Hayvan Bilgileri")
-        details_title.setFont(QFont("Arial", 18, QFont.Bold))
-        details_title.setStyleSheet("color: #2c3e50; padding: 15px 0px 10px 0px;")
-        self.detail_layout.addWidget(details_title)
-        
-        # Ana bilgi container'ı
-        info_container = QWidget()
-        info_container.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        info_grid = QGridLayout()
-        info_container.setLayout(info_grid)
-        info_grid.setSpacing(15)
-        info_grid.setContentsMargins(15, 15, 15, 15)
-        
-        # Sağlık durumunu renklendir - Analiz sonucuna göre dinamik göster
-        health_status_color = "#3E2C1C"
-        if health_analysis["health_status"] == "CRITICAL":
-            health_status_display = "🔴 KRİTİK"
-            health_status_color = "#C62828"
-        elif health_analysis["health_status"] == "WARNING":
-            health_status_display = "🟡 UYARI"
-            health_status_color = "#E65100"
-        else:
-            health_status_display = "✅ İYİ"
-            health_status_color = "#2E7D32"
-        
-        info_items = [
-            ("🏷️ RFID", animal.rfid_tag or "Belirtilmemiş"),
-            ("⚖️ Kilo", f"{animal.kilo} kg"),
-            ("📏 Boy", f"{animal.boy} cm"),
-            ("💊 Sağlık Durumu", health_status_display),
-        ]
-        
-        # Temperature göster (varsa)
-        if current_temperature is not None:
-            temp_display = f"{current_temperature}°C"
-            if health_analysis["temperature_status"]["status"] == "CRITICAL":
-                temp_display = f"🔴 {temp_display}"
-            elif health_analysis["temperature_status"]["status"] == "WARNING":
-                temp_display = f"🟡 {temp_display}"
-            else:
-                temp_display = f"🌡️ {temp_display}"
-            info_items.append(("🌡️ Vücut Sıcaklığı", temp_display))
-        
-        # Baseline weight göster (varsa)
-        if hasattr(animal, 'baseline_weight') and animal.baseline_weight:
-            info_items.append(("📊 Profil Kilosu", f"{animal.baseline_weight} kg"))
-        
-        for i, (label, value) in enumerate(info_items):
-            # Her bilgi için kart tasarımı
-            item_container = QWidget()
-            item_container.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                    border-radius: 8px;
-                    padding: 12px;
-                    border: 1px solid #e0e0e0;
-                }
-            """)
-            item_layout = QVBoxLayout()
-            item_container.setLayout(item_layout)
-            item_layout.setContentsMargins(10, 8, 10, 8)
-            item_layout.setSpacing(5)
-            
-            # Label
-            label_widget = QLabel(label)
-            label_widget.setFont(QFont("Arial", 12))
-            label_widget.setStyleSheet("color: #7f8c8d; background: transparent;")
-            item_layout.addWidget(label_widget)
-            
-            # Value
-            value_widget = QLabel(value)
-            value_widget.setFont(QFont("Arial", 16, QFont.Bold))
-            # Sağlık durumu için özel renk
-            if "Sağlık Durumu" in label:
-                value_widget.setStyleSheet(f"""
-                    QLabel {{
-                        color: {health_status_color};
-                        background: transparent;
-                        padding: 5px 0px;
-                    }}
-                """)
-            elif "Vücut Sıcaklığı" in label:
-                # Sıcaklık için özel renk
-                if "🔴" in value:
-                    value_widget.setStyleSheet("color: #d32f2f; background: transparent; padding: 5px 0px;")
-                elif "🟡" in value:
-                    value_widget.setStyleSheet("color: #f57c00; background: transparent; padding: 5px 0px;")
-                else:
-                    value_widget.setStyleSheet("color: #2c3e50; background: transparent; padding: 5px 0px;")
-            else:
-                value_widget.setStyleSheet("color: #2c3e50; background: transparent; padding: 5px 0px;")
-            item_layout.addWidget(value_widget)
-            
-            # Grid'e ekle (2 sütunlu)
-            info_grid.addWidget(item_container, i // 2, i % 2)
-        
-        self.detail_layout.addWidget(info_container)
-        
-        # Notlar - Modern kart tasarımı
-        if animal.notlar:
-            self.detail_layout.addSpacing(15)
-            notes_title = QLabel("📝 Notlar")
-            notes_title.setFont(QFont("Arial", 14, QFont.Bold))
-            notes_title.setStyleSheet("color: #2c3e50; padding: 10px 0px 5px 0px;")
-            self.detail_layout.addWidget(notes_title)
-            
-            notes_container = QWidget()
-            notes_container.setStyleSheet("""
-                QWidget {
-                    background-color: #fff9e6;
-                    border-left: 4px solid #f39c12;
-                    border-radius: 10px;
-                    padding: 15px;
-                }
-            """)
-            notes_layout = QVBoxLayout()
-            notes_container.setLayout(notes_layout)
-            notes_layout.setContentsMargins(10, 10, 10, 10)
-            
-            notes_text = QLabel(animal.notlar)
-            notes_text.setFont(QFont("Arial", 11))
-            notes_text.setWordWrap(True)
-            notes_text.setStyleSheet("color: #2c3e50; background: transparent; padding: 5px;")
-            notes_layout.addWidget(notes_text)
-            
-            self.detail_layout.addWidget(notes_container)
-        
-        # Fotoğraf ve sağlık butonları - daha yumuşak tasarım
-        self.detail_layout.addSpacing(20)
-        button_container = QWidget()
-        button_layout = QHBoxLayout()
-        button_container.setLayout(button_layout)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-        
-        photos_btn = QPushButton("📷 Fotoğrafları Görüntüle")
-        photos_btn.setFont(QFont("Arial", 12, QFont.Bold))
-        photos_btn.setCursor(Qt.PointingHandCursor)
-        photos_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFFFFF;
-                color: #3E2C1C;
-                padding: 14px 22px;
-                border: 1px solid #E4DDCF;
-                border-radius: 16px;
-                font-weight: bold;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #FDFBF7;
-            }
-            QPushButton:pressed {
-                background-color: #F3EEE3;
-            }
-        """)
-        photos_btn.clicked.connect(lambda: self.open_photo_dialog(animal))
-        button_layout.addWidget(photos_btn)
-
-        # 7 günlük sağlık grafiği butonu (popup)
-        trend_btn = QPushButton("📈 7 Günlük Sağlık Grafiği")
-        trend_btn.setFont(QFont("Arial", 12, QFont.Bold))
-        trend_btn.setCursor(Qt.PointingHandCursor)
-        trend_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E4F0FB;
-                color: #1F4E79;
-                padding: 14px 22px;
-                border: none;
-                border-radius: 16px;
-                font-weight: bold;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #D4E6F7;
-            }
-            QPushButton:pressed {
-                background-color: #C5DCF3;
-            }
-        """)
-        trend_btn.clicked.connect(lambda: self.open_health_trend_dialog(animal))
-        button_layout.addWidget(trend_btn)
-
-        # Manuel ölçüm ekleme butonu
-        log_btn = QPushButton("➕ Ölçüm Ekle")
-        log_btn.setFont(QFont("Arial", 12, QFont.Bold))
-        log_btn.setCursor(Qt.PointingHandCursor)
-        log_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #D7E8F8;
-                color: #1F4E79;
-                padding: 14px 22px;
-                border: none;
-                border-radius: 16px;
-                font-weight: bold;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #C3DBF2;
-            }
-            QPushButton:pressed {
-                background-color: #AFCFEC;
-            }
-        """)
-        log_btn.clicked.connect(lambda: self.open_health_log_dialog(animal))
-        button_layout.addWidget(log_btn)
-        
-        self.detail_layout.addWidget(button_container)
-        self.detail_layout.addStretch()
+        """Hayvan detaylarını göster (panel widget'ları yeniden kullanılır)"""
+        self.detail_panel.show_animal(animal)
     
     def open_photo_dialog(self, animal: Animal):
         """Seçili hayvan için fotoğraf yöneticisini aç."""
@@ -1025,8 +945,8 @@ class Dashboard(QMainWindow):
     
     def open_health_trend_dialog(self, animal: Animal):
         """
-        Seçili hayvan için 7 günlük kilo + ateş grafiğini göster.
-        Supabase'den sağlık geçmişi verilerini okur; yoksa bilgi mesajı gösterir.
+        Seçili hayvan için kilo + ateş grafiğini göster.
+        Grafik dialog'u bir kez oluşturulur ve sonraki açılışlarda yeniden kullanılır.
         """
         if not animal.id:
             QMessageBox.information(
@@ -1036,14 +956,21 @@ class Dashboard(QMainWindow):
             )
             return
 
-        # Veritabanından son 7 günün sağlık geçmişini oku
+        if self.health_trend_dialog is None:
+            self.health_trend_dialog = HealthTrendDialog(self, self.fetch_health_logs, self.tasks)
+        self.health_trend_dialog.show_for(animal)
+        self.health_trend_dialog.exec_()
+
+    def fetch_health_logs(self, animal_id, days):
+        """Veritabanından son N günün (None: tümü) sağlık geçmişini oku"""
+        if days == CACHE_CONFIG["scan_prefetch_log_days"]:
+            # RFID okumasında önceden okunduysa (arka plan thread'inden sadece okunur)
+            logs = self.get_prefetched_logs(animal_id)
+            if logs is not None:
+                return logs
         if hasattr(self.db, "get_health_logs"):
-            history_data = self.db.get_health_logs(animal.id, days=7)
-        else:
-            history_data = []
-
-        dialog = HealthTrendDialog(self, animal, history_data)
-        dialog.exec_()
+            return self.db.get_health_logs(animal_id, days=days)
+        return []
 
     def open_health_log_dialog(self, animal: Animal):
         """Seçili hayvan için manuel kilo + ateş ölçümü ekle."""
@@ -1058,50 +985,73 @@ class Dashboard(QMainWindow):
         dialog = HealthLogDialog(self, animal)
         if dialog.exec_() == QDialog.Accepted and dialog.result:
             data = dialog.result
-            try:
-                # Yeni ölçümü sağlık geçmişine kaydet
-                self.db.add_health_log(
-                    animal.id,
-                    data.get("weight"),
-                    data.get("temperature"),
-                    data.get("measured_at"),
-                )
-                # Hayvanın anlık kilo / ateş ve sağlık durumunu da güncelle
-                weight = data.get("weight")
-                temperature = data.get("temperature")
-
-                if weight is not None:
-                    animal.kilo = weight
-                if temperature is not None:
-                    animal.temperature = temperature
-
-                # Rule-based AI ile sağlık durumunu yeniden hesapla
-                updated_animal = HealthAnalyzer.update_animal_health_status(
-                    animal,
-                    temperature,
-                    weight if weight is not None else (float(animal.kilo) if animal.kilo else None),
-                )
-
-                # Veritabanındaki hayvan kaydını da güncelle
-                try:
-                    self.db.update_animal(animal.id, updated_animal)
-                except Exception:
-                    # DB güncellemesi başarısız olsa bile UI'ı güncellemeye devam et
-                    pass
-
-                # Liste ve detay panelini tazele (son ölçüm ve durumlar hemen görünsün)
-                self.on_search()
-                # Seçili hayvanı yeniden DB'den çekmeye çalış; olmazsa elimizdeki updated_animal'ı kullan
-                refreshed = None
-                try:
-                    refreshed = self.db.get_animal_by_id(animal.id)
-                except Exception:
-                    refreshed = None
-                self.show_animal_details(refreshed or updated_animal)
-
-                QMessageBox.information(self, "Başarılı", "Yeni ölçüm başarıyla kaydedildi ve detaylar güncellendi.")
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Ölçüm kaydedilirken bir hata oluştu:\n{e}")
+            weight = data.get("weight")
+            temperature = data.get("temperature")
+
+            # Hayvanın anlık kilo / ateş ve sağlık durumunu güncel bir kopyada hesapla
+            # (kayıt başarısız olursa bellekteki satır değişmemiş olur)
+            updated_animal = Animal(animal.to_dict())
+            if weight is not None:
+                updated_animal.kilo = weight
+            if temperature is not None:
+                updated_animal.temperature = temperature
+
+            # Rule-based AI ile sağlık durumunu yeniden hesapla
+            updated_animal = HealthAnalyzer.update_animal_health_status(
+                updated_animal,
+                temperature,
+                weight if weight is not None else (float(updated_animal.kilo) if updated_animal.kilo else None),
+            )
+
+            self.begin_task("💾 Ölçüm kaydediliyor...")
+            self.tasks.submit(self._save_health_log, animal.id, data, updated_animal).then(
+                lambda anomalies: self.on_health_log_saved(updated_animal, anomalies),
+                self.on_health_log_failed,
+            )
+
+    def _save_health_log(self, animal_id, data, updated_animal: Animal):
+        """(Arka planda) ölçümü sağlık geçmişine ve hayvan kaydına yaz; olağandışı bulguları döndür"""
+        anomalies = self.record_health_log(
+            animal_id,
+            data.get("weight"),
+            data.get("temperature"),
+            data.get("measured_at"),
+        )
+        # Veritabanındaki hayvan kaydını da güncelle
+        try:
+            self.db.update_animal(animal_id, updated_animal)
+        except Exception:
+            # DB güncellemesi başarısız olsa bile UI'ı güncellemeye devam et
+            pass
+        return anomalies
+
+    def record_health_log(self, animal_id, weight, temperature, measured_at=None):
+        """
+        (Arka planda) ölçümü sağlık geçmişine yaz ve hayvanın anomali durumunu güncelle.
+        Kaydedilen ölçüm hayvanın kendi geçmişine göre olağandışıysa uyarıları döndürür.
+        """
+        if not self.db.add_health_log(animal_id, weight, temperature, measured_at):
+            return []
+        return self.anomaly_detector.observe(animal_id, weight, temperature, measured_at)
+
+    def on_health_log_saved(self, updated_animal: Animal, anomalies=None):
+        self.end_task()
+        # Liste ve detay panelini tazele (son ölçüm ve durumlar hemen görünsün)
+        # Güncel satır zaten elimizde; yeniden veritabanından çekmeye gerek yok
+        self.animal_cache.put(updated_animal)
+        self.sync_animal_statuses([updated_animal])
+        self.invalidate_prefetched_logs([updated_animal.id])
+        self.on_search()
+        if str(updated_animal.id) == str(self.selected_animal_id):
+            self.show_animal_details(updated_animal)
+        message = "Yeni ölçüm başarıyla kaydedildi ve detaylar güncellendi."
+        if anomalies:
+            message += "\n\n" + "\n".join(alert["message"] for alert in anomalies)
+        QMessageBox.information(self, "Başarılı", message)
+
+    def on_health_log_failed(self, error_msg):
+        self.end_task()
+        QMessageBox.critical(self, "Hata", f"Ölçüm kaydedilirken bir hata oluştu:\n{error_msg}")
     
     def add_animal(self):
         """Yeni hayvan ekle"""
@@ -1118,20 +1068,36 @@ class Dashboard(QMainWindow):
             if not animal.baseline_weight and animal.kilo:
                 animal.baseline_weight = float(animal.kilo)
             
-            if self.db.add_animal(animal):
-                # İlk kayıt için sağlık geçmişine de bir ölçüm ekle
-                try:
-                    self.db.add_health_log(
-                        animal.id,
-                        float(animal.kilo) if animal.kilo else None,
-                        getattr(animal, "temperature", None),
-                    )
-                except Exception:
-                    pass
-                QMessageBox.information(self, "Başarılı", "Hayvan başarıyla eklendi!")
-                self.on_search()
-            else:
-                QMessageBox.critical(self, "Hata", "Hayvan eklenirken bir hata oluştu!")
+            self.begin_task("💾 Hayvan kaydediliyor...")
+            self.tasks.submit(self._save_new_animal, animal).then(
+                lambda ok: self.on_animal_added(animal, ok),
+                lambda msg: self.on_animal_added(animal, False),
+            )
+
+    def _save_new_animal(self, animal: Animal) -> bool:
+        """(Arka planda) hayvanı ve ilk ölçümünü kaydet"""
+        if not self.db.add_animal(animal):
+            return False
+        # İlk kayıt için sağlık geçmişine de bir ölçüm ekle
+        try:
+            self.record_health_log(
+                animal.id,
+                float(animal.kilo) if animal.kilo else None,
+                getattr(animal, "temperature", None),
+            )
+        except Exception:
+            pass
+        return True
+
+    def on_animal_added(self, animal: Animal, success: bool):
+        self.end_task()
+        if success:
+            self.animal_cache.put(animal)
+            self.sync_animal_statuses([animal])
+            QMessageBox.information(self, "Başarılı", "Hayvan başarıyla eklendi!")
+            self.on_search()
+        else:
+            QMessageBox.critical(self, "Hata", "Hayvan eklenirken bir hata oluştu!")
     
     def edit_animal(self):
         """Hayvan düzenle"""
@@ -1139,9 +1105,9 @@ class Dashboard(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Lütfen düzenlemek için bir hayvan seçin!")
             return
         
-        animal = self.db.get_animal_by_id(self.selected_animal_id)
+        animal = self.get_cached_animal(self.selected_animal_id)
         if not animal:
-            QMessageBox.critical(self, "Hata", "Hayvan bulunamadı!")
+            QMessageBox.information(self, "Bilgi", "Hayvan bilgileri yükleniyor, lütfen tekrar deneyin.")
             return
         
         dialog = AnimalDialog(self, "Hayvan Düzenle", animal.to_dict())
@@ -1160,23 +1126,40 @@ class Dashboard(QMainWindow):
             current_weight = float(updated_animal.kilo) if updated_animal.kilo else None
             updated_animal = HealthAnalyzer.update_animal_health_status(updated_animal, temperature, current_weight)
             
-            if self.db.update_animal(self.selected_animal_id, updated_animal):
-                # Güncellenen ölçümleri sağlık geçmişine ekle
-                try:
-                    self.db.add_health_log(
-                        self.selected_animal_id,
-                        float(updated_animal.kilo) if updated_animal.kilo else None,
-                        getattr(updated_animal, "temperature", None),
-                    )
-                except Exception:
-                    pass
-                QMessageBox.information(self, "Başarılı", "Hayvan başarıyla güncellendi!")
-                self.on_search()
-                updated_animal = self.db.get_animal_by_id(self.selected_animal_id)
-                if updated_animal:
-                    self.show_animal_details(updated_animal)
-            else:
-                QMessageBox.critical(self, "Hata", "Hayvan güncellenirken bir hata oluştu!")
+            updated_animal.id = animal.id
+            self.begin_task("💾 Değişiklikler kaydediliyor...")
+            self.tasks.submit(self._save_animal_update, animal.id, updated_animal).then(
+                lambda ok: self.on_animal_updated(updated_animal, ok),
+                lambda msg: self.on_animal_updated(updated_animal, False),
+            )
+
+    def _save_animal_update(self, animal_id, updated_animal: Animal) -> bool:
+        """(Arka planda) hayvan kaydını güncelle ve ölçümleri geçmişe ekle"""
+        if not self.db.update_animal(animal_id, updated_animal):
+            return False
+        # Güncellenen ölçümleri sağlık geçmişine ekle
+        try:
+            self.record_health_log(
+                animal_id,
+                float(updated_animal.kilo) if updated_animal.kilo else None,
+                getattr(updated_animal, "temperature", None),
+            )
+        except Exception:
+            pass
+        return True
+
+    def on_animal_updated(self, updated_animal: Animal, success: bool):
+        self.end_task()
+        if success:
+            QMessageBox.information(self, "Başarılı", "Hayvan başarıyla güncellendi!")
+            # Kaydedilen satır bellekte güncellenir, tekrar çekilmez
+            self.animal_cache.put(updated_animal)
+            self.sync_animal_statuses([updated_animal])
+            self.on_search()
+            if str(updated_animal.id) == str(self.selected_animal_id):
+                self.show_animal_details(updated_animal)
+        else:
+            QMessageBox.critical(self, "Hata", "Hayvan güncellenirken bir hata oluştu!")
     
     def delete_animal(self):
         """Hayvan sil"""
@@ -1184,9 +1167,9 @@ class Dashboard(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Lütfen silmek için bir hayvan seçin!")
             return
         
-        animal = self.db.get_animal_by_id(self.selected_animal_id)
+        animal = self.get_cached_animal(self.selected_animal_id)
         if not animal:
-            QMessageBox.critical(self, "Hata", "Hayvan bulunamadı!")
+            QMessageBox.information(self, "Bilgi", "Hayvan bilgileri yükleniyor, lütfen tekrar deneyin.")
             return
         
         reply = QMessageBox.question(
@@ -1196,13 +1179,105 @@ class Dashboard(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            if self.db.delete_animal(self.selected_animal_id):
-                QMessageBox.information(self, "Başarılı", "Hayvan başarıyla silindi!")
+            animal_id = self.selected_animal_id
+            self.begin_task("🗑️ Hayvan siliniyor...")
+            self.tasks.submit(lambda: self.db.delete_animal(animal_id)).then(
+                lambda ok: self.on_animal_deleted(animal_id, ok),
+                lambda msg: self.on_animal_deleted(animal_id, False),
+            )
+
+    def scan_outbreaks(self):
+        """Aynı gün birden fazla hayvanda görülen ateşi (salgın şüphesi) arka planda tara"""
+        if self.tasks.is_pending("outbreak_scan"):
+            return
+        self.begin_task("🦠 Salgın taraması yapılıyor...")
+        self.tasks.submit(self._detect_outbreaks, key="outbreak_scan").then(
+            self.on_outbreaks_detected, self.on_outbreak_scan_failed
+        )
+
+    def _detect_outbreaks(self):
+        # Arka plan thread'inde: sürü + bir yıllık ateş ölçümleri
+        db = self.db
+        animals = db.get_all_animals()
+        logs = db.get_herd_health_logs(OUTBREAK_CONFIG["lookback_days"])
+        return OutbreakDetector().detect(animals, logs)
+
+    def on_outbreaks_detected(self, alerts):
+        self.end_task()
+        if not alerts:
+            QMessageBox.information(self, "Salgın Taraması", "✅ Son bir yılda salgın şüphesi bulunamadı.")
+            return
+        lines = [f"{alert['icon']} {alert['message']}" for alert in alerts[:15]]
+        if len(alerts) > 15:
+            lines.append(f"... ve {len(alerts) - 15} uyarı daha")
+        QMessageBox.warning(self, "Salgın Şüphesi", "\n".join(lines))
+
+    def on_outbreak_scan_failed(self, message):
+        self.end_task()
+        QMessageBox.critical(self, "Hata", f"Salgın taraması yapılamadı: {message}")
+
+    def open_station_dialog(self):
+        """Tartım istasyonu: tartı/termometre okumaları son okunan karta elle giriş olmadan yazılır"""
+        if not STATION_CONFIG["scale"] and not STATION_CONFIG["thermometer"]:
+            QMessageBox.information(
+                self,
+                "Tartım İstasyonu",
+                "Tartı veya termometre tanımlı değil.\n(config.py → STATION_CONFIG)",
+            )
+            return
+        dialog = StationDialog(self)
+        dialog.exec_()
+
+    def open_roll_call_dialog(self):
+        """Sürü yoklaması: okunan kartlar sürüyle karşılaştırılır, eksikler raporlanır"""
+        # Beklenen kartlar canlı listeyle eşitlenmiş güncel sürüden (diskteki kopyadan değil):
+        # yanlış eksikler bir sonraki yoklamanın farkına da taşınır
+        herd = self.session.herd
+        if not herd:
+            QMessageBox.information(
+                self, "Sürü Yoklaması", "Sürü listesi henüz yüklenmedi, lütfen biraz sonra tekrar deneyin."
+            )
+            self.session.warm_up()
+            return
+        dialog = RollCallDialog(self, herd)
+        dialog.exec_()
+
+    def save_station_batch(self, measurements):
+        """(Arka planda) istasyon ölçümlerini toplu yaz; olağandışı bulguları döndür"""
+        entries = [
+            {key: measurement[key] for key in ("animal_id", "weight", "temperature", "measured_at")}
+            for measurement in measurements
+        ]
+        if not self.db.add_health_logs(entries):
+            # Parti bütünüyle tekrar denenir
+            raise RuntimeError("Ölçümler kaydedilemedi")
+        # Aynı hayvan partide birden çok kez varsa son hali yazılır
+        latest = {str(measurement["animal_id"]): measurement["animal"] for measurement in measurements}
+        # Ölçümler kaydedildi; hayvan satırı yazılamazsa bir sonraki ölçümde düzelir
+        # (kayıtlı durum eşitlemesi on_batch_saved'de, arayüz thread'inden başlatılır)
+        self.db.update_animals(list(latest.values()))
+        anomalies = []
+        for measurement in measurements:
+            anomalies += self.anomaly_detector.observe(
+                measurement["animal_id"], measurement["weight"], measurement["temperature"],
+                measurement["measured_at"],
+            )
+        return anomalies
+
+    def on_animal_deleted(self, animal_id, success: bool):
+        self.end_task()
+        if success:
+            QMessageBox.information(self, "Başarılı", "Hayvan başarıyla silindi!")
+            self.animal_cache.remove(animal_id)
+            self.anomaly_detector.forget(animal_id)
+            self.status_sync.forget(animal_id)
+            self.invalidate_prefetched_logs([animal_id])
+            if str(animal_id) == str(self.selected_animal_id):
                 self.selected_animal_id = None
-                self.on_search()
                 self.show_welcome_message()
-            else:
-                QMessageBox.critical(self, "Hata", "Hayvan silinirken bir hata oluştu!")
+            self.on_search()
+        else:
+            QMessageBox.critical(self, "Hata", "Hayvan silinirken bir hata oluştu!")
 
     def logout(self):
         """Oturumu kapat ve pencereyi kapat."""
@@ -1215,14 +1290,17 @@ class Dashboard(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            # RFID thread'i durdur
-            if hasattr(self, "rfid_reader_thread") and self.rfid_reader_thread:
-                if self.rfid_reader_thread.isRunning():
-                    self.rfid_reader_thread.stop()
-                    self.rfid_reader_thread.wait()
+            # RFID aboneliğini bırak (port açık kalır, tekrar girişte beklenmez)
+            if self.rfid_scanning:
+                self.stop_rfid_search()
+            self.rfid_service.connection_changed.disconnect(self.on_rfid_connection_changed)
             
-            if hasattr(self, "db") and self.db:
-                self.db.disconnect()
+            # Bağlantı ve önbellek oturumda kalır; tekrar girişte yeniden kullanılır
+            self.session.herd_ready.disconnect(self.on_herd_ready)
+            self.session.herd_failed.disconnect(self.on_herd_failed)
+            # Anomali durumunu diske yaz (sonraki açılışta geçmiş yeniden işlenmez)
+            self.tasks.submit(self.anomaly_detector.save_if_dirty)
+            self.tasks.submit(self.status_sync.save_if_dirty)
             self.close()
             if callable(self.on_logout):
                 self.on_logout()
@@ -1230,6 +1308,133 @@ class Dashboard(QMainWindow):
 
 
 
+class PhotoPageWorker(QThread):
+    """Fotoğraf listesini sayfa sayfa (limit/offset) arka planda okur."""
+    page_loaded = pyqtSignal(list)
+    load_failed = pyqtSignal(str)
+    # Durdurulmuş ama henüz bitmemiş thread'ler (finished gelince çıkarılır)
+    retired = set()
+
+    def __init__(self, db, animal_id: str, page_size: int):
+        super().__init__()
+        self.db = db
+        self.animal_id = animal_id
+        self.page_size = page_size
+        self.is_running = True
+
+    def run(self):
+        offset = 0
+        while self.is_running:
+            try:
+                page = self.db.list_photos(self.animal_id, limit=self.page_size, offset=offset)
+            except Exception as e:
+                self.load_failed.emit(str(e))
+                return
+            if not self.is_running:
+                return
+            self.page_loaded.emit(page)
+            if len(page) < self.page_size:
+                return
+            offset += self.page_size
+
+    def stop(self):
+        self.is_running = False
+
+
+class PhotoListModel(QAbstractListModel):
+    """
+    Seçili tarihin fotoğrafları için liste modeli.
+    Görünüm sadece ekrandaki satırların ikonunu ister; küçük resimler de yalnızca
+    o an istenen satırlar için hazırlanır. Satır başına widget oluşturulmaz.
+    """
+
+    def __init__(self, loader, thumbnail_width: int, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.thumbnail_width = thumbnail_width
+        self._photos = []
+        self._row_by_url = {}
+        self._failed = set()
+        self.placeholder = QPixmap(thumbnail_width, thumbnail_width * 3 // 4)
+        self.placeholder.fill(QColor("#f0f0f0"))
+        self.loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.loader.photo_failed.connect(self._on_photo_failed)
+
+    def set_photos(self, photos):
+        self.beginResetModel()
+        self._photos = list(photos)
+        self._row_by_url = {p.get('url'): i for i, p in enumerate(self._photos)}
+        self.endResetModel()
+
+    def append_photos(self, photos):
+        if not photos:
+            return
+        first = len(self._photos)
+        self.beginInsertRows(QModelIndex(), first, first + len(photos) - 1)
+        for i, photo in enumerate(photos, first):
+            self._photos.append(photo)
+            self._row_by_url[photo.get('url')] = i
+        self.endInsertRows()
+
+    def photo_at(self, row: int):
+        if 0 <= row < len(self._photos):
+            return self._photos[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._photos)
+
+    def data(self, index, role=Qt.DisplayRole):
+        photo = self.photo_at(index.row())
+        if photo is None:
+            return None
+        url = photo.get('url', '')
+        if role == Qt.DisplayRole:
+            return photo.get('name', 'Bilinmeyen')
+        if role == Qt.DecorationRole:
+            pixmap = self.loader.cached_pixmap(url, self.thumbnail_width)
+            if pixmap is None:
+                self.prefetch(index.row())
+                return self.placeholder
+            return pixmap
+        if role == Qt.ToolTipRole:
+            if url in self._failed:
+                return f"Fotoğraf indirilemedi: {photo.get('name', '')}"
+            return "Tam boyutta görmek için çift tıklayın"
+        if role == Qt.UserRole:
+            return photo
+        return None
+
+    def prefetch(self, row: int):
+        """Satırın küçük resmi bellekte yoksa hazırlanmasını iste."""
+        photo = self.photo_at(row)
+        if photo is None:
+            return
+        url = photo.get('url', '')
+        if url and url not in self._failed and \
+                self.loader.cached_pixmap(url, self.thumbnail_width) is None:
+            self.loader.request_thumbnail(url, self.thumbnail_width)
+
+    def _on_thumbnail_ready(self, url: str, size: int, image):
+        row = self._row_by_url.get(url)
+        if row is None or size != self.thumbnail_width:
+            return
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def _on_photo_failed(self, url: str, error_msg: str):
+        if url in self._row_by_url:
+            self._failed.add(url)
+
+    def release(self):
+        """Paylaşımlı yükleyiciden ayrıl"""
+        try:
+            self.loader.thumbnail_ready.disconnect(self._on_thumbnail_ready)
+            self.loader.photo_failed.disconnect(self._on_photo_failed)
+        except TypeError:
+            pass
+
+
 class PhotoDialog(QDialog):
     def __init__(self, parent, animal):
         super().__init__(parent)
@@ -1241,6 +1446,17 @@ class PhotoDialog(QDialog):
         
         # Fotoğraflar artık sadece Supabase'de tutulacak
         self.photos_by_date = {}
+        self.current_date = None
+        # Kullanıcı bir tarih seçene kadar en son tarih otomatik gösterilir
+        self._auto_select_latest = True
+        self._pending_date = None
+        self._page_worker = None
+        # Yükleme / silme işlemleri arka planda yapılır
+        self.tasks = get_task_runner()
+        # Fotoğraf hattı (requests, disk önbelleği) ilk kullanımda yüklenir
+        from photo_loader import get_photo_loader
+        self.loader = get_photo_loader()
+        self.model = PhotoListModel(self.loader, PHOTO_CONFIG["list_thumbnail_width"], self)
         self._init_ui()
         self.load_photos()
 
@@ -1293,19 +1509,53 @@ class PhotoDialog(QDialog):
         control_layout.addWidget(QLabel("Tarih:"))
         control_layout.addWidget(self.date_input)
 
-        add_btn = QPushButton("Fotoğraf Ekle")
-        add_btn.clicked.connect(self.add_photo)
-        control_layout.addWidget(add_btn)
+        self.add_btn = QPushButton("Fotoğraf Ekle")
+        self.add_btn.clicked.connect(self.add_photo)
+        control_layout.addWidget(self.add_btn)
         right_layout.addLayout(control_layout)
 
-        self.photos_scroll = QScrollArea()
-        self.photos_scroll.setWidgetResizable(True)
-        self.photo_container = QWidget()
-        self.photo_layout = QVBoxLayout()
-        self.photo_layout.setAlignment(Qt.AlignTop)
-        self.photo_container.setLayout(self.photo_layout)
-        self.photos_scroll.setWidget(self.photo_container)
-        right_layout.addWidget(self.photos_scroll, 1)
+        self.empty_label = QLabel("Bu tarihte fotoğraf yok.")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        right_layout.addWidget(self.empty_label)
+
+        # Sadece görünür satırları çizen görünüm; küçük resimler kaydırdıkça hazırlanır
+        thumb_width = PHOTO_CONFIG["list_thumbnail_width"]
+        self.photo_view = QListView()
+        self.photo_view.setModel(self.model)
+        self.photo_view.setViewMode(QListView.IconMode)
+        self.photo_view.setMovement(QListView.Static)
+        self.photo_view.setResizeMode(QListView.Adjust)
+        self.photo_view.setUniformItemSizes(True)
+        self.photo_view.setLayoutMode(QListView.Batched)
+        self.photo_view.setBatchSize(50)
+        self.photo_view.setIconSize(QSize(thumb_width, thumb_width * 3 // 4))
+        self.photo_view.setSpacing(8)
+        self.photo_view.setStyleSheet("QListView { background-color: #fafafa; border: 2px solid #ddd; }")
+        self.photo_view.doubleClicked.connect(
+            lambda index: self.open_full_photo(self.model.photo_at(index.row()))
+        )
+        self.photo_view.verticalScrollBar().valueChanged.connect(self._prefetch_near_viewport)
+        right_layout.addWidget(self.photo_view, 1)
+
+        self.delete_btn = QPushButton("🗑️ Seçili Fotoğrafı Sil")
+        self.delete_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FFE0E0;
+                color: #B03A2E;
+                padding: 6px;
+                border: none;
+                border-radius: 12px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #FFC4C4;
+            }
+            QPushButton:pressed {
+                background-color: #FFAAAA;
+            }
+        """)
+        self.delete_btn.clicked.connect(self.delete_selected_photo)
+        right_layout.addWidget(self.delete_btn)
 
         main_layout.addLayout(right_layout, 2)
 
@@ -1330,51 +1580,115 @@ class PhotoDialog(QDialog):
             date_prefix = selected_date
             new_filename = f"{date_prefix}_{source_path.name}"
             
-            try:
-                # Sadece Supabase'e yükle (yerel dosyaya kaydetme)
-                photo_url = self.db.upload_photo(
-                    animal_id=str(self.animal.id),
-                    local_file_path=source_path,
-                    filename=new_filename
-                )
-                
-                if photo_url:
-                    QMessageBox.information(self, "Başarılı", f"Fotoğraf Supabase'e yüklendi!")
-                    # Fotoğrafları yeniden yükle
-                    self.load_photos()
-                    # Eklenen tarihi seç
-                    self._select_date(selected_date)
-                else:
-                    QMessageBox.critical(self, "Hata", "Fotoğraf Supabase'e yüklenemedi!")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Fotoğraf eklenirken hata oluştu: {str(e)}")
+            self.add_btn.setEnabled(False)
+            self.add_btn.setText("Yükleniyor...")
+            self.tasks.submit(self._upload_photo, source_path, new_filename).then(
+                lambda result: self.on_photo_uploaded(result, selected_date),
+                self.on_photo_upload_failed,
+            )
+
+    def _upload_photo(self, source_path: Path, filename: str):
+        """(Arka planda) dosyayı Supabase'e yükle; (url, dosya içeriği) döndür"""
+        photo_url = self.db.upload_photo(
+            animal_id=str(self.animal.id),
+            local_file_path=source_path,
+            filename=filename
+        )
+        if not photo_url:
+            return None
+        try:
+            data = source_path.read_bytes()
+        except OSError:
+            data = None
+        return photo_url, data
+
+    def _reset_add_button(self):
+        self.add_btn.setEnabled(True)
+        self.add_btn.setText("Fotoğraf Ekle")
+
+    def on_photo_uploaded(self, result, selected_date: str):
+        self._reset_add_button()
+        if not result:
+            QMessageBox.critical(self, "Hata", "Fotoğraf Supabase'e yüklenemedi!")
+            return
+        photo_url, data = result
+        # Yüklenen dosyayı önbelleğe al ve küçük resimlerini şimdi üret;
+        # ilk görüntülemede tekrar indirilip çözülmesin
+        if data is not None:
+            self.loader.add_uploaded(photo_url, data)
+        QMessageBox.information(self, "Başarılı", f"Fotoğraf Supabase'e yüklendi!")
+        # Fotoğrafları yeniden yükle; eklenen tarih gelince o seçilsin
+        self.load_photos()
+        self._auto_select_latest = False
+        self._pending_date = selected_date
+
+    def on_photo_upload_failed(self, error_msg):
+        self._reset_add_button()
+        QMessageBox.critical(self, "Hata", f"Fotoğraf eklenirken hata oluştu: {error_msg}")
 
     def load_photos(self):
-        """Supabase'den fotoğrafları yükle ve tarihe göre grupla."""
+        """Fotoğraf listesini sayfa sayfa arka planda yükle ve tarihe göre grupla."""
+        self._stop_page_worker()
         self.photos_by_date = {}
+        self.date_list.clear()
+        self.show_photos_for(None)
         
         if not self.db or not self.animal.id:
-            self._populate_dates()
             return
         
-        try:
-            # Supabase'den fotoğraf listesini al
-            photos = self.db.list_photos(str(self.animal.id))
-            
-            # Fotoğrafları tarihe göre grupla
-            for photo in photos:
-                date_iso = photo.get('date') or self._extract_date(photo.get('name', ''))
-                if date_iso not in self.photos_by_date:
-                    self.photos_by_date[date_iso] = []
-                self.photos_by_date[date_iso].append(photo)
-            
-            # Tarihleri doldur
-            self._populate_dates()
-        except Exception as e:
-            print(f"Fotoğraf yükleme hatası: {e}")
-            QMessageBox.warning(self, "Uyarı", f"Fotoğraflar yüklenirken hata oluştu: {str(e)}")
-            self._populate_dates()
+        self._page_worker = PhotoPageWorker(self.db, str(self.animal.id), PHOTO_CONFIG["page_size"])
+        self._page_worker.page_loaded.connect(self.on_photo_page)
+        self._page_worker.load_failed.connect(self.on_photo_list_failed)
+        self._page_worker.start()
+    
+    def _stop_page_worker(self):
+        if self._page_worker is not None:
+            self._page_worker.stop()
+            try:
+                self._page_worker.page_loaded.disconnect(self.on_photo_page)
+                self._page_worker.load_failed.disconnect(self.on_photo_list_failed)
+            except TypeError:
+                pass
+            # list_photos içindeki thread bitene kadar referans tutulur; çalışan bir
+            # QThread'in çöpe gitmesi Qt'nin süreci sonlandırmasına yol açar
+            worker = self._page_worker
+            PhotoPageWorker.retired.add(worker)
+            worker.finished.connect(lambda: PhotoPageWorker.retired.discard(worker))
+            if not worker.isRunning():
+                PhotoPageWorker.retired.discard(worker)
+            self._page_worker = None
+    
+    def on_photo_page(self, photos):
+        """Gelen sayfadaki fotoğrafları tarihlerine ekle (tarih listesi kademeli büyür)"""
+        new_for_current = []
+        for photo in photos:
+            date_iso = photo.get('date') or self._extract_date(photo.get('name', ''))
+            if date_iso not in self.photos_by_date:
+                self.photos_by_date[date_iso] = []
+                self._insert_date_item(date_iso)
+            self.photos_by_date[date_iso].append(photo)
+            if date_iso == self.current_date:
+                new_for_current.append(photo)
+        
+        if new_for_current:
+            self.model.append_photos(new_for_current)
+        
+        # Yeni yüklenen fotoğrafın tarihi geldiyse onu seç
+        if self._pending_date and self._pending_date in self.photos_by_date:
+            self._select_date(self._pending_date)
+            self._pending_date = None
+        
+        # Kullanıcı seçim yapmadıysa en son tarihi göster
+        if self._auto_select_latest and self.date_list.count() > 0:
+            last_row = self.date_list.count() - 1
+            latest = self.date_list.item(last_row).data(Qt.UserRole)
+            if latest != self.current_date:
+                self.date_list.setCurrentRow(last_row)
+                self.show_photos_for(latest)
+    
+    def on_photo_list_failed(self, error_msg: str):
+        print(f"Fotoğraf yükleme hatası: {error_msg}")
+        QMessageBox.warning(self, "Uyarı", f"Fotoğraflar yüklenirken hata oluştu: {error_msg}")
     
     def _extract_date(self, filename: str) -> str:
         """Dosya adından ISO tarih çıkar (yyyy-MM-dd), yoksa bugünün tarihi."""
@@ -1384,95 +1698,54 @@ class PhotoDialog(QDialog):
                 return prefix
         return QDate.currentDate().toString("yyyy-MM-dd")
     
-    def _populate_dates(self):
-        self.date_list.clear()
-        for date_iso in sorted(self.photos_by_date.keys()):
-            item = QListWidgetItem(QDate.fromString(date_iso, "yyyy-MM-dd").toString("dd.MM.yyyy"))
-            item.setData(Qt.UserRole, date_iso)
-            self.date_list.addItem(item)
-        
-        if self.date_list.count() > 0:
-            self.date_list.setCurrentRow(self.date_list.count() - 1)
-            self.show_photos_for(self.date_list.currentItem().data(Qt.UserRole))
-        else:
-            self.show_photos_for(None)
+    def _insert_date_item(self, date_iso: str):
+        """Tarihi listeye sıralı konumunda ekle"""
+        item = QListWidgetItem(QDate.fromString(date_iso, "yyyy-MM-dd").toString("dd.MM.yyyy"))
+        item.setData(Qt.UserRole, date_iso)
+        row = self.date_list.count()
+        while row > 0 and self.date_list.item(row - 1).data(Qt.UserRole) > date_iso:
+            row -= 1
+        self.date_list.insertItem(row, item)
     
     def on_date_selected(self, item: QListWidgetItem):
+        self._auto_select_latest = False
         date_iso = item.data(Qt.UserRole)
         self.show_photos_for(date_iso)
     
     def show_photos_for(self, date_iso: str):
-        """Seçili tarihe ait fotoğrafları ekrana bas (Supabase URL'lerinden)."""
-        while self.photo_layout.count():
-            child = self.photo_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        if not date_iso or date_iso not in self.photos_by_date:
-            empty_label = QLabel("Bu tarihte fotoğraf yok.")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.photo_layout.addWidget(empty_label)
+        """Seçili tarihe ait fotoğrafları modele bağla; görünüm sadece görünen satırları çizer."""
+        self.current_date = date_iso
+        photos = self.photos_by_date.get(date_iso, []) if date_iso else []
+        self.model.set_photos(photos)
+        self.empty_label.setVisible(not photos)
+        self.photo_view.setVisible(bool(photos))
+        if photos:
+            self.photo_view.scrollToTop()
+            QTimer.singleShot(0, self._prefetch_near_viewport)
+    
+    def _prefetch_near_viewport(self, *args):
+        """Görünür alanın hemen altındaki birkaç küçük resmi önceden hazırla"""
+        viewport = self.photo_view.viewport()
+        bottom = self.photo_view.indexAt(QPoint(viewport.width() // 2, viewport.height() - 1))
+        last_row = bottom.row() if bottom.isValid() else -1
+        if last_row < 0:
             return
-        
-        for photo_info in self.photos_by_date[date_iso]:
-            # Her fotoğraf için bir container widget oluştur
-            photo_widget = QWidget()
-            photo_container_layout = QVBoxLayout()
-            photo_widget.setLayout(photo_container_layout)
-            photo_container_layout.setContentsMargins(8, 8, 8, 8)
-            photo_container_layout.setSpacing(5)
-            
-            # Fotoğraf (URL'den yükle)
-            img_label = QLabel()
-            photo_url = photo_info.get('url', '')
-            photo_name = photo_info.get('name', 'Bilinmeyen')
-            
-            if photo_url:
-                try:
-                    # URL'den fotoğrafı indir
-                    response = requests.get(photo_url, timeout=10)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(response.content)
-                        if not pixmap.isNull():
-                            img_label.setPixmap(pixmap.scaledToWidth(350, Qt.SmoothTransformation))
-                        else:
-                            img_label.setText(f"Görüntü yüklenemedi: {photo_name}")
-                    else:
-                        img_label.setText(f"Fotoğraf indirilemedi: {photo_name}")
-                except Exception as e:
-                    img_label.setText(f"Hata: {photo_name}\n{str(e)}")
-            else:
-                img_label.setText(f"URL bulunamadı: {photo_name}")
-            
-            img_label.setStyleSheet("padding: 4px; background-color: #f0f0f0; border-radius: 4px;")
-            img_label.setAlignment(Qt.AlignCenter)
-            photo_container_layout.addWidget(img_label)
-            
-            # Silme butonu
-            delete_btn = QPushButton("🗑️ Sil")
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFE0E0;
-                    color: #B03A2E;
-                    padding: 6px;
-                    border: none;
-                    border-radius: 12px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #FFC4C4;
-                }
-                QPushButton:pressed {
-                    background-color: #FFAAAA;
-                }
-            """)
-            delete_btn.clicked.connect(lambda checked, info=photo_info: self.delete_photo(info))
-            photo_container_layout.addWidget(delete_btn)
-            
-            # Container'ı ana layout'a ekle
-            self.photo_layout.addWidget(photo_widget)
-            
+        for row in range(last_row + 1, last_row + 1 + PHOTO_CONFIG["prefetch_rows"]):
+            self.model.prefetch(row)
+    
+    def open_full_photo(self, photo_info: Dict[str, Any]):
+        """Tam boyutlu fotoğrafı sadece kullanıcı açtığında çöz ve göster"""
+        if not photo_info:
+            return
+        viewer = PhotoViewerDialog(self, photo_info)
+        viewer.exec_()
+    
+    def done(self, result):
+        # Arka plan listelemesini durdur ve paylaşımlı yükleyiciden ayrıl
+        self._stop_page_worker()
+        self.model.release()
+        super().done(result)
+    
     def _select_date(self, date_iso: str):
         for i in range(self.date_list.count()):
             item = self.date_list.item(i)
@@ -1481,6 +1754,15 @@ class PhotoDialog(QDialog):
                 self.show_photos_for(date_iso)
                 break
     
+    def delete_selected_photo(self):
+        """Görünümde seçili fotoğrafı sil"""
+        index = self.photo_view.currentIndex()
+        photo_info = self.model.photo_at(index.row()) if index.isValid() else None
+        if not photo_info:
+            QMessageBox.warning(self, "Uyarı", "Lütfen silmek için bir fotoğraf seçin!")
+            return
+        self.delete_photo(photo_info)
+    
     def delete_photo(self, photo_info: Dict[str, Any]):
         """Fotoğrafı sadece Supabase'den sil"""
         if not self.db or not self.animal.id:
@@ -1501,94 +1783,282 @@ class PhotoDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
         
+        self.delete_btn.setEnabled(False)
+        self.delete_btn.setText("Siliniyor...")
+        # Sadece Supabase'den sil
+        animal_id = str(self.animal.id)
+        self.tasks.submit(
+            lambda: self.db.delete_photo(animal_id=animal_id, filename=filename)
+        ).then(self.on_photo_deleted, self.on_photo_delete_failed)
+
+    def _reset_delete_button(self):
+        self.delete_btn.setEnabled(True)
+        self.delete_btn.setText("🗑️ Seçili Fotoğrafı Sil")
+
+    def on_photo_deleted(self, success):
+        self._reset_delete_button()
+        if success:
+            QMessageBox.information(self, "Başarılı", "Fotoğraf başarıyla silindi!")
+            # Fotoğrafları yeniden yükle
+            self.load_photos()
+        else:
+            QMessageBox.critical(self, "Hata", "Fotoğraf silinemedi!")
+
+    def on_photo_delete_failed(self, error_msg):
+        self._reset_delete_button()
+        QMessageBox.critical(self, "Hata", f"Fotoğraf silinirken hata oluştu: {error_msg}")
+
+
+class PhotoViewerDialog(QDialog):
+    """Tek bir fotoğrafı tam boyutta gösterir."""
+
+    def __init__(self, parent, photo_info: Dict[str, Any]):
+        super().__init__(parent)
+        self.url = photo_info.get('url', '')
+        self.setWindowTitle(photo_info.get('name', 'Fotoğraf'))
+        self.resize(900, 700)
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        self.image_label = QLabel("Yükleniyor...")
+        self.image_label.setAlignment(Qt.AlignCenter)
+        scroll.setWidget(self.image_label)
+        layout.addWidget(scroll)
+
+        from photo_loader import get_photo_loader
+        self.loader = get_photo_loader()
+        self.loader.full_image_ready.connect(self.on_full_image_ready)
+        self.loader.photo_failed.connect(self.on_photo_failed)
+        self.loader.request_full(self.url)
+
+    def on_full_image_ready(self, url: str, image):
+        if url == self.url:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+
+    def on_photo_failed(self, url: str, error_msg: str):
+        if url == self.url:
+            self.image_label.setText(error_msg)
+
+    def done(self, result):
         try:
-            # Sadece Supabase'den sil
-            success = self.db.delete_photo(
-                animal_id=str(self.animal.id),
-                filename=filename
-            )
-            
-            if success:
-                QMessageBox.information(self, "Başarılı", "Fotoğraf başarıyla silindi!")
-                # Fotoğrafları yeniden yükle
-                self.load_photos()
-            else:
-                QMessageBox.critical(self, "Hata", "Fotoğraf silinemedi!")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Fotoğraf silinirken hata oluştu: {str(e)}")
+            self.loader.full_image_ready.disconnect(self.on_full_image_ready)
+            self.loader.photo_failed.disconnect(self.on_photo_failed)
+        except TypeError:
+            pass
+        super().done(result)
 
 
 class HealthTrendDialog(QDialog):
-    """Seçili hayvan için 7 günlük kilo + ateş grafiği"""
-
-    def __init__(self, parent, animal: Animal, history_data):
+    """
+    Seçili hayvan için kilo + ateş grafiği.
+    Aralık 1 günden yıllara kadar seçilebilir; yakınlaştırma/kaydırma araç çubuğundan yapılır.
+    Figür ve canvas bir kez oluşturulur, her açılışta sadece veri bağlanır.
+    """
+
+    # (Etiket, gün sayısı) - None: tüm geçmiş
+    RANGES = [
+        ("1 Gün", 1),
+        ("7 Gün", 7),
+        ("30 Gün", 30),
+        ("90 Gün", 90),
+        ("1 Yıl", 365),
+        ("3 Yıl", 3 * 365),
+        ("Tümü", None),
+    ]
+    DEFAULT_DAYS = 7
+    # Bu kadar veya daha az nokta görünüyorsa işaretçiler (marker) çizilir
+    MARKER_LIMIT = 60
+
+    def __init__(self, parent, fetch_logs, tasks):
         """
-        history_data: [
+        fetch_logs: (animal_id, days) -> [
             {"date": datetime, "weight": float, "temperature": float},
             ...
         ]
+        tasks: kayıtların arka planda okunduğu görev havuzu (TaskRunner)
         """
         super().__init__(parent)
-        self.animal = animal
-        self.history_data = history_data or []
-
-        self.setWindowTitle(f"{animal.isim} - Sağlık Trendi (7 Gün)")
+        # matplotlib sadece grafik ilk açıldığında yüklenir (uygulama açılışını yavaşlatmasın)
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+        import matplotlib.dates as mdates
+
+        self.fetch_logs = fetch_logs
+        self.tasks = tasks
+        self.animal = None
+        self._series = {}
+        self._update_pending = False
         self.setMinimumSize(800, 500)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
 
-        # Matplotlib Figure
-        # (Bazı ortamlarda global import sorun çıkarmasın diye lokal import da yapıyoruz)
-        from matplotlib.figure import Figure as _Figure
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as _FigureCanvas
-
-        self.figure = _Figure(figsize=(8, 4))
-        self.canvas = _FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(QLabel("Aralık:"))
+        self.range_combo = QComboBox()
+        for label, days in self.RANGES:
+            self.range_combo.addItem(label, days)
+        self.range_combo.currentIndexChanged.connect(self.on_range_changed)
+        control_layout.addWidget(self.range_combo)
+        control_layout.addStretch()
+        layout.addLayout(control_layout)
+
+        self.figure = Figure(figsize=(8, 4))
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas, 1)
+
+        self.empty_label = QLabel()
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label)
 
         self.ax1 = self.figure.add_subplot(111)
         self.ax2 = self.ax1.twinx()
 
-        self.plot_trend()
-
-    def plot_trend(self):
-        if not self.history_data:
-            msg = QLabel("Son 7 gün için kayıtlı kilo / ateş verisi bulunamadı.")
-            msg.setAlignment(Qt.AlignCenter)
-            self.layout().addWidget(msg)
-            return
-
-        df = pd.DataFrame(self.history_data)
-        df["date_str"] = df["date"].dt.strftime("%d %b")
-
-        dates = df["date_str"]
-        weights = df["weight"]
-        temps = df["temperature"]
-
         # Sol eksen: kilo
-        self.ax1.clear()
         color_w = "tab:blue"
         self.ax1.set_xlabel("Tarih")
         self.ax1.set_ylabel("Kilo (kg)", color=color_w, fontsize=11)
-        self.ax1.plot(dates, weights, color=color_w, marker="o", label="Kilo", linewidth=2)
         self.ax1.tick_params(axis="y", labelcolor=color_w)
         self.ax1.grid(True, linestyle="--", alpha=0.5)
+        (self.weight_line,) = self.ax1.plot([], [], color=color_w, marker="o", label="Kilo", linewidth=2)
 
         # Sağ eksen: ateş
-        self.ax2.clear()
         color_t = "tab:red"
         # Sağ eksen etiketini grafiğin SAĞ tarafına al
         self.ax2.yaxis.set_label_position("right")
         self.ax2.yaxis.tick_right()
         self.ax2.set_ylabel("Ateş (°C)", color=color_t, fontsize=11, labelpad=12)
-        self.ax2.plot(dates, temps, color=color_t, marker="s", linestyle="--", label="Ateş", linewidth=2)
         self.ax2.tick_params(axis="y", labelcolor=color_t)
-        self.ax2.set_ylim(35, 42)
+        (self.temp_line,) = self.ax2.plot([], [], color=color_t, marker="s", linestyle="--",
+                                          label="Ateş", linewidth=2)
+
+        locator = mdates.AutoDateLocator()
+        self.ax1.xaxis.set_major_locator(locator)
+        self.ax1.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+        # Yakınlaştırma/kaydırmada görünür aralık, ekran genişliğine göre yeniden örneklenir
+        self.ax1.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    def show_for(self, animal: Animal, days=DEFAULT_DAYS):
+        """Dialog'u verilen hayvan ve aralık için hazırla"""
+        self.animal = animal
+        index = self.range_combo.findData(days)
+        self.range_combo.blockSignals(True)
+        self.range_combo.setCurrentIndex(index)
+        self.range_combo.blockSignals(False)
+        self.load_range(days)
+
+    def on_range_changed(self, index):
+        if self.animal is not None:
+            self.load_range(self.range_combo.itemData(index))
+
+    def load_range(self, days):
+        range_label = self.range_combo.currentText()
+        self.setWindowTitle(f"{self.animal.isim} - Sağlık Trendi ({range_label})")
+        self.empty_label.setText("Yükleniyor...")
+        self.empty_label.setVisible(True)
+        # Aralık hızlıca değiştirilirse önceki okuma iptal edilir
+        self.tasks.submit(
+            self._fetch_series, self.animal.id, days, key="health_trend"
+        ).then(self.set_series, self.on_load_failed)
+
+    def _fetch_series(self, animal_id, days):
+        """(Arka planda) kayıtları oku ve çizime hazır dizilere çevir"""
+        history_data = self.fetch_logs(animal_id, days) or []
+        return self._prepare_series(history_data) if history_data else {}
+
+    def on_load_failed(self, error_msg):
+        self.empty_label.setText(f"Sağlık geçmişi okunamadı: {error_msg}")
+        self.empty_label.setVisible(True)
+
+    @staticmethod
+    def _prepare_series(history_data):
+        """Kayıtları tek geçişte numpy dizilerine çevir (x: matplotlib tarih sayısı)"""
+        import numpy as np
+        import matplotlib.dates as mdates
+
+        dates = np.array(
+            [row["date"].replace(tzinfo=None) for row in history_data], dtype="datetime64[us]"
+        )
+        x = mdates.date2num(dates)
+        # None değerler NaN olur; geçersiz noktalar aşağıda tek maskeyle atılır
+        weights = np.array([row.get("weight") for row in history_data], dtype=float)
+        temps = np.array([row.get("temperature") for row in history_data], dtype=float)
+
+        order = np.argsort(x, kind="stable")
+        x, weights, temps = x[order], weights[order], temps[order]
+
+        series = {}
+        for name, values in (("weight", weights), ("temperature", temps)):
+            valid = ~np.isnan(values)
+            series[name] = (x[valid], values[valid])
+        return series
+
+    def set_series(self, series):
+        """Hazırlanmış diziyi mevcut çizgilere bağla ve tüm aralığı göster"""
+        import numpy as np
+
+        self._series = series
+        has_data = any(len(x) for x, _ in self._series.values())
+        self.empty_label.setText(
+            "" if has_data else "Seçilen aralık için kayıtlı kilo / ateş verisi bulunamadı."
+        )
+        self.empty_label.setVisible(not has_data)
+
+        if not has_data:
+            self.weight_line.set_data([], [])
+            self.temp_line.set_data([], [])
+            self.canvas.draw_idle()
+            return
 
+        all_x = np.concatenate([x for x, _ in self._series.values()])
+        x_min, x_max = float(all_x.min()), float(all_x.max())
+        if x_min == x_max:
+            x_min, x_max = x_min - 0.5, x_max + 0.5
+
+        _, weights = self._series["weight"]
+        if len(weights):
+            pad = max((weights.max() - weights.min()) * 0.1, 1.0)
+            self.ax1.set_ylim(weights.min() - pad, weights.max() + pad)
+        _, temps = self._series["temperature"]
+        if len(temps):
+            self.ax2.set_ylim(min(35, temps.min() - 0.5), max(42, temps.max() + 0.5))
+        else:
+            self.ax2.set_ylim(35, 42)
+
+        # set_xlim, xlim_changed üzerinden çizgileri görünür aralık için örnekler
+        self.ax1.set_xlim(x_min, x_max)
+        self._update_lines()
+        # Araç çubuğunun "ana görünüm" geçmişini yeni veriye göre sıfırla
+        self.toolbar.update()
         self.figure.tight_layout()
-        self.canvas.draw()
+
+    def _on_xlim_changed(self, ax):
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._update_lines)
+
+    def _update_lines(self):
+        """Görünür aralıktaki noktaları canvas piksel genişliği kadar noktaya indir"""
+        from utils.downsample import downsample_window
+
+        self._update_pending = False
+        if not self._series:
+            return
+        x_min, x_max = self.ax1.get_xlim()
+        n_out = max(self.canvas.width(), 100)
+        lines = ((self.weight_line, "weight", "o"), (self.temp_line, "temperature", "s"))
+        for line, name, marker in lines:
+            x, y = self._series[name]
+            xs, ys = downsample_window(x, y, x_min, x_max, n_out)
+            line.set_data(xs, ys)
+            line.set_marker(marker if len(xs) <= self.MARKER_LIMIT else "")
+        self.canvas.draw_idle()
 
 
 class HealthLogDialog(QDialog):
@@ -1662,12 +2132,521 @@ class HealthLogDialog(QDialog):
         self.accept()
 
 
+class StationDialog(QDialog):
+    """
+    Tartım istasyonu. Okuyucu sürekli açıktır; tartı ve termometre okumaları pencere
+    içinde okunan karta bağlanır (utils.weighing_station). Ölçümler ekrana hemen
+    yansır, veritabanına ise arka planda parti parti yazılır.
+    """
+
+    COLUMNS = ["Saat", "Hayvan", "Kart", "Kilo (kg)", "Ateş (°C)", "Durum"]
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.dashboard = parent
+        self.setWindowTitle("⚖ Tartım İstasyonu")
+        self.setMinimumSize(760, 520)
+
+        devices = {WEIGHT: STATION_CONFIG["scale"], TEMPERATURE: STATION_CONFIG["thermometer"]}
+        self.devices = {kind: device for kind, device in devices.items() if device}
+        self.station = WeighingStation(parent.animal_cache.get_by_rfid, expected=self.devices)
+        self.queue = MeasurementQueue(STATION_CONFIG["batch_size"])
+        self.measured_count = 0
+        self.saved_count = 0
+        self.rejected_count = 0
+        self.started_at = time.monotonic()
+        self._last_flush = time.monotonic()
+        self._saving = False
+        self._closed = False
+        self._init_ui()
+
+        self.rfid_service = get_rfid_service()
+        self.rfid_service.tag_events.connect(self.on_tag_events)
+        self.rfid_service.connection_changed.connect(self.on_rfid_connection_changed)
+        self.rfid_service.start()
+        self.on_rfid_connection_changed(self.rfid_service.connected)
+
+        self.readers = []
+        for kind, device in self.devices.items():
+            reader = SerialReader(
+                device["port"], reader_id=kind, keep_retrying=True,
+                protocol=device.get("protocol", "scale" if kind == WEIGHT else "thermometer"),
+                baudrate=device.get("baudrate"),
+            )
+            # Cihaz ayrıştırıcısı hayvan başına bir değer verir; tekrar eleme gerekmez
+            reader.dedup_seconds = 0
+            reader.tag_events.connect(lambda events, kind=kind: self.on_readings(kind, events))
+            reader.connection_changed.connect(self.on_device_connection_changed)
+            reader.error_occurred.connect(self.on_device_error)
+            self.readers.append(reader)
+            reader.start()
+
+        # Penceresi dolan hayvanlar ve zamanı gelen toplu yazım için
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.on_tick)
+        self.timer.start(1000)
+
+    def _init_ui(self):
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        status_layout = QHBoxLayout()
+        self.device_labels = {}
+        for kind, caption in (("rfid", "📡 RFID"), (WEIGHT, "⚖ Tartı"), (TEMPERATURE, "🌡 Termometre")):
+            if kind != "rfid" and kind not in self.devices:
+                continue
+            label = QLabel()
+            label.setProperty("caption", caption)
+            self.device_labels[kind] = label
+            status_layout.addWidget(label)
+            self._set_device_state(kind, False)
+        status_layout.addStretch()
+        layout.addLayout(status_layout)
+
+        self.last_label = QLabel("Kart okutun, hayvanı tartıya alın...")
+        self.last_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.last_label.setStyleSheet("padding: 12px; border-radius: 8px; background-color: #F5F5F5;")
+        layout.addWidget(self.last_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table, 1)
+
+        self.notice_label = QLabel()
+        self.notice_label.setStyleSheet("color: #8A5A00;")
+        self.notice_label.setWordWrap(True)
+        layout.addWidget(self.notice_label)
+
+        self.counter_label = QLabel()
+        layout.addWidget(self.counter_label)
+        self._update_counters()
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    # -------- Okumalar --------
+
+    def on_tag_events(self, events):
+        finished = []
+        for event in events:
+            finished += self.station.on_tag(event.tag, event.timestamp)
+        self._handle(finished)
+
+    def on_readings(self, kind, events):
+        finished = []
+        for event in events:
+            try:
+                value = float(event.tag)
+            except ValueError:
+                continue
+            finished += self.station.on_reading(kind, value, event.timestamp)
+        self._handle(finished)
+
+    def on_tick(self):
+        self._handle(self.station.tick(time.time()))
+        if time.monotonic() - self._last_flush >= STATION_CONFIG["flush_seconds"]:
+            self.flush()
+        self._update_counters()
+
+    def _handle(self, measurements):
+        for measurement in measurements:
+            animal = measurement["animal"]
+            # Sonraki okumalar (ve ana ekran) güncel satırı görsün; yazım arka planda
+            self.dashboard.animal_cache.put(animal)
+            if str(animal.id) == str(self.dashboard.selected_animal_id):
+                self.dashboard.show_animal_details(animal)
+            self._add_row(measurement)
+            self.measured_count += 1
+        if measurements and self.queue.add(measurements):
+            self.flush()
+        rejected = self.station.take_rejected()
+        if rejected:
+            self.rejected_count += len(rejected)
+            last = rejected[-1]
+            name = f" - {last['animal'].isim}" if last["animal"] is not None else ""
+            tag = f" ({last['tag']})" if last["tag"] else ""
+            self.notice_label.setText(f"⚠ {last['reason']}{name}{tag}")
+        if measurements or rejected:
+            self._update_counters()
+
+    def _add_row(self, measurement):
+        animal = measurement["animal"]
+        weight, temperature = measurement["weight"], measurement["temperature"]
+        status = animal.saglik_durumu or ""
+        values = [
+            datetime.now().strftime("%H:%M:%S"),
+            animal.isim or "",
+            measurement["tag"],
+            f"{weight:.1f}" if weight is not None else "-",
+            f"{temperature:.1f}" if temperature is not None else "-",
+            status,
+        ]
+        self.table.insertRow(0)
+        for column, value in enumerate(values):
+            self.table.setItem(0, column, QTableWidgetItem(value))
+        while self.table.rowCount() > STATION_CONFIG["recent_rows"]:
+            self.table.removeRow(self.table.rowCount() - 1)
+
+        background = {"KRİTİK": "#ffebee", "UYARI": "#fff8e1"}.get(status, "#E8F5E9")
+        parts = [f"{animal.isim} ({measurement['tag']})"]
+        if weight is not None:
+            parts.append(f"{weight:.1f} kg")
+        if temperature is not None:
+            parts.append(f"{temperature:.1f} °C")
+        parts.append(status)
+        self.last_label.setText("  •  ".join(parts))
+        self.last_label.setStyleSheet(f"padding: 12px; border-radius: 8px; background-color: {background};")
+
+    def _update_counters(self):
+        hours = max(time.monotonic() - self.started_at, 1) / 3600
+        self.counter_label.setText(
+            f"Ölçülen: {self.measured_count}  •  Saatte: {self.measured_count / hours:.0f}  •  "
+            f"Kaydedilen: {self.saved_count}  •  Bekleyen: {len(self.queue)}  •  "
+            f"Reddedilen: {self.rejected_count}"
+        )
+
+    # -------- Toplu yazım --------
+
+    def flush(self):
+        """Bekleyen ölçümleri arka planda tek partide yaz (aynı anda tek parti)"""
+        self._last_flush = time.monotonic()
+        if self._saving or not len(self.queue):
+            return
+        batch = self.queue.take()
+        self._saving = True
+        self.dashboard.tasks.submit(self.dashboard.save_station_batch, batch).then(
+            lambda anomalies: self.on_batch_saved(batch, anomalies),
+            lambda error_msg: self.on_batch_failed(batch, error_msg),
+        )
+
+    def on_batch_saved(self, batch, anomalies):
+        self._saving = False
+        self.saved_count += len(batch)
+        latest = {str(measurement["animal_id"]): measurement["animal"] for measurement in batch}
+        self.dashboard.sync_animal_statuses(list(latest.values()))
+        # Önceden okunmuş 7 günlük geçmişte yeni ölçümler yok
+        self.dashboard.invalidate_prefetched_logs(latest)
+        if anomalies:
+            self.notice_label.setText("\n".join(alert["message"] for alert in anomalies[-3:]))
+        if len(self.queue) >= self.queue.batch_size or (self._closed and len(self.queue)):
+            self.flush()
+        elif self._closed:
+            # Son parti de yazıldı; ana listeyi güncelle
+            self.dashboard.on_search()
+        self._update_counters()
+
+    def on_batch_failed(self, batch, error_msg):
+        self._saving = False
+        # Kaybolmasın: bir sonraki yazımda tekrar denenir
+        self.queue.requeue(batch)
+        self.notice_label.setText(f"⚠ {error_msg} - tekrar denenecek")
+        self._update_counters()
+        if self._closed:
+            QMessageBox.critical(
+                self.dashboard, "Hata", f"{len(self.queue)} istasyon ölçümü kaydedilemedi:\n{error_msg}"
+            )
+
+    # -------- Cihaz durumu --------
+
+    def _set_device_state(self, kind, connected):
+        label = self.device_labels.get(kind)
+        if label is None:
+            return
+        state = "bağlı" if connected else "bekleniyor"
+        label.setText(f"{label.property('caption')}: {state}")
+        label.setStyleSheet(f"color: {'#215732' if connected else '#8A5A00'}; padding-right: 12px;")
+
+    def on_rfid_connection_changed(self, connected):
+        self._set_device_state("rfid", connected)
+
+    def on_device_connection_changed(self, kind, connected):
+        self._set_device_state(kind, connected)
+
+    def on_device_error(self, kind, error_msg):
+        self.notice_label.setText(f"⚠ {self.device_labels[kind].property('caption')}: {error_msg}")
+
+    def done(self, result):
+        self.timer.stop()
+        self.rfid_service.tag_events.disconnect(self.on_tag_events)
+        self.rfid_service.connection_changed.disconnect(self.on_rfid_connection_changed)
+        for reader in self.readers:
+            reader.request_stop()
+        for reader in self.readers:
+            reader.wait()
+        # Yarım kalan hayvan ve bekleyen ölçümler kapanıştan sonra da yazılır
+        self._closed = True
+        self._handle(self.station.flush())
+        if self._saving or len(self.queue):
+            self.flush()
+        else:
+            self.dashboard.on_search()
+        super().done(result)
+
+
+class RollCallDialog(QDialog):
+    """
+    Sürü yoklaması. Okuyucu sürekli açıktır; okunan her kart zaman damgasıyla oturuma
+    eklenir, sayaçlar belirli aralıklarla güncellenir (okuma başına çizim yapılmaz).
+    Bitirilince eksik, beklenmeyen ve çift okunan kartlar ile bir önceki yoklamaya göre
+    fark gösterilir; rapor hesaplama ve diske yazma arka planda yapılır.
+    """
+
+    def __init__(self, parent, herd):
+        super().__init__(parent)
+        self.dashboard = parent
+        self.herd = herd
+        self.animals_by_id = {str(animal.id): animal for animal in herd}
+        self.expected = herd_tag_index(herd)
+        self.store = RollCallStore()
+        self.session = RollCallSession()
+        self.path = self.store.path_for(self.session)
+        # Sayaçlar (küme farkları bitişte tam olarak hesaplanır)
+        self.present_count = 0
+        self.unexpected_count = 0
+        self.last_tag = None
+        self._changed = False
+        self._finished = False
+        # Otomatik kayıt ile son kayıt aynı dosyaya sırayla yazılsın
+        self._save_lock = threading.Lock()
+        self.tasks = parent.tasks
+        self.setWindowTitle("📋 Sürü Yoklaması")
+        self.setMinimumSize(640, 560)
+        self._init_ui()
+
+        self.rfid_service = get_rfid_service()
+        self.rfid_service.tag_events.connect(self.on_tag_events)
+        self.rfid_service.error_occurred.connect(self.on_rfid_error)
+        self.rfid_service.connection_changed.connect(self.on_rfid_connection_changed)
+        self.rfid_service.start()
+        if not self.rfid_service.connected and self.rfid_service.last_error:
+            self.on_rfid_error(self.rfid_service.last_error)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(ROLL_CALL_CONFIG["refresh_ms"])
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(ROLL_CALL_CONFIG["autosave_seconds"] * 1000)
+
+    def _init_ui(self):
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        self.progress_label = QLabel()
+        self.progress_label.setFont(QFont("Arial", 16, QFont.Bold))
+        layout.addWidget(self.progress_label)
+
+        self.info_label = QLabel()
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        self.tabs = QTabWidget()
+        self.lists = {}
+        for key in ("missing", "unexpected", "duplicates", "previous"):
+            widget = QListWidget()
+            widget.setUniformItemSizes(True)
+            widget.itemDoubleClicked.connect(self.on_report_item_activated)
+            self.lists[key] = widget
+            self.tabs.addTab(widget, "")
+        self.tabs.setVisible(False)
+        layout.addWidget(self.tabs, 1)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.finish_btn = QPushButton("⏹ Yoklamayı Bitir")
+        self.finish_btn.clicked.connect(self.finish)
+        button_layout.addWidget(self.finish_btn)
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.reject)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        self.refresh(force=True)
+
+    # -------- Okuma --------
+
+    def on_tag_events(self, events):
+        if self._finished:
+            return
+        expected = self.expected
+        for tag in self.session.add(events):
+            if tag in expected:
+                self.present_count += 1
+            else:
+                self.unexpected_count += 1
+        if events:
+            self.last_tag = normalize_tag(events[-1].tag)
+            self._changed = True
+
+    def refresh(self, force=False):
+        """Sayaçları güncelle (okuma sıklığından bağımsız, sabit aralıkla)"""
+        if not (self._changed or force):
+            return
+        self._changed = False
+        total = len(self.expected)
+        percent = 100 * self.present_count / total if total else 0
+        self.progress_label.setText(f"Okunan: {self.present_count} / {total} kart (%{percent:.0f})")
+        last = ""
+        if self.last_tag:
+            owners = self.expected.get(self.last_tag)
+            name = owners[0].isim if owners else "kayıtlı değil"
+            last = f"  •  Son: {name} ({self.last_tag})"
+        self.info_label.setText(
+            f"Toplam okuma: {self.session.read_count}  •  "
+            f"Beklenmeyen kart: {self.unexpected_count}{last}"
+        )
+
+    def on_rfid_error(self, error_msg):
+        self.info_label.setText(f"⚠ {error_msg}")
+
+    def on_rfid_connection_changed(self, connected):
+        if connected:
+            self.refresh(force=True)
+
+    # -------- Kayıt --------
+
+    def autosave(self):
+        """Yarım oturumu arka planda diske yaz (uygulama kapanırsa okumalar kaybolmasın)"""
+        if self._finished or not self.session.read_count:
+            return
+        data = self.session.to_dict()
+        self.tasks.submit(self._write, data, False)
+
+    def _write(self, data, final):
+        with self._save_lock:
+            # Son kayıt yazıldıysa geciken otomatik kayıt onu ezmesin
+            if not final and self.session.ended_at is not None:
+                return False
+            return self.store.write(self.path, data)
+
+    def finish(self):
+        """Yoklamayı bitir: raporu ve önceki yoklamaya göre farkı arka planda hesapla"""
+        if self._finished:
+            return
+        self._finished = True
+        self._stop_reading()
+        self.session.end()
+        self.finish_btn.setEnabled(False)
+        self.progress_label.setText("Rapor hazırlanıyor...")
+        self.tasks.submit(self._build_report).then(self.show_report, self.on_report_failed)
+
+    def _build_report(self):
+        """(Arka planda) küme farkları, önceki yoklamanın özeti ve kayıt"""
+        report = self.session.report(self.herd)
+        summary = self.session.summary(report)
+        previous = self.store.latest_summary(exclude=self.path)
+        diff = diff_summaries(previous, summary) if previous else None
+        self._write(self.session.to_dict(report), True)
+        return report, diff, previous
+
+    def on_report_failed(self, error_msg):
+        self.progress_label.setText("Rapor hazırlanamadı")
+        QMessageBox.critical(self, "Hata", f"Yoklama raporu hazırlanamadı:\n{error_msg}")
+
+    # -------- Rapor --------
+
+    def show_report(self, result):
+        report, diff, previous = result
+        expected_count = report["expected_count"]
+        self.progress_label.setText(
+            f"Okunan: {self.present_count} / {expected_count} kart  •  "
+            f"Eksik hayvan: {len(report['missing'])}"
+        )
+        notes = [f"Toplam okuma: {self.session.read_count}"]
+        if report["untagged"]:
+            notes.append(f"Kartı olmayan hayvan: {report['untagged']}")
+        self.info_label.setText("  •  ".join(notes))
+
+        def fill(key, title, lines, ids=None):
+            widget = self.lists[key]
+            widget.clear()
+            for index, line in enumerate(lines):
+                item = QListWidgetItem(line)
+                if ids is not None and ids[index] is not None:
+                    item.setData(Qt.UserRole, ids[index])
+                widget.addItem(item)
+            self.tabs.setTabText(self.tabs.indexOf(widget), f"{title} ({len(lines)})")
+
+        missing = report["missing"]
+        fill("missing", "Eksik", [self._describe(animal) for animal in missing],
+             [animal.id for animal in missing])
+        fill("unexpected", "Beklenmeyen", list(report["unexpected"]))
+
+        duplicate_lines, duplicate_ids = [], []
+        for tag, passes in sorted(report["duplicate_reads"].items()):
+            owners = self.expected.get(tag) or []
+            name = owners[0].isim if owners else "kayıtlı değil"
+            duplicate_lines.append(f"{tag} - {name}: {passes} ayrı geçişte okundu")
+            duplicate_ids.append(owners[0].id if owners else None)
+        for tag, owners in sorted(report["shared_tags"].items()):
+            names = ", ".join(animal.isim or "?" for animal in owners)
+            duplicate_lines.append(f"⚠ {tag} birden çok hayvana kayıtlı: {names}")
+            duplicate_ids.append(owners[0].id)
+        fill("duplicates", "Çift", duplicate_lines, duplicate_ids)
+
+        previous_lines, previous_ids = [], []
+        if diff is None:
+            previous_lines.append("Karşılaştırılacak önceki yoklama yok.")
+            previous_ids.append(None)
+        else:
+            started = datetime.fromisoformat(previous["started_at"]).strftime("%d.%m.%Y %H:%M")
+            previous_lines.append(f"Önceki yoklama: {started}")
+            previous_ids.append(None)
+            for key, prefix in (("newly_missing", "🔻 Önceki yoklamada vardı, şimdi yok"),
+                                ("found", "✅ Önceden eksikti, bulundu"),
+                                ("still_missing", "⏳ İki yoklamada da eksik")):
+                for animal_id in diff[key]:
+                    animal = self.animals_by_id.get(animal_id)
+                    previous_lines.append(f"{prefix}: {self._describe(animal) if animal else animal_id}")
+                    previous_ids.append(animal_id)
+        fill("previous", "Öncekine Göre", previous_lines, previous_ids)
+        if diff is not None:
+            self.tabs.setTabText(self.tabs.indexOf(self.lists["previous"]),
+                                 f"Öncekine Göre (-{len(diff['newly_missing'])} / +{len(diff['found'])})")
+        self.tabs.setVisible(True)
+
+    @staticmethod
+    def _describe(animal: Animal) -> str:
+        return f"{animal.isim} - {animal.tur or 'Diğer'} ({animal.rfid_tag})"
+
+    def on_report_item_activated(self, item):
+        """Rapordaki hayvana çift tıklanınca ana ekranda detayını göster"""
+        animal_id = item.data(Qt.UserRole)
+        if animal_id is not None:
+            self.dashboard.select_animal(animal_id)
+
+    def _stop_reading(self):
+        self.refresh_timer.stop()
+        self.autosave_timer.stop()
+        try:
+            self.rfid_service.tag_events.disconnect(self.on_tag_events)
+            self.rfid_service.error_occurred.disconnect(self.on_rfid_error)
+            self.rfid_service.connection_changed.disconnect(self.on_rfid_connection_changed)
+        except TypeError:
+            pass
+
+    def done(self, result):
+        # Bitirilmeden kapatılan yoklama da raporuyla kaydedilir (sonraki fark için)
+        if not self._finished and self.session.read_count:
+            self._finished = True
+            self._stop_reading()
+            self.session.end()
+            self.tasks.submit(self._build_report)
+        else:
+            self._stop_reading()
+        super().done(result)
+
+
 class AnimalDialog(QDialog):
     """Hayvan ekleme/düzenleme dialog penceresi (RFID Entegreli)"""
     
     def __init__(self, parent, title, data=None):
         super().__init__(parent)
         self.result = None
+        self.rfid_service = get_rfid_service()
         self.setWindowTitle(title)
         self.setMinimumSize(500, 600)
         
@@ -1796,23 +2775,30 @@ class AnimalDialog(QDialog):
         self.scan_btn.setEnabled(False)
         self.rfid_entry.clear()
         
-        self.reader_thread = SerialReader()
-        self.reader_thread.rfid_read.connect(self.on_rfid_found)
-        self.reader_thread.error_occurred.connect(self.on_rfid_error)
-        self.reader_thread.start()
+        # Paylaşılan okuyucuya abone ol (port zaten açıksa bekleme yok)
+        self.rfid_service.subscribe(self.on_rfid_found, self.on_rfid_error)
+
+    def stop_rfid_scan(self):
+        self.rfid_service.unsubscribe(self.on_rfid_found, self.on_rfid_error)
 
     def on_rfid_found(self, rfid_id):
+        self.stop_rfid_scan()
         self.rfid_entry.setText(rfid_id)
         self.scan_btn.setText("Tekrar Oku")
         self.scan_btn.setEnabled(True)
         QMessageBox.information(self, "Başarılı", f"Kart Okundu: {rfid_id}")
-        self.reader_thread.stop()
 
     def on_rfid_error(self, msg):
+        self.stop_rfid_scan()
         self.scan_btn.setText("Çip Oku")
         self.scan_btn.setEnabled(True)
         QMessageBox.warning(self, "Hata", msg)
 
+    def done(self, result):
+        # Dialog kapanırken (okuma beklenirken bile) aboneliği bırak
+        self.stop_rfid_scan()
+        super().done(result)
+
     def save(self):
         """Form verilerini kaydet"""
         # Temperature ve baseline_weight değerlerini parse et
@@ -0,0 +1,140 @@
+import time
+from typing import Dict, Iterable, List, Optional
+
+from models.animal import Animal
+from utils.rfid_frames import normalize_tag
+
+
+class AnimalCache:
+    """
+    Yüklenen hayvan satırları için id'ye göre kimlik haritası (identity map).
+
+    Liste zaten veritabanından gelen satırlarla oluşturulduğu için detay paneli
+    bu satırlardan anında çizilir; satır belirli bir süreden eskiyse tazelenmesi gerekir.
+    Okunan RFID kartından hayvanı bulmak için kart -> id dizini de tutulur.
+    """
+
+    def __init__(self, ttl_seconds: float = 120):
+        self.ttl_seconds = ttl_seconds
+        self._animals: Dict[str, Animal] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._by_rfid: Dict[str, str] = {}
+        # Silinen id -> silinme anı (replace_all'a kadar; okunurken silinen satır geri gelmesin)
+        self._removed_at: Dict[str, float] = {}
+
+    @staticmethod
+    def _key(animal_id) -> str:
+        return str(animal_id)
+
+    def put(self, animal: Animal):
+        """Tek bir hayvanı haritaya ekle veya güncelle"""
+        if animal is None or animal.id is None:
+            return
+        key = self._key(animal.id)
+        self._index_rfid(key, animal)
+        self._animals[key] = animal
+        self._loaded_at[key] = time.monotonic()
+
+    def put_many(self, animals: Iterable[Animal], stale: bool = False):
+        """
+        Veritabanından gelen satırları toplu ekle.
+        stale=True ise (ör. diskteki eski kopyadan) satırlar ilk erişimde tazelenecek kabul edilir.
+        """
+        now = float("-inf") if stale else time.monotonic()
+        for animal in animals:
+            if animal.id is None:
+                continue
+            key = self._key(animal.id)
+            self._index_rfid(key, animal)
+            self._animals[key] = animal
+            self._loaded_at[key] = now
+
+    def replace_all(self, animals: Iterable[Animal], keep_since: Optional[float] = None):
+        """
+        İçeriği yetkili (canlı) sürü listesiyle değiştir; listede olmayan satırlar
+        (ör. diskteki kopyadan gelen veya başka istemcide silinenler) atılır, kart dizini
+        baştan kurulur. keep_since: liste okunurken (bu andan sonra) eklenen/düzenlenen
+        satırlar korunur, silinenler geri gelmez.
+        """
+        now = time.monotonic()
+        removed = {key for key, at in self._removed_at.items()
+                   if keep_since is not None and at > keep_since}
+        animals_by_id: Dict[str, Animal] = {}
+        loaded_at: Dict[str, float] = {}
+        for animal in animals:
+            if animal.id is None:
+                continue
+            key = self._key(animal.id)
+            if key in removed:
+                continue
+            animals_by_id[key] = animal
+            loaded_at[key] = now
+        if keep_since is not None:
+            for key, at in self._loaded_at.items():
+                if at > keep_since and key in self._animals:
+                    animals_by_id[key] = self._animals[key]
+                    loaded_at[key] = at
+        by_rfid: Dict[str, str] = {}
+        for key, animal in animals_by_id.items():
+            tag = normalize_tag(animal.rfid_tag)
+            if tag:
+                by_rfid[tag] = key
+        # Arka plandaki okuyucular (get_by_rfid) yarım dizin görmesin diye tek seferde değişir
+        self._animals, self._loaded_at, self._by_rfid = animals_by_id, loaded_at, by_rfid
+        self._removed_at = {}
+
+    def get(self, animal_id) -> Optional[Animal]:
+        """ID'ye göre bellekteki hayvanı döndür (yoksa None)"""
+        if animal_id is None:
+            return None
+        return self._animals.get(self._key(animal_id))
+
+    def get_by_rfid(self, rfid) -> Optional[Animal]:
+        """Okunan karta göre bellekteki hayvanı döndür (yoksa None)"""
+        key = self._by_rfid.get(normalize_tag(rfid))
+        return self._animals.get(key) if key is not None else None
+
+    def remove(self, animal_id):
+        """Hayvanı haritadan çıkar"""
+        key = self._key(animal_id)
+        self._unindex_rfid(key)
+        self._animals.pop(key, None)
+        self._loaded_at.pop(key, None)
+        self._removed_at[key] = time.monotonic()
+
+    def is_stale(self, animal_id) -> bool:
+        """Satır hiç yüklenmemişse veya TTL süresini aştıysa True"""
+        loaded_at = self._loaded_at.get(self._key(animal_id))
+        if loaded_at is None:
+            return True
+        return time.monotonic() - loaded_at > self.ttl_seconds
+
+    def all(self) -> List[Animal]:
+        """Bellekteki tüm hayvanlar"""
+        return list(self._animals.values())
+
+    def clear(self):
+        self._animals.clear()
+        self._loaded_at.clear()
+        self._by_rfid.clear()
+        self._removed_at.clear()
+
+    def _index_rfid(self, key: str, animal: Animal):
+        # Kartı değişen hayvanın eski kaydı dizinde kalmasın
+        self._unindex_rfid(key)
+        tag = normalize_tag(animal.rfid_tag)
+        if tag:
+            self._by_rfid[tag] = key
+
+    def _unindex_rfid(self, key: str):
+        previous = self._animals.get(key)
+        if previous is not None:
+            tag = normalize_tag(previous.rfid_tag)
+            if self._by_rfid.get(tag) == key:
+                del self._by_rfid[tag]
+
+    def __len__(self):
+        return len(self._animals)
+
+    def __contains__(self, animal_id):
+        return self._key(animal_id) in self._animals
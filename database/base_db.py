@@ -21,6 +21,11 @@ class BaseDatabase(ABC):
         """ID'ye göre hayvan getir"""
         pass
     
+    @abstractmethod
+    def get_animal_by_rfid(self, rfid: str) -> Optional[Animal]:
+        """RFID kartına göre hayvan getir"""
+        pass
+    
     @abstractmethod
     def add_animal(self, animal: Animal) -> bool:
         """Yeni hayvan ekle"""
@@ -52,6 +57,6 @@ class BaseDatabase(ABC):
         pass
     
     @abstractmethod
-    def list_photos(self, animal_id: str) -> List[Dict[str, Any]]:
-        """Bir hayvana ait tüm fotoğrafları listele."""
+    def list_photos(self, animal_id: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Bir hayvana ait fotoğrafların bir sayfasını (isim sırasıyla, limit/offset) listele."""
         pass
\ No newline at end of file
@@ -1,10 +1,12 @@
 import json
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
 from database.base_db import BaseDatabase
+from utils.rfid_frames import normalize_tag
 from models.animal import Animal
 from config import DB_CONFIG
 
@@ -14,6 +16,8 @@ class LocalDatabase(BaseDatabase):
     def __init__(self):
         self.file_path = Path(DB_CONFIG["local_file"])
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Arka plan görevleri aynı anda okuyup yazabilir
+        self._lock = threading.RLock()
         self.data = []
         self.load_data()
     
@@ -23,74 +27,123 @@ class LocalDatabase(BaseDatabase):
     
     def load_data(self):
         """Verileri dosyadan yükle"""
-        if self.file_path.exists():
-            try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-            except:
+        with self._lock:
+            if self.file_path.exists():
+                try:
+                    with open(self.file_path, 'r', encoding='utf-8') as f:
+                        self.data = json.load(f)
+                except:
+                    self.data = []
+                self.save_data()
+            else:
                 self.data = []
-            self.save_data()
-        else:
-            self.data = []
-            self.save_data()
+                self.save_data()
     
     def save_data(self):
         """Verileri dosyaya kaydet"""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        with self._lock:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
     
     def get_all_animals(self) -> List[Animal]:
         """Tüm hayvanları getir"""
-        return [Animal(item) for item in self.data]
+        with self._lock:
+            return [Animal(item) for item in self.data]
     
     def get_animal_by_id(self, animal_id: str) -> Optional[Animal]:
         """ID'ye göre hayvan getir"""
-        for item in self.data:
-            if item.get("id") == animal_id:
-                return Animal(item)
-        return None
+        with self._lock:
+            for item in self.data:
+                if item.get("id") == animal_id:
+                    return Animal(item)
+            return None
+    
+    def get_animal_by_rfid(self, rfid: str) -> Optional[Animal]:
+        """RFID kartına göre hayvan getir"""
+        tag = normalize_tag(rfid)
+        if not tag:
+            return None
+        with self._lock:
+            for item in self.data:
+                if normalize_tag(item.get("rfid_tag")) == tag:
+                    return Animal(item)
+            return None
     
     def add_animal(self, animal: Animal) -> bool:
         """Yeni hayvan ekle"""
-        try:
-            if not animal.id:
-                animal.id = str(uuid.uuid4())
+        with self._lock:
+            try:
+                if not animal.id:
+                    animal.id = str(uuid.uuid4())
             
-            animal_dict = animal.to_dict()
-            self.data.append(animal_dict)
-            self.save_data()
-            return True
-        except Exception as e:
-            print(f"Hata: {e}")
-            return False
+                animal_dict = animal.to_dict()
+                self.data.append(animal_dict)
+                self.save_data()
+                return True
+            except Exception as e:
+                print(f"Hata: {e}")
+                return False
     
     def update_animal(self, animal_id: str, animal: Animal) -> bool:
         """Hayvan güncelle"""
-        try:
-            for i, item in enumerate(self.data):
-                if item.get("id") == animal_id:
-                    animal.id = animal_id
-                    self.data[i] = animal.to_dict()
-                    self.save_data()
-                    return True
-            return False
-        except Exception as e:
-            print(f"Hata: {e}")
-            return False
+        with self._lock:
+            try:
+                for i, item in enumerate(self.data):
+                    if item.get("id") == animal_id:
+                        animal.id = animal_id
+                        self.data[i] = animal.to_dict()
+                        self.save_data()
+                        return True
+                return False
+            except Exception as e:
+                print(f"Hata: {e}")
+                return False
+    
+    def update_animals(self, animals: List[Animal]) -> bool:
+        """Birden çok hayvanı toplu güncelle (tek dosya yazımı)"""
+        with self._lock:
+            try:
+                updated = {str(animal.id): animal for animal in animals}
+                for i, item in enumerate(self.data):
+                    animal = updated.get(str(item.get("id")))
+                    if animal is not None:
+                        self.data[i] = animal.to_dict()
+                self.save_data()
+                return True
+            except Exception as e:
+                print(f"Hata: {e}")
+                return False
+    
+    def update_health_statuses(self, statuses: Dict[str, List[str]]) -> bool:
+        """Sağlık durumlarını toplu güncelle (tek dosya yazımı)"""
+        with self._lock:
+            try:
+                new_status = {str(animal_id): status for status, ids in statuses.items() for animal_id in ids}
+                for item in self.data:
+                    status = new_status.get(str(item.get("id")))
+                    if status is not None:
+                        item["saglik_durumu"] = status
+                self.save_data()
+                return True
+            except Exception as e:
+                print(f"Hata: {e}")
+                return False
     
     def delete_animal(self, animal_id: str) -> bool:
         """Hayvan sil"""
-        try:
-            self.data = [item for item in self.data if item.get("id") != animal_id]
-            self.save_data()
-            return True
-        except Exception as e:
-            print(f"Hata: {e}")
-            return False
+        with self._lock:
+            try:
+                self.data = [item for item in self.data if item.get("id") != animal_id]
+                self.save_data()
+                return True
+            except Exception as e:
+                print(f"Hata: {e}")
+                return False
     
     def search_animals(self, query: str, filters: Dict[str, Any] = None) -> List[Animal]:
         """Hayvan ara ve filtrele"""
-        results = self.data.copy()
+        with self._lock:
+            results = self.data.copy()
         
         # Metin araması (isim, tür, renk ve RFID)
         if query:
@@ -128,7 +181,7 @@ class LocalDatabase(BaseDatabase):
         """
         return True
     
-    def list_photos(self, animal_id: str) -> List[Dict[str, Any]]:
+    def list_photos(self, animal_id: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Yerel veritabanı için: Fotoğraflar yerel dosya sisteminden okunacak.
         """
@@ -149,7 +202,14 @@ class LocalDatabase(BaseDatabase):
         """
         return True
 
-    def get_health_logs(self, animal_id: str, days: int = 7):
+    def add_health_logs(self, entries: List[Dict[str, Any]]) -> bool:
+        """Yerel veritabanında sağlık geçmişi tutulmuyor (toplu ekleme de no-op)."""
+        return True
+
+    def get_health_logs(self, animal_id: str, days: Optional[int] = 7):
         """Yerel veritabanı için sağlık geçmişi yok, boş liste döner."""
         return []
 
+    def get_herd_health_logs(self, days: Optional[int] = 365) -> Dict[str, List[Any]]:
+        """Yerel veritabanı için sağlık geçmişi yok, boş sütunlar döner."""
+        return {"animal_id": [], "measured_at": [], "temperature": []}
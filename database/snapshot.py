@@ -0,0 +1,66 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from models.animal import Animal
+
+# Listede ve detay panelinde kullanılan alanlar; boş değerler dosyaya yazılmaz
+SNAPSHOT_FIELDS = [
+    "id", "rfid_tag", "isim", "yas", "kilo", "boy", "cinsiyet", "tur", "renk",
+    "dogum_tarihi", "saglik_durumu", "notlar", "olusturma_tarihi", "photo_url",
+    "temperature", "baseline_weight",
+]
+
+
+class HerdSnapshot:
+    """
+    Son görülen sürü listesinin diskteki kompakt kopyası.
+
+    Açılışta ağdan canlı veri gelene kadar bu kopya gösterilir; canlı liste
+    geldiğinde dosya yeni listeyle değiştirilir.
+    """
+
+    VERSION = 1
+
+    def __init__(self, file_path: str):
+        self.file_path = Path(file_path)
+
+    def load(self) -> Optional[Tuple[List[Animal], datetime]]:
+        """Kayıtlı listeyi ve kaydedilme zamanını döndür (yoksa/bozuksa None)"""
+        if not self.file_path.exists():
+            return None
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return None
+            saved_at = datetime.fromisoformat(data["saved_at"])
+            animals = [Animal(row) for row in data.get("animals", [])]
+            return animals, saved_at
+        except Exception as e:
+            print(f"Sürü kopyası okunamadı: {e}")
+            return None
+
+    def save(self, animals: List[Animal]) -> bool:
+        """Listeyi zaman damgasıyla kaydet (yarım yazılmış dosya bırakmadan)"""
+        rows = []
+        for animal in animals:
+            row = animal.to_dict()
+            rows.append({k: row[k] for k in SNAPSHOT_FIELDS if row.get(k) not in (None, "")})
+        data = {
+            "version": self.VERSION,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "animals": rows,
+        }
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.file_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.file_path)
+            return True
+        except Exception as e:
+            print(f"Sürü kopyası kaydedilemedi: {e}")
+            return False
@@ -1,11 +1,11 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
-from supabase import create_client, Client
 from pathlib import Path
 from database.base_db import BaseDatabase
 from models.animal import Animal
 from config import DB_CONFIG
+from utils.rfid_frames import normalize_tag
 
 class SupabaseDatabase(BaseDatabase):
     """Supabase veritabanı entegrasyonu"""
@@ -13,7 +13,7 @@ class SupabaseDatabase(BaseDatabase):
     def __init__(self):
         self.url = DB_CONFIG["supabase_url"]
         self.key = DB_CONFIG["supabase_key"]
-        self.client: Optional[Client] = None
+        self.client = None  # supabase.Client, connect() ile oluşturulur
         self.table_name = "farm_animals"
     
     def connect(self) -> bool:
@@ -22,6 +22,8 @@ class SupabaseDatabase(BaseDatabase):
             if not self.url or not self.key:
                 raise ValueError("Supabase URL veya Key bulunamadı!")
             
+            # supabase paketi ağır; sadece gerçekten bağlanırken yüklenir
+            from supabase import create_client
             self.client = create_client(self.url, self.key)
             return True
         except Exception as e:
@@ -48,6 +50,29 @@ class SupabaseDatabase(BaseDatabase):
             print(f"Hata: {e}")
             return None
     
+    def get_animal_by_rfid(self, rfid: str) -> Optional[Animal]:
+        """
+        RFID kartına göre hayvan getir. Ayraçsız/büyük harfli kart (normalize_tag) veritabanının
+        ürettiği rfid_tag_norm sütununda tam eşleşmeyle aranır (README: Supabase Entegrasyonu)
+        """
+        tag = normalize_tag(rfid)
+        if not tag:
+            return None
+        try:
+            response = (
+                self.client.table(self.table_name)
+                .select("*")
+                .eq("rfid_tag_norm", tag)
+                .limit(1)
+                .execute()
+            )
+            if response.data:
+                return self._to_animal(response.data[0])
+            return None
+        except Exception as e:
+            print(f"Hata: {e}")
+            return None
+    
     def add_animal(self, animal: Animal) -> bool:
         """Yeni hayvan ekle"""
         try:
@@ -81,6 +106,36 @@ class SupabaseDatabase(BaseDatabase):
             print(f"Hata: {e}")
             return False
     
+    def update_animals(self, animals: List[Animal]) -> bool:
+        """Birden çok hayvanı toplu güncelle (tam satırlarla upsert; hepsi zaten kayıtlı)"""
+        try:
+            rows = [self._from_animal(animal) for animal in animals]
+            for start in range(0, len(rows), self.BATCH_WRITE_CHUNK_SIZE):
+                self.client.table(self.table_name).upsert(
+                    rows[start:start + self.BATCH_WRITE_CHUNK_SIZE]
+                ).execute()
+            return True
+        except Exception as e:
+            print(f"Hayvanlar güncellenirken hata: {e}")
+            return False
+    
+    def update_health_statuses(self, statuses: Dict[str, List[str]]) -> bool:
+        """
+        Sağlık durumlarını toplu yaz: durum başına tek (id listesi parçalı) güncelleme.
+        animals tablosunda health_status sütunu gerekir (bkz. README).
+
+        statuses: {durum metni: [hayvan id, ...]}
+        """
+        try:
+            for status, ids in statuses.items():
+                for start in range(0, len(ids), self.STATUS_UPDATE_CHUNK_SIZE):
+                    chunk = ids[start:start + self.STATUS_UPDATE_CHUNK_SIZE]
+                    self.client.table(self.table_name).update({"health_status": status}).in_("id", chunk).execute()
+            return True
+        except Exception as e:
+            print(f"Sağlık durumları güncellenirken hata: {e}")
+            return False
+    
     def delete_animal(self, animal_id: str) -> bool:
         """Hayvan sil"""
         try:
@@ -143,9 +198,45 @@ class SupabaseDatabase(BaseDatabase):
             print(f"Sağlık kaydı eklenirken hata: {e}")
             return False
 
-    def get_health_logs(self, animal_id: str, days: int = 7) -> List[Dict[str, Any]]:
+    def add_health_logs(self, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Birden çok ölçümü toplu ekle (tartım istasyonu).
+
+        entries: [{"animal_id", "weight", "temperature", "measured_at": datetime | None}, ...]
+        """
+        if not self.client:
+            return False
+        now = datetime.utcnow()
+        payload = [
+            {
+                "animal_id": entry["animal_id"],
+                "measured_at": (entry.get("measured_at") or now).isoformat(),
+                "weight": entry.get("weight"),
+                "temperature": entry.get("temperature"),
+            }
+            for entry in entries
+        ]
+        try:
+            for start in range(0, len(payload), self.BATCH_WRITE_CHUNK_SIZE):
+                self.client.table("health_logs").insert(
+                    payload[start:start + self.BATCH_WRITE_CHUNK_SIZE]
+                ).execute()
+            return True
+        except Exception as e:
+            print(f"Sağlık kayıtları eklenirken hata: {e}")
+            return False
+
+    # Toplu ekleme/güncellemede tek istekteki en fazla satır
+    BATCH_WRITE_CHUNK_SIZE = 500
+    # PostgREST tek istekte en fazla bu kadar satır döndürür
+    HEALTH_LOG_PAGE_SIZE = 1000
+    # Toplu durum güncellemesinde tek istekteki en fazla id (URL uzunluğu sınırı)
+    STATUS_UPDATE_CHUNK_SIZE = 200
+
+    def get_health_logs(self, animal_id: str, days: Optional[int] = 7) -> List[Dict[str, Any]]:
         """
         Belirli bir hayvan için son N günün kilo + ateş kayıtlarını getir.
+        days None ise tüm geçmiş döner; uzun aralıklar sayfa sayfa okunur.
 
         Returns:
             [
@@ -157,18 +248,30 @@ class SupabaseDatabase(BaseDatabase):
             return []
 
         try:
-            since = datetime.utcnow() - timedelta(days=days - 1)
-            response = (
-                self.client.table("health_logs")
-                .select("measured_at, weight, temperature")
-                .eq("animal_id", animal_id)
-                .gte("measured_at", since.isoformat())
-                .order("measured_at", desc=False)
-                .execute()
-            )
+            rows: List[Dict[str, Any]] = []
+            offset = 0
+            while True:
+                query = (
+                    self.client.table("health_logs")
+                    .select("measured_at, weight, temperature")
+                    .eq("animal_id", animal_id)
+                )
+                if days is not None:
+                    since = datetime.utcnow() - timedelta(days=days - 1)
+                    query = query.gte("measured_at", since.isoformat())
+                response = (
+                    query.order("measured_at", desc=False)
+                    .range(offset, offset + self.HEALTH_LOG_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = response.data or []
+                rows.extend(page)
+                if len(page) < self.HEALTH_LOG_PAGE_SIZE:
+                    break
+                offset += self.HEALTH_LOG_PAGE_SIZE
 
             logs: List[Dict[str, Any]] = []
-            for row in response.data or []:
+            for row in rows:
                 try:
                     dt = datetime.fromisoformat(row["measured_at"].replace("Z", "+00:00"))
                 except Exception:
@@ -185,6 +288,46 @@ class SupabaseDatabase(BaseDatabase):
             print(f"Sağlık geçmişi okunurken hata: {e}")
             return []
 
+    def get_herd_health_logs(self, days: Optional[int] = 365) -> Dict[str, List[Any]]:
+        """
+        Tüm sürünün son N günlük ateş kayıtlarını sütun bazlı getir (salgın taraması için).
+        Satır başına sözlük/datetime oluşturmamak için ham sütunlar döner.
+
+        Returns:
+            {"animal_id": [...], "measured_at": [ISO metin, ...], "temperature": [...]}
+        """
+        columns: Dict[str, List[Any]] = {"animal_id": [], "measured_at": [], "temperature": []}
+        if not self.client:
+            return columns
+
+        try:
+            offset = 0
+            while True:
+                query = (
+                    self.client.table("health_logs")
+                    .select("animal_id, measured_at, temperature")
+                    .not_.is_("temperature", "null")
+                )
+                if days is not None:
+                    since = datetime.utcnow() - timedelta(days=days - 1)
+                    query = query.gte("measured_at", since.isoformat())
+                response = (
+                    query.order("measured_at", desc=False)
+                    .range(offset, offset + self.HEALTH_LOG_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = response.data or []
+                for row in page:
+                    columns["animal_id"].append(row.get("animal_id"))
+                    columns["measured_at"].append(row.get("measured_at"))
+                    columns["temperature"].append(row.get("temperature"))
+                if len(page) < self.HEALTH_LOG_PAGE_SIZE:
+                    break
+                offset += self.HEALTH_LOG_PAGE_SIZE
+        except Exception as e:
+            print(f"Sürü sağlık geçmişi okunurken hata: {e}")
+        return columns
+
     def _to_animal(self, item: Dict[str, Any]) -> Animal:
         """Supabase satırını Animal modeline dönüştür."""
         mapped = {
@@ -200,6 +343,9 @@ class SupabaseDatabase(BaseDatabase):
             "temperature": item.get("temperature"),
             "baseline_weight": item.get("baseline_weight"),
         }
+        # health_status sütunu eski tablolarda olmayabilir
+        if item.get("health_status"):
+            mapped["saglik_durumu"] = item["health_status"]
         return Animal(mapped)
 
     def _from_animal(self, animal: Animal) -> Dict[str, Any]:
@@ -303,17 +449,25 @@ class SupabaseDatabase(BaseDatabase):
             print(f"Supabase fotoğraf silme hatası: {e}")
             return False
     
-    def list_photos(self, animal_id: str) -> List[Dict[str, Any]]:
+    def list_photos(self, animal_id: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
-        Supabase Storage'dan bir hayvana ait tüm fotoğrafları listeler.
+        Supabase Storage'dan bir hayvana ait fotoğrafların bir sayfasını listeler.
+        Dosyalar isme (yyyy-MM-dd_ önekiyle tarihe) göre sıralı döner.
         Her fotoğraf için: {'name': dosya_adı, 'url': public_url, 'date': tarih}
         """
         BUCKET_NAME = "hayvan_foto"
         folder_path = f"{animal_id}/"
         
         try:
-            # Klasördeki tüm dosyaları listele
-            files = self.client.storage.from_(BUCKET_NAME).list(folder_path)
+            # Klasördeki dosyaların sadece istenen sayfasını listele
+            files = self.client.storage.from_(BUCKET_NAME).list(
+                folder_path,
+                {
+                    "limit": limit,
+                    "offset": offset,
+                    "sortBy": {"column": "name", "order": "asc"},
+                },
+            )
             
             photos = []
             for file_info in files:
@@ -0,0 +1,372 @@
+"""
+Kalıcı hayvan detay paneli.
+
+Widget'lar bir kez oluşturulur; hayvan seçimi değiştiğinde sadece veriler
+(metinler, ikonlar, durum property'leri) yeniden bağlanır.
+"""
+from typing import Optional
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+                             QLabel, QPushButton)
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+
+from models.animal import Animal
+from utils.health_analyzer import HealthAnalyzer
+from utils.anomaly_detector import get_anomaly_detector
+from ui_resources import DETAIL_PANEL_STYLE, asset_pixmap
+
+# Uyarı ikonu -> assets altındaki görsel
+ALERT_ICON_ASSETS = {
+    "🔥": "termometre.png",
+    "🌡️": "termometre.png",
+    "⚖️": "kilo_kayip.png",
+}
+
+STATUS_TEXTS = {
+    "CRITICAL": ("KRİTİK", "🔴 KRİTİK"),
+    "WARNING": ("UYARI", "🟡 UYARI"),
+    "GOOD": ("İYİ", "✅ İYİ"),
+}
+
+# Aynı anda gösterilebilecek en fazla uyarı kartı
+MAX_ALERTS = 4
+
+TEMPERATURE_PREFIXES = {
+    "CRITICAL": "🔴",
+    "WARNING": "🟡",
+}
+
+
+def _set_state(widget: QWidget, name: str, value: str):
+    """Dinamik stil property'sini sadece değiştiyse güncelle ve widget'ı yeniden polish et."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class _InfoCell(QWidget):
+    """Bilgi grid'indeki tek bir kart (başlık + değer)."""
+
+    def __init__(self, caption: str):
+        super().__init__()
+        self.setObjectName("infoCell")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        layout.setContentsMargins(10, 8, 10, 8)
+        layout.setSpacing(5)
+
+        caption_label = QLabel(caption)
+        caption_label.setObjectName("infoCaption")
+        caption_label.setFont(QFont("Arial", 12))
+        layout.addWidget(caption_label)
+
+        self.value_label = QLabel()
+        self.value_label.setObjectName("infoValue")
+        self.value_label.setFont(QFont("Arial", 16, QFont.Bold))
+        layout.addWidget(self.value_label)
+
+    def set_value(self, text: str, status: str = ""):
+        if self.value_label.text() != text:
+            self.value_label.setText(text)
+        _set_state(self.value_label, "status", status)
+
+
+class _AlertCard(QWidget):
+    """Tek bir sağlık uyarısı kartı (ikon + mesaj)."""
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("alertCard")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setMinimumHeight(40)
+        self._icon_key = None
+
+        layout = QHBoxLayout()
+        self.setLayout(layout)
+        layout.setContentsMargins(12, 8, 12, 8)
+        layout.setSpacing(12)
+
+        self.icon_label = QLabel()
+        self.icon_label.setAlignment(Qt.AlignCenter)
+        self.icon_label.setFixedWidth(28)
+        self.icon_label.setFont(QFont("Arial", 18))
+        layout.addWidget(self.icon_label)
+
+        self.message_label = QLabel()
+        self.message_label.setObjectName("alertMessage")
+        self.message_label.setFont(QFont("Arial", 15, QFont.Bold))
+        self.message_label.setWordWrap(True)
+        self.message_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        layout.addWidget(self.message_label, 1)
+
+    def set_alert(self, alert):
+        level = "CRITICAL" if alert["type"] == "CRITICAL" else "WARNING"
+        _set_state(self, "level", level)
+        _set_state(self.message_label, "level", level)
+        self.message_label.setText(alert["message"])
+
+        icon_text = alert.get("icon", "⚠️")
+        if icon_text != self._icon_key:
+            self._icon_key = icon_text
+            asset = ALERT_ICON_ASSETS.get(icon_text)
+            pix = asset_pixmap(asset, 22) if asset else None
+            if pix is not None and not pix.isNull():
+                self.icon_label.setPixmap(pix)
+            else:
+                self.icon_label.clear()
+                self.icon_label.setText(icon_text)
+
+
+class AnimalDetailPanel(QWidget):
+    """Seçili hayvanın detaylarını gösteren, widget'ları yeniden kullanılan panel."""
+
+    photos_requested = pyqtSignal(object)
+    trend_requested = pyqtSignal(object)
+    log_requested = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.animal: Optional[Animal] = None
+        self.setStyleSheet(DETAIL_PANEL_STYLE)
+
+        root_layout = QVBoxLayout()
+        root_layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(root_layout)
+
+        self.welcome_label = QLabel("Lütfen listeden bir hayvan seçin veya yeni hayvan ekleyin")
+        self.welcome_label.setObjectName("welcomeLabel")
+        self.welcome_label.setFont(QFont("Arial", 12))
+        self.welcome_label.setAlignment(Qt.AlignCenter)
+        root_layout.addWidget(self.welcome_label)
+
+        self.content = QWidget()
+        content_layout = QVBoxLayout()
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content.setLayout(content_layout)
+        root_layout.addWidget(self.content)
+        root_layout.addStretch()
+
+        content_layout.addWidget(self._create_name_card())
+        content_layout.addSpacing(10)
+        content_layout.addWidget(self._create_alerts_box())
+        content_layout.addWidget(self._create_info_box())
+        content_layout.addWidget(self._create_notes_box())
+        content_layout.addSpacing(20)
+        content_layout.addWidget(self._create_buttons())
+
+        self.show_welcome()
+
+    # -------- Widget'ların tek seferlik oluşturulması --------
+
+    def _create_name_card(self):
+        card = QWidget()
+        card.setObjectName("nameCard")
+        card.setAttribute(Qt.WA_StyledBackground, True)
+
+        header_layout = QHBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.name_label = QLabel()
+        self.name_label.setObjectName("nameLabel")
+        self.name_label.setFont(QFont("Arial", 26, QFont.Bold))
+        header_layout.addWidget(self.name_label)
+        header_layout.addStretch()
+
+        self.health_badge = QLabel()
+        self.health_badge.setObjectName("healthBadge")
+        self.health_badge.setFont(QFont("Arial", 13, QFont.Bold))
+        self.health_badge.setAlignment(Qt.AlignCenter)
+        self.health_badge.setMinimumWidth(110)
+        header_layout.addWidget(self.health_badge)
+
+        self.summary_label = QLabel()
+        self.summary_label.setObjectName("summaryLabel")
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(35, 30, 35, 25)
+        layout.setSpacing(6)
+        layout.addLayout(header_layout)
+        layout.addWidget(self.summary_label)
+        card.setLayout(layout)
+        return card
+
+    def _create_alerts_box(self):
+        self.alerts_box = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+        self.alerts_box.setLayout(layout)
+
+        alerts_title = QLabel("⚠️ Sağlık Uyarıları")
+        alerts_title.setObjectName("sectionTitle")
+        alerts_title.setFont(QFont("Arial", 18, QFont.Bold))
+        layout.addWidget(alerts_title)
+
+        # Kural uyarıları (ateş, kilo) + hayvanın kendi geçmişine göre olağandışı bulgular
+        self.alert_cards = [_AlertCard() for _ in range(MAX_ALERTS)]
+        for card in self.alert_cards:
+            layout.addWidget(card)
+        return self.alerts_box
+
+    def _create_info_box(self):
+        box = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        box.setLayout(layout)
+
+        details_title = QLabel("📋 Hayvan Bilgileri")
+        details_title.setObjectName("sectionTitle")
+        details_title.setFont(QFont("Arial", 18, QFont.Bold))
+        layout.addWidget(details_title)
+
+        info_container = QWidget()
+        info_container.setObjectName("infoContainer")
+        info_container.setAttribute(Qt.WA_StyledBackground, True)
+        self.info_grid = QGridLayout()
+        info_container.setLayout(self.info_grid)
+        self.info_grid.setSpacing(15)
+        self.info_grid.setContentsMargins(15, 15, 15, 15)
+        layout.addWidget(info_container)
+
+        self.rfid_cell = _InfoCell("🏷️ RFID")
+        self.weight_cell = _InfoCell("⚖️ Kilo")
+        self.height_cell = _InfoCell("📏 Boy")
+        self.status_cell = _InfoCell("💊 Sağlık Durumu")
+        self.temperature_cell = _InfoCell("🌡️ Vücut Sıcaklığı")
+        self.baseline_cell = _InfoCell("📊 Profil Kilosu")
+        self._grid_cells = None
+        return box
+
+    def _create_notes_box(self):
+        self.notes_box = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 15, 0, 0)
+        self.notes_box.setLayout(layout)
+
+        notes_title = QLabel("📝 Notlar")
+        notes_title.setObjectName("sectionTitle")
+        notes_title.setFont(QFont("Arial", 14, QFont.Bold))
+        layout.addWidget(notes_title)
+
+        notes_card = QWidget()
+        notes_card.setObjectName("notesCard")
+        notes_card.setAttribute(Qt.WA_StyledBackground, True)
+        notes_layout = QVBoxLayout()
+        notes_card.setLayout(notes_layout)
+        notes_layout.setContentsMargins(10, 10, 10, 10)
+
+        self.notes_text = QLabel()
+        self.notes_text.setObjectName("notesText")
+        self.notes_text.setFont(QFont("Arial", 11))
+        self.notes_text.setWordWrap(True)
+        notes_layout.addWidget(self.notes_text)
+        layout.addWidget(notes_card)
+        return self.notes_box
+
+    def _create_buttons(self):
+        container = QWidget()
+        layout = QHBoxLayout()
+        container.setLayout(layout)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        buttons = [
+            ("📷 Fotoğrafları Görüntüle", "photosButton", self.photos_requested),
+            ("📈 Sağlık Grafiği", "trendButton", self.trend_requested),
+            ("➕ Ölçüm Ekle", "logButton", self.log_requested),
+        ]
+        for text, object_name, signal in buttons:
+            btn = QPushButton(text)
+            btn.setObjectName(object_name)
+            btn.setFont(QFont("Arial", 12, QFont.Bold))
+            btn.setCursor(Qt.PointingHandCursor)
+            # Buton her zaman o an gösterilen hayvan için sinyal yayar
+            btn.clicked.connect(lambda checked, s=signal: self.animal and s.emit(self.animal))
+            layout.addWidget(btn)
+        return container
+
+    # -------- Veri bağlama --------
+
+    def show_welcome(self):
+        """Hoş geldin mesajını göster"""
+        self.animal = None
+        self.content.hide()
+        self.welcome_label.show()
+
+    def show_animal(self, animal: Animal):
+        """Hayvan detaylarını mevcut widget'lara bağla"""
+        self.animal = animal
+
+        # AI Health Analysis - Sağlık durumunu analiz et
+        current_temperature = getattr(animal, 'temperature', None)
+        current_weight = float(animal.kilo) if animal.kilo else None
+        health_analysis = HealthAnalyzer.analyze_health(animal, current_temperature, current_weight)
+        status = health_analysis["health_status"]
+        badge_text, status_display = STATUS_TEXTS.get(status, STATUS_TEXTS["GOOD"])
+
+        # İsim kartı
+        self.name_label.setText(f"🐄 {animal.isim}")
+        self.health_badge.setText(badge_text)
+        _set_state(self.health_badge, "status", status)
+        self.summary_label.setText(
+            f"{animal.tur or 'Tür belirtilmemiş'} • "
+            f"{animal.cinsiyet or 'Cinsiyet belirtilmemiş'} • "
+            f"{animal.yas} yaşında"
+        )
+
+        # Uyarılar (son ölçüm hayvanın kendi geçmişine göre olağandışıysa onlar da)
+        alerts = health_analysis["alerts"] + get_anomaly_detector().alerts_for(animal.id)
+        for i, card in enumerate(self.alert_cards):
+            if i < len(alerts):
+                card.set_alert(alerts[i])
+                card.show()
+            else:
+                card.hide()
+        self.alerts_box.setVisible(bool(alerts))
+
+        # Bilgi kartları
+        self.rfid_cell.set_value(animal.rfid_tag or "Belirtilmemiş")
+        self.weight_cell.set_value(f"{animal.kilo} kg")
+        self.height_cell.set_value(f"{animal.boy} cm")
+        self.status_cell.set_value(status_display, status)
+        cells = [self.rfid_cell, self.weight_cell, self.height_cell, self.status_cell]
+
+        if current_temperature is not None:
+            temp_status = health_analysis["temperature_status"]["status"]
+            prefix = TEMPERATURE_PREFIXES.get(temp_status, "🌡️")
+            self.temperature_cell.set_value(
+                f"{prefix} {current_temperature}°C",
+                temp_status if temp_status in TEMPERATURE_PREFIXES else "",
+            )
+            cells.append(self.temperature_cell)
+
+        if getattr(animal, 'baseline_weight', None):
+            self.baseline_cell.set_value(f"{animal.baseline_weight} kg")
+            cells.append(self.baseline_cell)
+
+        self._layout_cells(cells)
+
+        # Notlar
+        if animal.notlar:
+            self.notes_text.setText(animal.notlar)
+        self.notes_box.setVisible(bool(animal.notlar))
+
+        self.welcome_label.hide()
+        self.content.show()
+
+    def _layout_cells(self, cells):
+        """Görünür bilgi kartlarını 2 sütunlu grid'e yerleştir (sadece küme değiştiyse)."""
+        if cells == self._grid_cells:
+            return
+        all_cells = [self.rfid_cell, self.weight_cell, self.height_cell,
+                     self.status_cell, self.temperature_cell, self.baseline_cell]
+        for cell in all_cells:
+            self.info_grid.removeWidget(cell)
+            cell.setVisible(cell in cells)
+        for i, cell in enumerate(cells):
+            self.info_grid.addWidget(cell, i // 2, i % 2)
+        self._grid_cells = cells
@@ -1,23 +1,46 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from login import LoginWindow
-from dashboard import Dashboard
+from utils.startup_trace import tracer
+
+with tracer.phase("import PyQt5"):
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+with tracer.phase("import login"):
+    from login import LoginWindow
+from config import STARTUP_CONFIG
 
 # Global değişkenler
 login_window = None
 dashboard_window = None
+# Veritabanı bağlantısı + hayvan önbelleği; dashboard kapansa da yaşar
+app_session = None
+
+def warm_up_session():
+    """Kullanıcı giriş bilgilerini yazarken bağlantıyı ve sürü listesini hazırla"""
+    global app_session
+    with tracer.phase("oturum hazırlığı başlatma"):
+        from app_session import AppSession
+        if app_session is None:
+            app_session = AppSession()
+        app_session.warm_up()
 
 def start_dashboard(username):
     """Giriş başarılı olduğunda dashboard'u başlat"""
     global login_window, dashboard_window
+    started_ms = tracer.elapsed_ms()
     
     # Login penceresini gizle
     if login_window:
         login_window.hide()
     
+    # Dashboard modülü (ve ağır bağımlılıkları) sadece girişten sonra yüklenir
+    with tracer.phase("import dashboard"):
+        from dashboard import Dashboard
+    
     # Dashboard'u oluştur ve göster
-    dashboard_window = Dashboard(username, on_logout=return_to_login)
-    dashboard_window.show()
+    with tracer.phase("Dashboard oluşturma"):
+        dashboard_window = Dashboard(username, on_logout=return_to_login, session=app_session)
+        dashboard_window.show()
+    tracer.check_budget("Dashboard açılışı", STARTUP_CONFIG["dashboard_budget_ms"], started_ms)
 
 
 def return_to_login():
@@ -28,6 +51,10 @@ def return_to_login():
         dashboard_window.close()
         dashboard_window = None
     
+    # Bağlantı korunur; sadece eskimişse sürü listesi arka planda tazelenir
+    if app_session is not None:
+        app_session.warm_up()
+    
     if login_window is None:
         login_window = LoginWindow(start_dashboard)
     else:
@@ -39,14 +66,39 @@ def return_to_login():
     login_window.show()
     login_window.raise_()
 
+def stop_rfid_service():
+    """Uygulama kapanırken (açıldıysa) RFID okuyucu portunu kapat"""
+    if "serial_reader" in sys.modules:
+        sys.modules["serial_reader"].stop_rfid_service()
+
+def save_anomaly_state():
+    """Uygulama kapanırken (yüklendiyse) anomali dedektörünün son durumunu diske yaz"""
+    if "utils.anomaly_detector" in sys.modules:
+        sys.modules["utils.anomaly_detector"].get_anomaly_detector().save_if_dirty()
+
+def on_login_painted():
+    """Giriş ekranı ilk kez çizildiğinde açılış süresini raporla"""
+    tracer.mark("giriş ekranı çizildi")
+    tracer.check_budget("Giriş ekranı açılışı", STARTUP_CONFIG["login_budget_ms"])
+
 def main():
     """Ana uygulama"""
     global login_window
     
-    app = QApplication(sys.argv)
+    with tracer.phase("QApplication oluşturma"):
+        app = QApplication(sys.argv)
     
-    login_window = LoginWindow(start_dashboard)
-    login_window.show()
+    with tracer.phase("LoginWindow oluşturma"):
+        login_window = LoginWindow(start_dashboard)
+        login_window.show()
+    # Olay döngüsünün ilk turunda (pencere çizildikten sonra) ölç
+    QTimer.singleShot(0, on_login_painted)
+    # Giriş ekranı çizildikten sonra bağlantıyı arka planda kur
+    QTimer.singleShot(0, warm_up_session)
+    # Açık kalan RFID portunu kapanışta bırak
+    app.aboutToQuit.connect(stop_rfid_service)
+    # Son kayıttan sonraki ölçümler kaybolmasın
+    app.aboutToQuit.connect(save_anomaly_state)
     
     sys.exit(app.exec_())
 
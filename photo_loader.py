@@ -0,0 +1,198 @@
+"""
+Arka planda fotoğraf indirme ve küçük resim (thumbnail) hattı.
+
+İndirmeler QThreadPool üzerinde, paylaşımlı bir HTTP oturumu ve kalıcı disk
+önbelleği (utils.photo_cache) ile yapılır. Görseller worker thread'lerinde QImage
+olarak çözülüp ölçeklenir; sabit boyutlu küçük resimler diske bir kez yazılır.
+Arayüz thread'inde QPixmap'e çevrilen sonuçlar, bellek bütçeli süreç geneli
+QPixmapCache'te tutulur.
+"""
+from pathlib import Path
+from typing import List, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+
+from config import PHOTO_CONFIG
+from utils.photo_cache import PhotoDiskCache, create_session
+
+
+def _decode(data: bytes) -> Optional[QImage]:
+    image = QImage()
+    if not data or not image.loadFromData(data):
+        return None
+    return image
+
+
+class ThumbnailStore:
+    """
+    Sabit genişliklerdeki küçük resimleri URL anahtarıyla diskte saklar.
+    Dosyalar disk önbelleğinin boyut sınırına sayılır ve URL'nin içeriğiyle birlikte silinir.
+    """
+
+    def __init__(self, cache: PhotoDiskCache, sizes: List[int]):
+        self.cache = cache
+        self.thumb_dir = cache.thumb_dir
+        self.thumb_dir.mkdir(parents=True, exist_ok=True)
+        self.sizes = sorted(sizes)
+
+    def _path(self, url: str, size: int) -> Path:
+        return self.thumb_dir / f"{PhotoDiskCache.key_for(url)}_{size}.jpg"
+
+    def load(self, url: str, size: int) -> Optional[QImage]:
+        path = self._path(url, size)
+        if not path.exists():
+            return None
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        # LRU: kullanılan küçük resim kaydını taze tutar
+        PhotoDiskCache._touch(path)
+        return image
+
+    def generate(self, url: str, image: QImage) -> dict:
+        """Tam boyutlu görselden tüm küçük resim boyutlarını üret ve diske yaz."""
+        thumbs = {}
+        for size in self.sizes:
+            thumb = image
+            if image.width() > size:
+                thumb = image.scaledToWidth(size, Qt.SmoothTransformation)
+            path = self._path(url, size)
+            old_size = path.stat().st_size if path.exists() else 0
+            if thumb.save(str(path), "JPG", 85):
+                self.cache.add_thumbnail(path, old_size)
+            else:
+                print(f"Küçük resim kaydedilemedi: {url} ({size})")
+            thumbs[size] = thumb
+        return thumbs
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, loader: "PhotoLoader", url: str, size: int, data: Optional[bytes] = None):
+        super().__init__()
+        self.loader = loader
+        self.url = url
+        self.size = size
+        self.data = data
+
+    def run(self):
+        image = None
+        try:
+            if self.data is None:
+                # Daha önce üretilmiş küçük resim varsa ağa ve tam boyutlu çözmeye gerek yok
+                image = self.loader.thumbnails.load(self.url, self.size)
+            if image is None:
+                data = self.data if self.data is not None else self.loader.cache.fetch(self.url)
+                full = _decode(data)
+                if full is not None:
+                    image = self.loader.thumbnails.generate(self.url, full).get(self.size)
+        except Exception as e:
+            print(f"Küçük resim hatası: {e}")
+            image = None
+        self.loader._finish_thumbnail(self.url, self.size, image)
+
+
+class _FullImageTask(QRunnable):
+    def __init__(self, loader: "PhotoLoader", url: str):
+        super().__init__()
+        self.loader = loader
+        self.url = url
+
+    def run(self):
+        try:
+            image = _decode(self.loader.cache.fetch(self.url))
+        except Exception as e:
+            print(f"Fotoğraf yükleme hatası: {e}")
+            image = None
+        self.loader._finish_full(self.url, image)
+
+
+class PhotoLoader(QObject):
+    """Fotoğrafları eşzamanlı, önbellekli indirir ve küçük resimlerini üretir."""
+
+    # url, genişlik, QImage
+    thumbnail_ready = pyqtSignal(str, int, QImage)
+    # url, tam boyutlu QImage
+    full_image_ready = pyqtSignal(str, QImage)
+    # url, hata mesajı
+    photo_failed = pyqtSignal(str, str)
+
+    def __init__(self, cache: PhotoDiskCache, thumbnails: ThumbnailStore, max_workers: int = 4):
+        super().__init__()
+        self.cache = cache
+        self.thumbnails = thumbnails
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_workers)
+        self._pending: Set[tuple] = set()
+
+    @staticmethod
+    def pixmap_key(url: str, size: int) -> str:
+        return f"{url}@{size}"
+
+    def cached_pixmap(self, url: str, size: int) -> Optional[QPixmap]:
+        """Bellekteki (QPixmapCache) küçük resmi döndür, yoksa None."""
+        return QPixmapCache.find(self.pixmap_key(url, size))
+
+    def request_thumbnail(self, url: str, size: int):
+        """Küçük resmi kuyruğa ekle; hazır olunca thumbnail_ready yayılır."""
+        key = (url, size)
+        if not url or key in self._pending:
+            return
+        self._pending.add(key)
+        self.pool.start(_ThumbnailTask(self, url, size))
+
+    def request_full(self, url: str):
+        """Tam boyutlu görseli sadece kullanıcı açtığında çöz."""
+        key = (url, None)
+        if not url or key in self._pending:
+            return
+        self._pending.add(key)
+        self.pool.start(_FullImageTask(self, url))
+
+    def add_uploaded(self, url: str, data: bytes):
+        """Yeni yüklenen dosyayı önbelleğe al ve küçük resimlerini yükleme anında üret."""
+        self.cache.store(url, data)
+        size = self.thumbnails.sizes[0]
+        self._pending.add((url, size))
+        self.pool.start(_ThumbnailTask(self, url, size, data))
+
+    def _finish_thumbnail(self, url: str, size: int, image: Optional[QImage]):
+        # Worker thread'inden çağrılır; sinyaller arayüz thread'ine kuyruklanır
+        self._pending.discard((url, size))
+        if image is None:
+            self.photo_failed.emit(url, "Fotoğraf indirilemedi")
+        else:
+            self.thumbnail_ready.emit(url, size, image)
+
+    def _finish_full(self, url: str, image: Optional[QImage]):
+        self._pending.discard((url, None))
+        if image is None:
+            self.photo_failed.emit(url, "Fotoğraf indirilemedi")
+        else:
+            self.full_image_ready.emit(url, image)
+
+    def _on_thumbnail_ready(self, url: str, size: int, image: QImage):
+        # Arayüz thread'inde: QPixmap'e çevir ve süreç geneli önbelleğe koy
+        QPixmapCache.insert(self.pixmap_key(url, size), QPixmap.fromImage(image))
+
+
+_photo_loader: Optional[PhotoLoader] = None
+
+
+def get_photo_loader() -> PhotoLoader:
+    """Uygulama genelinde paylaşılan fotoğraf yükleyicisini döndür."""
+    global _photo_loader
+    if _photo_loader is None:
+        max_workers = PHOTO_CONFIG["max_workers"]
+        cache = PhotoDiskCache(
+            PHOTO_CONFIG["cache_dir"],
+            max_bytes=PHOTO_CONFIG["cache_max_mb"] * 1024 * 1024,
+            session=create_session(max_workers),
+            timeout=PHOTO_CONFIG["timeout"],
+        )
+        thumbnails = ThumbnailStore(cache, PHOTO_CONFIG["thumbnail_sizes"])
+        QPixmapCache.setCacheLimit(PHOTO_CONFIG["pixmap_cache_mb"] * 1024)
+        _photo_loader = PhotoLoader(cache, thumbnails, max_workers)
+        # İlk bağlantı: diğer alıcılardan önce önbelleğe yazılsın
+        _photo_loader.thumbnail_ready.connect(_photo_loader._on_thumbnail_ready)
+    return _photo_loader
@@ -1,80 +1,352 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
 import serial
-import serial.tools.list_ports
 import time
 
+from config import SERIAL_CONFIG
+from utils.port_discovery import PortDiscovery, get_port_discovery
+from utils.rfid_frames import create_parser
+
+
+class TagEvent:
+    """Bir okuyucudan gelen tek kart okuması"""
+
+    __slots__ = ("tag", "reader_id", "timestamp")
+
+    def __init__(self, tag: str, reader_id: str, timestamp: float):
+        self.tag = tag
+        self.reader_id = reader_id
+        # Çerçevenin tamamlandığı an (time.time(), okuyucu thread'inde)
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"TagEvent({self.tag!r}, {self.reader_id!r}, {self.timestamp:.3f})"
+
+
 class SerialReader(QThread):
-    rfid_read = pyqtSignal(str)
-    error_occurred = pyqtSignal(str)
+    """
+    Tek bir RFID okuyucusunu (Arduino) sürekli dinler: port bir kez açılır, açık kalır
+    ve okunan kartlar yayılır. Aynı kartın kısa süre içindeki tekrarları (geçitte
+    hayvan beklerken saniyede birkaç kez okunur) bu thread'de elenir.
+    Bağlantı koparsa yeniden bağlanır; keep_retrying=False ise cihaz çıkarıldığında
+    thread sona erer.
+
+    sink verilirse okumalar sinyal yerine doğrudan sink(List[TagEvent]) ile (bu
+    thread'den) teslim edilir; RfidReaderService toplu teslimat için bunu kullanır.
+    """
+    tag_events = pyqtSignal(list)  # List[TagEvent] (bir okuma parçasındaki kartlar)
+    error_occurred = pyqtSignal(str, str)  # okuyucu id, mesaj
+    connection_changed = pyqtSignal(str, bool)  # okuyucu id, bağlı mı
 
-    def __init__(self):
+    def __init__(self, port: str, reader_id: Optional[str] = None, keep_retrying: bool = True,
+                 discovery: Optional[PortDiscovery] = None,
+                 sink: Optional[Callable[[List[TagEvent]], None]] = None,
+                 protocol: Optional[str] = None, baudrate: Optional[int] = None):
         super().__init__()
         self.is_running = True
-        self.port = self.find_arduino()
-
-    def find_arduino(self):
-        print("--- PORT TARAMASI BAŞLADI ---")
-        ports = list(serial.tools.list_ports.comports())
-        found_port = None
-        
-        # Tüm portları yazdır (Görmemiz için)
-        for p in ports:
-            print(f"Bulunan Cihaz: {p.device} - {p.description}")
-            
-            # Mac için usbserial veya usbmodem
-            if "usbmodem" in p.device or "usbserial" in p.device or \
-               "Arduino" in p.description or "CH340" in p.description:
-                found_port = p.device
-        
-        if found_port:
-            print(f"--> SEÇİLEN PORT: {found_port}")
-        else:
-            print("--> HİÇBİR UYGUN PORT BULUNAMADI!")
-            
-        print("-------------------------------")
-        return found_port
+        self.port = port
+        self.reader_id = reader_id or os.path.basename(port)
+        # Okuyucunun gönderdiği biçim (utils.rfid_frames); geçersiz çerçeveler orada elenir
+        self.protocol = protocol or SERIAL_CONFIG["protocol"]
+        self.baudrate = baudrate or SERIAL_CONFIG["baudrate"]
+        self.keep_retrying = keep_retrying
+        self.discovery = discovery or get_port_discovery()
+        self.sink = sink
+        self.dedup_seconds = SERIAL_CONFIG["dedup_seconds"]
+        # Kart -> son kabul edildiği an (time.monotonic)
+        self._last_seen: Dict[str, float] = {}
+        self._serial = None
 
     def run(self):
-        if not self.port:
-            self.error_occurred.emit("Arduino bulunamadı! Kabloyu kontrol edin.")
-            print("HATA: Port yok, işlem iptal edildi.")
-            return
+        port = self.port
+        while self.is_running:
+            print(f"[{self.reader_id}] BAĞLANTI BAŞLATILIYOR: {port} @ {self.baudrate} baud")
+            try:
+                with serial.Serial(port, self.baudrate,
+                                   timeout=SERIAL_CONFIG["read_timeout_seconds"]) as ser:
+                    self._serial = ser
+                    # Port açılınca Arduino yeniden başlar; bu bekleme bağlantı başına bir kez
+                    self._sleep(SERIAL_CONFIG["reset_delay_seconds"])
+                    ser.reset_input_buffer()
+                    print(f"[{self.reader_id}] BAĞLANTI BAŞARILI! Veri bekleniyor...")
+                    self.connection_changed.emit(self.reader_id, True)
+                    self._read_loop(ser)
+            except Exception as e:
+                error_msg = f"Bağlantı Hatası: {str(e)}"
+                print(f"[{self.reader_id}] {error_msg}")
+                self.error_occurred.emit(self.reader_id, error_msg)
+                # Kablo çıkmış olabilir; kayıtlı port unutulur
+                self.discovery.port_failed(port)
+                if not self.keep_retrying and not self.discovery.is_present(port):
+                    # Cihaz tekrar takılınca keşif yeni bir okuyucu başlatır
+                    return
+                self._sleep(SERIAL_CONFIG["reconnect_seconds"])
+            finally:
+                self._serial = None
+                self.connection_changed.emit(self.reader_id, False)
+
+    def _read_loop(self, ser):
+        # Tek seferlik tampon; okunan parçalar buraya yazılır, çerçeveleyici biriktirir
+        buffer = bytearray(SERIAL_CONFIG["read_chunk_bytes"])
+        view = memoryview(buffer)
+        parser = create_parser(self.protocol, SERIAL_CONFIG)
+        reader_id = self.reader_id
+        while self.is_running:
+            # Bekleyen veri yoksa ilk bayt (veya zaman aşımı) gelene kadar bloklanır;
+            # varsa tamamı tek çağrıda alınır. Uyku/yoklama yok.
+            size = min(ser.in_waiting or 1, len(buffer))
+            count = ser.readinto(view[:size])
+            if not count:
+                continue
+            now = time.time()
+            events = [TagEvent(tag, reader_id, now)
+                      for tag in parser.feed(view[:count]) if not self._is_repeat(tag)]
+            if events:
+                if self.sink is not None:
+                    self.sink(events)
+                else:
+                    self.tag_events.emit(events)
+
+    def _is_repeat(self, tag: str) -> bool:
+        """Kart bu okuyucuda dedup_seconds içinde zaten kabul edildiyse True"""
+        now = time.monotonic()
+        last_seen = self._last_seen
+        previous = last_seen.get(tag)
+        if previous is not None and now - previous < self.dedup_seconds:
+            return True
+        last_seen[tag] = now
+        # Geçen hayvanlar birikmesin: ara sıra süresi dolanları at
+        if len(last_seen) > 1024:
+            self._last_seen = {t: seen for t, seen in last_seen.items()
+                               if now - seen < self.dedup_seconds}
+        return False
+
+    def _sleep(self, seconds: float):
+        """stop() çağrılınca hemen uyanan bekleme"""
+        deadline = time.monotonic() + seconds
+        while self.is_running and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def request_stop(self):
+        """Beklemeden durmasını iste (birden çok okuyucu birlikte durdurulurken)"""
+        self.is_running = False
+        # Bloklayan okumayı zaman aşımını beklemeden uyandır (destekleyen platformlarda)
+        ser = self._serial
+        if ser is not None and hasattr(ser, "cancel_read"):
+            try:
+                ser.cancel_read()
+            except Exception:
+                pass
+
+    def stop(self):
+        self.request_stop()
+        print(f"[{self.reader_id}] Okuyucu durduruldu.")
+        self.wait()
+
+
+class _ReaderDiscovery(QThread):
+    """Takılı okuyucuları bulur ve yeni takılanları bildirir (arayüz thread'ini bekletmez)"""
+    ports_found = pyqtSignal(list)
+
+    def __init__(self, discovery: PortDiscovery):
+        super().__init__()
+        self.discovery = discovery
+        self.is_running = True
+
+    def run(self):
+        # Kayıtlı portlar varsa tarama yapılmaz; tam tarama sadece kayıtlı port yoksa,
+        # kayıtlı bir port açılamadığında/koptuğunda veya cihaz takılıp çıkarıldığında
+        discovery = self.discovery
+        discovery.rescan_requested.clear()
+        self.ports_found.emit(discovery.cached_ports() or discovery.rescan())
+        while self.is_running:
+            changed = discovery.wait_for_change(
+                60, lambda: self.is_running and not discovery.rescan_requested.is_set()
+            )
+            if not self.is_running:
+                break
+            if changed or discovery.rescan_requested.is_set():
+                discovery.rescan_requested.clear()
+                self.ports_found.emit(discovery.rescan())
 
-        print(f"BAĞLANTI BAŞLATILIYOR: {self.port} @ 9600 baud")
-        try:
-            with serial.Serial(self.port, 9600, timeout=1) as ser:
-                time.sleep(2) # Reset için bekle
-                print("BAĞLANTI BAŞARILI! Veri bekleniyor...")
-                
-                ser.reset_input_buffer()
-                
-                while self.is_running:
-                    if ser.in_waiting > 0:
-                        try:
-                            # Gelen ham veriyi oku
-                            raw_data = ser.readline()
-                            line = raw_data.decode('utf-8', errors='ignore').strip()
-                            
-                            # Terminale ne duyduğunu yazsın
-                            print(f"GELEN VERİ: '{line}'")
-                            
-                            # Filtreleme (Boş veya gereksiz verileri atla)
-                            if not line or len(line) < 4:
-                                continue
-                                
-                            print(f"--> GEÇERLİ ID BULUNDU: {line}")
-                            self.rfid_read.emit(line)
-                            break 
-                        except Exception as e:
-                            print(f"Okuma Hatası: {e}")
-                            continue
-                    time.sleep(0.1)
-        except Exception as e:
-            error_msg = f"Bağlantı Hatası: {str(e)}"
-            print(error_msg)
-            self.error_occurred.emit(error_msg)
-    
     def stop(self):
         self.is_running = False
-        print("Okuyucu durduruldu.")
-        self.wait()
\ No newline at end of file
+        self.wait()
+
+
+class RfidReaderService(QObject):
+    """
+    Uygulama boyunca yaşayan RFID okuyucu yöneticisi. Yapılandırılan (veya takılı
+    bulunan) her okuyucu kendi thread'inde açık kalır; okumalar tek akışta birleşir.
+    Bir okuyucunun kopması diğerlerini etkilemez.
+
+    Okumalar arayüze satır başına bir sinyal yerine kısa aralıklarla (batch_interval_ms)
+    toplu teslim edilir; yoğun geçitte olay döngüsü dolmaz.
+
+    Dashboard araması ve AnimalDialog gibi kullanıcılar kendi thread'ini açmak yerine
+    subscribe()/unsubscribe() ile abone olur (her toplu teslimatta en son okunan kart);
+    tüm okumalar, okuyucu ve zaman bilgisi gerekenler tag_events sinyalini dinler.
+    """
+    tag_read = pyqtSignal(str)
+    tag_events = pyqtSignal(list)  # List[TagEvent], okuma sırasıyla
+    error_occurred = pyqtSignal(str)
+    connection_changed = pyqtSignal(bool)  # en az bir okuyucu bağlı mı
+
+    # Okuyucu thread'lerinden: bekleyen okumalar var (toplu teslimat başına bir kez)
+    _batch_ready = pyqtSignal()
+
+    def __init__(self, config: Dict = None):
+        super().__init__()
+        self.config = config or SERIAL_CONFIG
+        self.discovery = get_port_discovery()
+        self._readers: Dict[str, SerialReader] = {}  # port -> okuyucu
+        self._discovery_thread: Optional[_ReaderDiscovery] = None
+        self._subscribers: List[Tuple[Callable, Optional[Callable]]] = []
+        self._connected_readers: Set[str] = set()
+        self.connected = False
+        # Bağlı değilken son hata; sonradan abone olanlara da hemen bildirilir
+        self.last_error: Optional[str] = None
+        # Okuyucu thread'lerinin biriktirdiği, henüz teslim edilmemiş okumalar
+        self._pending: List[TagEvent] = []
+        self._pending_lock = threading.Lock()
+        self._batch_ready.connect(self._schedule_flush)
+
+    def subscribe(self, on_tag: Callable, on_error: Optional[Callable] = None):
+        """Okunan kartları on_tag(rfid) ile almaya başla; okuyucular çalışmıyorsa başlat"""
+        if (on_tag, on_error) not in self._subscribers:
+            self.tag_read.connect(on_tag)
+            if on_error is not None:
+                self.error_occurred.connect(on_error)
+            self._subscribers.append((on_tag, on_error))
+        self.start()
+        if on_error is not None and not self.connected and self.last_error:
+            on_error(self.last_error)
+
+    def unsubscribe(self, on_tag: Callable, on_error: Optional[Callable] = None):
+        """Aboneliği bırak (portlar açık kalır; sonraki okuma beklemesiz başlar)"""
+        if (on_tag, on_error) not in self._subscribers:
+            return
+        self._subscribers.remove((on_tag, on_error))
+        self.tag_read.disconnect(on_tag)
+        if on_error is not None:
+            self.error_occurred.disconnect(on_error)
+
+    def start(self):
+        """Okuyucuları (çalışmıyorsa) başlat"""
+        if self.is_running():
+            return
+        configured = self.config.get("readers") or []
+        if configured:
+            # Sabit okuyucular: keşif yok, kopan okuyucu hep yeniden denenir
+            for item in configured:
+                self._start_reader(item["port"], item.get("id"), keep_retrying=True,
+                                   protocol=item.get("protocol"), baudrate=item.get("baudrate"))
+            return
+        self._discovery_thread = _ReaderDiscovery(self.discovery)
+        self._discovery_thread.ports_found.connect(self._on_ports_found)
+        self._discovery_thread.start()
+
+    def stop(self):
+        """Tüm portları kapat (uygulama kapanırken)"""
+        if self._discovery_thread is not None:
+            self._discovery_thread.stop()
+            self._discovery_thread = None
+        readers = list(self._readers.values())
+        # Önce hepsine haber ver, sonra bekle: kapanış okuyucu sayısıyla uzamaz
+        for reader in readers:
+            reader.request_stop()
+        for reader in readers:
+            reader.wait()
+        self._readers.clear()
+        self._connected_readers.clear()
+        self.connected = False
+
+    def is_running(self) -> bool:
+        """Okuyucu/keşif çalışıyor mu (port bekleniyor/yeniden deneniyorsa da True)"""
+        if self._discovery_thread is not None and self._discovery_thread.isRunning():
+            return True
+        return any(reader.isRunning() for reader in self._readers.values())
+
+    def reader_ids(self) -> List[str]:
+        """Çalışan okuyucular"""
+        return [reader.reader_id for reader in self._readers.values() if reader.isRunning()]
+
+    def _start_reader(self, port: str, reader_id: Optional[str] = None, keep_retrying: bool = False,
+                      protocol: Optional[str] = None, baudrate: Optional[int] = None):
+        reader = self._readers.get(port)
+        if reader is not None and reader.isRunning():
+            return
+        reader = SerialReader(port, reader_id, keep_retrying, self.discovery,
+                              sink=self._enqueue, protocol=protocol, baudrate=baudrate)
+        reader.error_occurred.connect(self._on_error)
+        reader.connection_changed.connect(self._on_connection_changed)
+        self._readers[port] = reader
+        reader.start()
+
+    def _on_ports_found(self, ports: List[str]):
+        for port in ports:
+            self._start_reader(port)
+        if not ports and not self.reader_ids():
+            self._on_error(None, "Arduino bulunamadı! Kabloyu kontrol edin.")
+
+    def _enqueue(self, events: List[TagEvent]):
+        # Okuyucu thread'inde: sadece liste boşken arayüz thread'ine haber verilir
+        with self._pending_lock:
+            was_empty = not self._pending
+            self._pending.extend(events)
+        if was_empty:
+            self._batch_ready.emit()
+
+    def _schedule_flush(self):
+        QTimer.singleShot(self.config["batch_interval_ms"], self._flush)
+
+    def _flush(self):
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if len(batch) > 1:
+            # Farklı okuyuculardan gelenler okunma anına göre birleşir
+            batch.sort(key=lambda event: event.timestamp)
+        self.tag_events.emit(batch)
+        self.tag_read.emit(batch[-1].tag)
+
+    def _on_error(self, reader_id: Optional[str], message: str):
+        # Birden çok okuyucu varsa hangisinin koptuğu belli olsun
+        if reader_id is not None and len(self._readers) > 1:
+            message = f"{reader_id}: {message}"
+        if not self.connected:
+            self.last_error = message
+        self.error_occurred.emit(message)
+
+    def _on_connection_changed(self, reader_id: str, connected: bool):
+        if connected:
+            self._connected_readers.add(reader_id)
+        else:
+            self._connected_readers.discard(reader_id)
+        now_connected = bool(self._connected_readers)
+        if now_connected:
+            self.last_error = None
+        if now_connected != self.connected:
+            self.connected = now_connected
+            self.connection_changed.emit(now_connected)
+
+
+_rfid_service: Optional[RfidReaderService] = None
+
+
+def get_rfid_service() -> RfidReaderService:
+    """Uygulama genelinde paylaşılan RFID okuyucu yöneticisini döndür."""
+    global _rfid_service
+    if _rfid_service is None:
+        _rfid_service = RfidReaderService(SERIAL_CONFIG)
+    return _rfid_service
+
+
+def stop_rfid_service():
+    """Okuyucular hiç başlatıldıysa portları kapat (uygulama kapanışında)"""
+    if _rfid_service is not None:
+        _rfid_service.stop()
@@ -0,0 +1,174 @@
+"""
+RFID yolu ölçümü: simülatör -> SerialReader -> RfidReaderService -> kart araması.
+
+PtySimulator ile aynı süreçte sahte bir okuyucu açılır, servis bu porta bağlanır ve
+her teslim edilen okuma için hayvan aranır (varsayılan: AnimalCache.get_by_rfid,
+--db ile yerel veritabanının get_animal_by_rfid'i). Artan hızlarda:
+    - kartın porta yazılmasından hayvanın bulunmasına kadar geçen süre (p50/p95/p99)
+    - kayıp oranı
+ölçülür ve kayıpsız (%1 altı) taşınabilen en yüksek hız raporlanır. Donanım gerekmez.
+
+Kullanım:
+    python tools/rfid_benchmark.py
+    python tools/rfid_benchmark.py --rates 100,500,2000 --protocol rdm6300 --batch-ms 20
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+# Depo kökü (config, serial_reader, database için)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication, QTimer  # noqa: E402
+
+from config import DB_CONFIG, SERIAL_CONFIG  # noqa: E402
+from database.animal_cache import AnimalCache  # noqa: E402
+from models.animal import Animal  # noqa: E402
+from rfid_simulator import PtySimulator, make_tags  # noqa: E402
+
+
+def percentile(values, q: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def build_lookup(tags, use_db: bool):
+    """Kart -> hayvan arama fonksiyonu (bellek dizini veya yerel veritabanı)"""
+    animals = [Animal({"id": str(i), "kupe_no": f"TR{i:08d}", "tur": "İnek", "rfid_tag": tag})
+               for i, tag in enumerate(tags)]
+    if use_db:
+        # Gerçek veri dosyasına dokunmamak için geçici dosya
+        DB_CONFIG["local_file"] = os.path.join(tempfile.mkdtemp(), "animals.json")
+        from database.local_db import LocalDatabase
+        db = LocalDatabase()
+        with db._lock:
+            db.data = [animal.to_dict() for animal in animals]
+            db.save_data()
+        return db.get_animal_by_rfid
+    cache = AnimalCache()
+    cache.put_many(animals)
+    return cache.get_by_rfid
+
+
+class Benchmark:
+    def __init__(self, args):
+        self.args = args
+        self.tags = make_tags(args.animals, args.seed)
+        self.lookup = build_lookup(self.tags, args.db)
+        self.simulator = PtySimulator(args.link, args.protocol, self.tags,
+                                      noise=args.noise, seed=args.seed)
+        # Kart -> gönderim anları (aynı kart birden çok kez gönderilebilir)
+        self._sent = defaultdict(deque)
+        self._sent_lock = threading.Lock()
+        self.latencies = []
+        self.missing = 0
+        self.results = []
+
+    def on_sent(self, tag: str, sent_at: float):
+        with self._sent_lock:
+            self._sent[tag].append(sent_at)
+
+    def on_events(self, events):
+        lookup = self.lookup
+        for event in events:
+            animal = lookup(event.tag)
+            now = time.monotonic()
+            if animal is None:
+                self.missing += 1
+                continue
+            with self._sent_lock:
+                queue = self._sent.get(event.tag)
+                sent_at = queue.popleft() if queue else None
+            if sent_at is not None:
+                self.latencies.append(now - sent_at)
+
+    def run_steps(self, app, rates):
+        """Simülatör thread'i: her hızda bir adım, sonra arayüz döngüsünü bitir"""
+        for rate in rates:
+            self.latencies = []
+            with self._sent_lock:
+                self._sent.clear()
+            sent_before = self.simulator.sent
+            self.simulator.rate = rate
+            self.simulator.run(self.args.step_seconds, self.on_sent)
+            # Yoldaki son okumalar da gelsin
+            time.sleep(0.5 + self.args.batch_ms / 1000)
+            sent = self.simulator.sent - sent_before
+            received = len(self.latencies)
+            self.results.append((rate, sent, received, list(self.latencies)))
+        QTimer.singleShot(0, app.quit)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RFID okuma yolu gecikme/kapasite ölçümü")
+    parser.add_argument("--link", default="/tmp/visifarm-rfid-bench")
+    parser.add_argument("--protocol", default="line", choices=["line", "rdm6300", "binary"])
+    parser.add_argument("--rates", default="50,200,1000,5000,20000",
+                        help="virgülle ayrılmış kart/sn adımları")
+    parser.add_argument("--step-seconds", type=float, default=3.0)
+    parser.add_argument("--animals", type=int, default=5000, help="sürüdeki kartlı hayvan sayısı")
+    parser.add_argument("--batch-ms", type=int, default=SERIAL_CONFIG["batch_interval_ms"],
+                        help="servisin toplu teslim aralığı")
+    parser.add_argument("--noise", type=float, default=0.0)
+    parser.add_argument("--db", action="store_true", help="bellek dizini yerine yerel veritabanı")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    rates = [float(rate) for rate in args.rates.split(",") if rate.strip()]
+
+    # Ölçüm ayarları: Arduino reset beklemesi yok, her okuma sayılsın (tekrar eleme kapalı)
+    SERIAL_CONFIG.update(
+        readers=[{"id": "sim", "port": args.link, "protocol": args.protocol}],
+        reset_delay_seconds=0.1,
+        reconnect_seconds=0.2,
+        dedup_seconds=0.0,
+        batch_interval_ms=args.batch_ms,
+        port_cache_file=None,
+    )
+    from serial_reader import RfidReaderService
+
+    app = QCoreApplication(sys.argv[:1])
+    benchmark = Benchmark(args)
+    benchmark.simulator.open()
+    service = RfidReaderService(SERIAL_CONFIG)
+    service.tag_events.connect(benchmark.on_events)
+
+    def begin(connected):
+        if connected and not steps.is_alive():
+            steps.start()
+
+    steps = threading.Thread(target=benchmark.run_steps, args=(app, rates), daemon=True)
+    service.connection_changed.connect(begin)
+    service.start()
+    app.exec_()
+    service.stop()
+    benchmark.simulator.close()
+
+    lookup_name = "LocalDatabase.get_animal_by_rfid" if args.db else "AnimalCache.get_by_rfid"
+    print(f"\nBiçim: {args.protocol}, hayvan: {args.animals}, toplu teslim: {args.batch_ms} ms, "
+          f"arama: {lookup_name}")
+    print(f"{'hedef/sn':>10} {'gönderilen':>11} {'alınan':>8} {'kayıp %':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    sustained = 0.0
+    for rate, sent, received, latencies in benchmark.results:
+        loss = 100.0 * (sent - received) / sent if sent else 0.0
+        print(f"{rate:>10g} {sent:>11} {received:>8} {loss:>8.2f} "
+              f"{percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 95) * 1000:>8.2f} "
+              f"{percentile(latencies, 99) * 1000:>8.2f}")
+        if sent and loss < 1.0:
+            sustained = max(sustained, sent / args.step_seconds)
+    if benchmark.missing:
+        print(f"Bulunamayan kart: {benchmark.missing}")
+    print(f"Kayıpsız taşınan en yüksek hız: {sustained:.0f} kart/sn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Donanımsız RFID okuyucu simülatörü (Linux/macOS).
+
+Bir sözde terminal (pty) çifti açar, uygulamanın bağlanacağı uç için sabit bir yol
+(sembolik bağ) oluşturur ve ayarlanan hızda kart çerçeveleri yazar. Gürültü baytları,
+tekrarlanan okumalar ve periyodik kopmalar (pty kapatılıp yeniden açılır) eklenebilir.
+
+Uygulamayla denemek için SERIAL_CONFIG["readers"] içine bağ yolunu yazın:
+    "readers": [{"id": "sim", "port": "/tmp/visifarm-rfid"}]
+
+Kullanım:
+    python tools/rfid_simulator.py --rate 20 --noise 0.05 --duplicates 0.3
+    python tools/rfid_simulator.py --protocol rdm6300 --disconnect-every 30
+"""
+import argparse
+import os
+import pty
+import random
+import sys
+import threading
+import time
+import tty
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# Depo kökü (utils paketi için)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.rfid_frames import Rdm6300Parser  # noqa: E402
+
+DEFAULT_LINK = "/tmp/visifarm-rfid"
+
+
+def make_tags(count: int, seed: int = 1) -> List[str]:
+    """Tekrarlanabilir 10 haneli hex kart kimlikleri (üç biçimde de geçerli)"""
+    rng = random.Random(seed)
+    return [f"{rng.getrandbits(40):010X}" for _ in range(count)]
+
+
+def encode_frame(tag: str, protocol: str = "line") -> bytes:
+    """Kartı okuyucunun göndereceği çerçeveye çevir (utils.rfid_frames'in tersi)"""
+    if protocol == "line":
+        return tag.encode("ascii") + b"\r\n"
+    data = bytes.fromhex(tag)
+    if protocol == "rdm6300":
+        checksum = 0
+        for value in data[:5]:
+            checksum ^= value
+        body = (data[:5].hex() + f"{checksum:02x}").upper().encode("ascii")
+        return bytes([Rdm6300Parser.STX]) + body + bytes([Rdm6300Parser.ETX])
+    if protocol == "binary":
+        checksum = len(data)
+        for value in data:
+            checksum ^= value
+        return bytes([0xAA, len(data)]) + data + bytes([checksum])
+    raise ValueError(f"Bilinmeyen RFID biçimi: {protocol}")
+
+
+class PtySimulator:
+    """Sözde terminal üzerinden kart çerçeveleri yazan sahte okuyucu"""
+
+    def __init__(self, link: str = DEFAULT_LINK, protocol: str = "line", tags: List[str] = None,
+                 rate: float = 10.0, noise: float = 0.0, duplicates: float = 0.0,
+                 disconnect_every: float = 0.0, down_seconds: float = 1.0, seed: int = 1):
+        self.link = link
+        self.protocol = protocol
+        self.tags = tags or make_tags(100, seed)
+        self.rate = rate
+        self.noise = noise
+        self.duplicates = duplicates
+        self.disconnect_every = disconnect_every
+        self.down_seconds = down_seconds
+        self._random = random.Random(seed)
+        self._frames = {tag: encode_frame(tag, protocol) for tag in self.tags}
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._stop = threading.Event()
+        self.sent = 0
+        self.disconnects = 0
+
+    # -------- pty --------
+
+    def open(self):
+        """Yeni pty çifti aç ve bağı ona yönlendir"""
+        master, slave = pty.openpty()
+        # Ham mod: satır düzenleme/yankı olmadan, baytlar olduğu gibi geçsin
+        tty.setraw(slave)
+        # Gerçek okuyucu gibi: karşı taraf okumuyorsa baytlar kaybolur, simülatör beklemez
+        os.set_blocking(master, False)
+        self._master, self._slave = master, slave
+        tmp_link = f"{self.link}.tmp"
+        if os.path.lexists(tmp_link):
+            os.unlink(tmp_link)
+        os.symlink(os.ttyname(slave), tmp_link)
+        os.replace(tmp_link, self.link)
+
+    def close(self):
+        """pty'yi kapat; karşı taraf okuma hatası alır (kablo çekilmiş gibi)"""
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+        if os.path.lexists(self.link):
+            os.unlink(self.link)
+
+    def reconnect(self):
+        self.close()
+        self.disconnects += 1
+        self._stop.wait(self.down_seconds)
+        if not self._stop.is_set():
+            self.open()
+
+    # -------- Yayın --------
+
+    def run(self, duration: Optional[float] = None,
+            on_sent: Optional[Callable[[str, float], None]] = None):
+        """
+        duration saniye (None: durdurulana kadar) boyunca `rate` kart/sn yaz.
+        on_sent(kart, time.monotonic()) her gerçek okuma (tekrarlar hariç) için çağrılır.
+        """
+        if self._master is None:
+            self.open()
+        self._stop.clear()
+        start = time.monotonic()
+        end = start + duration if duration else None
+        next_disconnect = start + self.disconnect_every if self.disconnect_every else None
+        scheduled = 0
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if end is not None and now >= end:
+                break
+            if next_disconnect is not None and now >= next_disconnect:
+                self.reconnect()
+                next_disconnect = time.monotonic() + self.disconnect_every
+                # Kopukken gönderilemeyenler telafi edilmez
+                start, scheduled = time.monotonic(), 0
+                continue
+            # Hızı tutturmak için zamanı gelmiş tüm çerçeveler tek yazımda gider
+            due = int((now - start) * self.rate) + 1 - scheduled
+            if due > 0:
+                self._write_frames(due, on_sent)
+                scheduled += due
+            self._stop.wait(min(0.001, 1.0 / max(self.rate, 1)))
+
+    def stop(self):
+        self._stop.set()
+
+    def _write_frames(self, count: int, on_sent):
+        rng = self._random
+        chunk = bytearray()
+        # Kart ve çerçevesinin chunk içindeki bitişi (kısmi yazımda sayım için)
+        sent_tags = []
+        for _ in range(count):
+            tag = rng.choice(self.tags)
+            if self.noise and rng.random() < self.noise:
+                # Hat gürültüsü: çerçeve arasına rastgele baytlar
+                chunk += bytes(rng.getrandbits(8) for _ in range(rng.randint(1, 8)))
+            frame = self._frames[tag]
+            chunk += frame
+            # Hayvan antende beklerken aynı kart art arda okunur
+            while self.duplicates and rng.random() < self.duplicates:
+                chunk += frame
+            sent_tags.append((tag, len(chunk)))
+        try:
+            written = os.write(self._master, chunk)
+        except OSError:
+            # Tampon dolu (kimse okumuyor) veya pty kapandı: bu okumalar kayboldu
+            return
+        now = time.monotonic()
+        for tag, frame_end in sent_tags:
+            if frame_end > written:
+                break
+            self.sent += 1
+            if on_sent is not None:
+                on_sent(tag, now)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="pty üzerinden sahte RFID okuyucu")
+    parser.add_argument("--link", default=DEFAULT_LINK, help="uygulamanın açacağı port yolu")
+    parser.add_argument("--protocol", default="line", choices=["line", "rdm6300", "binary"])
+    parser.add_argument("--rate", type=float, default=10.0, help="saniyedeki kart okuması")
+    parser.add_argument("--tags", type=int, default=100, help="rastgele kart sayısı")
+    parser.add_argument("--tags-file", help="her satırda bir kart kimliği")
+    parser.add_argument("--noise", type=float, default=0.0, help="çerçeve başına gürültü olasılığı")
+    parser.add_argument("--duplicates", type=float, default=0.0, help="tekrar okuma olasılığı")
+    parser.add_argument("--disconnect-every", type=float, default=0.0, help="kaç saniyede bir kopsun")
+    parser.add_argument("--down-seconds", type=float, default=1.0, help="kopukluk süresi")
+    parser.add_argument("--duration", type=float, help="saniye (varsayılan: Ctrl+C'ye kadar)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    tags = None
+    if args.tags_file:
+        tags = [line.strip() for line in Path(args.tags_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()]
+    simulator = PtySimulator(args.link, args.protocol, tags or make_tags(args.tags, args.seed),
+                             args.rate, args.noise, args.duplicates, args.disconnect_every,
+                             args.down_seconds, args.seed)
+    simulator.open()
+    print(f"--> SİMÜLATÖR HAZIR: {args.link} -> {os.readlink(args.link)} ({args.protocol}, "
+          f"{args.rate:g} kart/sn)")
+    try:
+        simulator.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close()
+    print(f"--> {simulator.sent} kart gönderildi, {simulator.disconnects} kopma")
+
+
+if __name__ == "__main__":
+    main()
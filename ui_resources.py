@@ -0,0 +1,181 @@
+"""
+Paylaşılan arayüz kaynakları: ortak stil sayfaları ve önbellekli ikon registry'si.
+
+Stil sayfaları ve ikon dosyaları uygulama açılışında bir kez yüklenir; detay paneli
+gibi sık güncellenen ekranlar her seçimde dosya okumak veya stil ayrıştırmak zorunda kalmaz.
+"""
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+
+ASSET_DIR = Path(__file__).resolve().parent / "assets"
+
+# Açılışta önceden yüklenecek ikonlar: (dosya adı, kare boyut)
+PRELOAD_ASSETS = [
+    ("termometre.png", 22),
+    ("kilo_kayip.png", 22),
+]
+
+# (dosya adı, boyut) -> QPixmap
+_pixmap_cache: Dict[Tuple[str, Optional[int]], QPixmap] = {}
+
+
+def asset_pixmap(name: str, size: Optional[int] = None) -> QPixmap:
+    """
+    assets/ altındaki bir görseli (isteğe bağlı olarak kare boyuta ölçeklenmiş) döndür.
+    Her (dosya, boyut) çifti diskten yalnızca bir kez okunur.
+    """
+    key = (name, size)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is None:
+        original = _pixmap_cache.get((name, None))
+        if original is None:
+            original = QPixmap(str(ASSET_DIR / name))
+            _pixmap_cache[(name, None)] = original
+        if size is None or original.isNull():
+            pixmap = original
+        else:
+            pixmap = original.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        _pixmap_cache[key] = pixmap
+    return pixmap
+
+
+def preload_assets():
+    """Sık kullanılan ikonları açılışta belleğe al."""
+    for name, size in PRELOAD_ASSETS:
+        asset_pixmap(name, size)
+
+
+# Detay paneli için tek seferde uygulanan stil sayfası.
+# Durum renkleri dinamik property'ler ([status="..."], [level="..."]) ile seçilir,
+# böylece veri değiştiğinde stil yeniden ayrıştırılmaz, sadece widget yeniden polish edilir.
+DETAIL_PANEL_STYLE = """
+    QLabel {
+        background: transparent;
+        border: none;
+    }
+    #welcomeLabel {
+        color: #7f8c8d;
+    }
+    #nameCard {
+        background-color: #E3F3E8;
+        border-radius: 18px;
+        border: none;
+    }
+    #nameLabel {
+        color: #3E2C1C;
+    }
+    #summaryLabel {
+        color: #5D4B3A;
+        font-size: 15px;
+    }
+    #healthBadge {
+        border-radius: 18px;
+        padding: 6px 20px;
+        border: none;
+        background-color: #E3F3E8;
+        color: #2E7D32;
+    }
+    #healthBadge[status="CRITICAL"] {
+        background-color: #FCE4E4;
+        color: #C62828;
+    }
+    #healthBadge[status="WARNING"] {
+        background-color: #FFF2DD;
+        color: #E65100;
+    }
+    #sectionTitle {
+        color: #2c3e50;
+        padding: 10px 0px 5px 0px;
+    }
+    #alertCard {
+        background-color: #FFF2DD;
+        border: none;
+        border-radius: 8px;
+    }
+    #alertCard[level="CRITICAL"] {
+        background-color: #FCE4E4;
+    }
+    #alertMessage {
+        color: #E65100;
+    }
+    #alertMessage[level="CRITICAL"] {
+        color: #C62828;
+    }
+    #infoContainer {
+        background-color: #f8f9fa;
+        border-radius: 12px;
+        border: none;
+    }
+    #infoCell {
+        background-color: white;
+        border-radius: 8px;
+        border: 1px solid #e0e0e0;
+    }
+    #infoCaption {
+        color: #7f8c8d;
+    }
+    #infoValue {
+        color: #2c3e50;
+        padding: 5px 0px;
+    }
+    #infoValue[status="CRITICAL"] {
+        color: #C62828;
+    }
+    #infoValue[status="WARNING"] {
+        color: #E65100;
+    }
+    #infoValue[status="GOOD"] {
+        color: #2E7D32;
+    }
+    #notesCard {
+        background-color: #fff9e6;
+        border: none;
+        border-left: 4px solid #f39c12;
+        border-radius: 10px;
+    }
+    #notesText {
+        color: #2c3e50;
+        padding: 5px;
+    }
+    QPushButton {
+        padding: 14px 22px;
+        border: none;
+        border-radius: 16px;
+        font-weight: bold;
+        min-height: 45px;
+    }
+    #photosButton {
+        background-color: #FFFFFF;
+        color: #3E2C1C;
+        border: 1px solid #E4DDCF;
+    }
+    #photosButton:hover {
+        background-color: #FDFBF7;
+    }
+    #photosButton:pressed {
+        background-color: #F3EEE3;
+    }
+    #trendButton {
+        background-color: #E4F0FB;
+        color: #1F4E79;
+    }
+    #trendButton:hover {
+        background-color: #D4E6F7;
+    }
+    #trendButton:pressed {
+        background-color: #C5DCF3;
+    }
+    #logButton {
+        background-color: #D7E8F8;
+        color: #1F4E79;
+    }
+    #logButton:hover {
+        background-color: #C3DBF2;
+    }
+    #logButton:pressed {
+        background-color: #AFCFEC;
+    }
+"""
@@ -0,0 +1,289 @@
+"""
+Hayvan bazlı, akan (streaming) sağlık anomali tespiti.
+
+Her hayvan ve ölçüm türü (ateş, kilo) için sabit boyutlu bir durum tutulur:
+üstel ağırlıklı hareketli ortalama/varyans (EWMA) ve son N ölçümün eğimi için
+küçük bir pencere. Her yeni ölçüm durumu O(1) sürede günceller ve ölçüm,
+hayvanın KENDİ geçmişine göre olağandışıysa işaretlenir (sabit eşiklerden bağımsız).
+
+Durum periyodik olarak diske yazılır; yeniden başlatmada tüm geçmişi
+tekrar okumaya gerek kalmaz.
+"""
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config import ANOMALY_CONFIG
+
+METRICS = ("temperature", "weight")
+
+# İşaret kodları -> (ikon, mesaj şablonu)
+FLAG_TEXTS = {
+    "temperature_high": ("🌡️", "Ateş bu hayvanın normalinin belirgin üstünde: {value:.1f}°C (beklenen ~{mean:.1f}°C)"),
+    "temperature_low": ("🌡️", "Ateş bu hayvanın normalinin belirgin altında: {value:.1f}°C (beklenen ~{mean:.1f}°C)"),
+    "temperature_trend": ("📈", "Ateş son ölçümlerde sürekli yükseliyor: günde +{slope:.2f}°C"),
+    "weight_high": ("⚖️", "Kilo bu hayvanın geçmişine göre beklenmedik şekilde yüksek: {value:.1f} kg (beklenen ~{mean:.1f} kg)"),
+    "weight_low": ("⚖️", "Kilo bu hayvanın geçmişine göre beklenmedik şekilde düşük: {value:.1f} kg (beklenen ~{mean:.1f} kg)"),
+    "weight_trend": ("📉", "Kilo son ölçümlerde sürekli düşüyor: günde {slope:.1f} kg (%{slope_pct:.1f})"),
+}
+
+
+class MetricState:
+    """Tek bir ölçüm türü için EWMA ortalama/varyans ve eğim penceresi"""
+
+    __slots__ = ("count", "mean", "var", "times", "values")
+
+    def __init__(self, count=0, mean=0.0, var=0.0, times=None, values=None):
+        self.count = count
+        self.mean = mean
+        self.var = var
+        # Son `window` ölçüm (gün cinsinden zaman, değer)
+        self.times: List[float] = times or []
+        self.values: List[float] = values or []
+
+    def update(self, t: float, x: float, alpha: float, window: int, in_order: bool = True):
+        """EWMA güncellemesi (ilk ölçüm ortalamayı başlatır); geç gelen ölçüm eğime girmez"""
+        if self.count == 0:
+            self.mean = x
+            self.var = 0.0
+        else:
+            diff = x - self.mean
+            incr = alpha * diff
+            self.mean += incr
+            self.var = (1 - alpha) * (self.var + diff * incr)
+        self.count += 1
+        if not in_order:
+            return
+        self.times.append(t)
+        self.values.append(x)
+        if len(self.times) > window:
+            del self.times[0]
+            del self.values[0]
+
+    def slope(self) -> Optional[float]:
+        """Penceredeki ölçümlerin en küçük kareler eğimi (birim / gün)"""
+        n = len(self.times)
+        if n < 2:
+            return None
+        t0 = self.times[0]
+        mean_t = sum(t - t0 for t in self.times) / n
+        mean_x = sum(self.values) / n
+        sxx = sum((t - t0 - mean_t) ** 2 for t in self.times)
+        if sxx <= 0:
+            return None
+        sxy = sum((t - t0 - mean_t) * (x - mean_x) for t, x in zip(self.times, self.values))
+        return sxy / sxx
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "mean": self.mean, "var": self.var,
+                "times": list(self.times), "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricState":
+        return cls(data.get("count", 0), data.get("mean", 0.0), data.get("var", 0.0),
+                   list(data.get("times", [])), list(data.get("values", [])))
+
+
+class AnimalState:
+    """Bir hayvanın tüm ölçüm durumları + son ölçümde işaretlenenler"""
+
+    __slots__ = ("metrics", "last_time", "flags")
+
+    def __init__(self):
+        self.metrics: Dict[str, MetricState] = {name: MetricState() for name in METRICS}
+        self.last_time: Optional[float] = None
+        # Son ölçümde tetiklenen işaretler: [(kod, mesaj parametreleri)]
+        self.flags: List[tuple] = []
+
+
+class AnomalyDetector:
+    """Hayvan başına O(1) durumla çalışan artımlı anomali dedektörü"""
+
+    VERSION = 1
+
+    def __init__(self, config: Dict[str, Any], checkpoint_file: Optional[str] = None):
+        self.alpha = config["alpha"]
+        self.window = config["slope_window"]
+        self.min_samples = config["min_samples"]
+        self.z_threshold = config["z_threshold"]
+        self.min_std = config["min_std"]
+        self.temperature_slope = config["temperature_slope_per_day"]
+        self.weight_slope_pct = config["weight_slope_pct_per_day"]
+        self.checkpoint_interval = config["checkpoint_interval_seconds"]
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+
+        self._states: Dict[str, AnimalState] = {}
+        self._lock = threading.Lock()
+        # Kayıt birden çok havuz thread'inden gelebilir; dosya yazımı sırayla yapılır
+        self._save_lock = threading.Lock()
+        self._updates_since_save = 0
+        self._last_save = time.monotonic()
+        if self.checkpoint_file is not None:
+            self.load()
+
+    def observe(self, animal_id, weight: Optional[float], temperature: Optional[float],
+                measured_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Yeni ölçümü işle ve (varsa) olağandışı bulguları uyarı olarak döndür.
+        Ölçüm, işaretleme için DAHA ÖNCEKİ duruma göre değerlendirilir, sonra duruma eklenir.
+        Son işlenenden eski tarihli (geriye dönük girilen) ölçümler ortalamaya katılır
+        ama eğim penceresine girmez.
+        """
+        t = self._to_days(measured_at or datetime.utcnow())
+        values = {"temperature": temperature, "weight": weight}
+        with self._lock:
+            state = self._states.get(str(animal_id))
+            if state is None:
+                state = self._states[str(animal_id)] = AnimalState()
+            in_order = state.last_time is None or t >= state.last_time
+            if in_order:
+                state.last_time = t
+
+            flags = []
+            for name in METRICS:
+                x = values[name]
+                if x is None:
+                    continue
+                x = float(x)
+                metric = state.metrics[name]
+                flags.extend(self._check_value(name, metric, x))
+                metric.update(t, x, self.alpha, self.window, in_order)
+                if in_order:
+                    flags.extend(self._check_trend(name, metric))
+            state.flags = flags
+
+            self._updates_since_save += 1
+            # Tüm durum yazıldığı için sık ölçümde her seferinde değil, belirli aralıklarla
+            should_save = (self.checkpoint_file is not None
+                           and time.monotonic() - self._last_save >= self.checkpoint_interval)
+        if should_save:
+            self.save()
+        return [self._alert(code, params) for code, params in flags]
+
+    def alerts_for(self, animal_id) -> List[Dict[str, Any]]:
+        """Hayvanın son ölçümünde işaretlenenleri uyarı sözlükleri olarak üret"""
+        state = self._states.get(str(animal_id))
+        if state is None:
+            return []
+        return [self._alert(code, params) for code, params in state.flags]
+
+    def forget(self, animal_id):
+        """Silinen hayvanın durumunu bırak"""
+        with self._lock:
+            if self._states.pop(str(animal_id), None) is not None:
+                self._updates_since_save += 1
+
+    # -------- Kurallar --------
+
+    def _check_value(self, name: str, metric: MetricState, x: float) -> List[tuple]:
+        if metric.count < self.min_samples:
+            return []
+        std = max(math.sqrt(metric.var), self.min_std[name])
+        z = (x - metric.mean) / std
+        if abs(z) < self.z_threshold:
+            return []
+        code = f"{name}_high" if z > 0 else f"{name}_low"
+        return [(code, {"value": x, "mean": metric.mean, "z": z})]
+
+    def _check_trend(self, name: str, metric: MetricState) -> List[tuple]:
+        if len(metric.times) < self.window:
+            return []
+        slope = metric.slope()
+        if slope is None:
+            return []
+        if name == "temperature" and slope >= self.temperature_slope:
+            return [("temperature_trend", {"slope": slope})]
+        if name == "weight" and metric.mean:
+            slope_pct = slope / metric.mean * 100
+            if slope_pct <= -self.weight_slope_pct:
+                return [("weight_trend", {"slope": slope, "slope_pct": slope_pct})]
+        return []
+
+    @staticmethod
+    def _alert(code: str, params: Dict[str, float]) -> Dict[str, Any]:
+        icon, template = FLAG_TEXTS[code]
+        return {"type": "WARNING", "message": f"⚠️ Olağandışı: {template.format(**params)}",
+                "icon": icon, "code": code}
+
+    @staticmethod
+    def _to_days(measured_at: datetime) -> float:
+        if measured_at.tzinfo is not None:
+            measured_at = measured_at.replace(tzinfo=None) - measured_at.utcoffset()
+        return (measured_at - datetime(1970, 1, 1)).total_seconds() / 86400
+
+    # -------- Kalıcılık --------
+
+    def load(self):
+        """Kayıtlı durumu diskten oku (yoksa/bozuksa boş başla)"""
+        if self.checkpoint_file is None or not self.checkpoint_file.exists():
+            return
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return
+            states = {}
+            for animal_id, item in data.get("animals", {}).items():
+                state = AnimalState()
+                for name in METRICS:
+                    if name in item:
+                        state.metrics[name] = MetricState.from_dict(item[name])
+                state.last_time = item.get("last_time")
+                state.flags = [tuple(flag) for flag in item.get("flags", [])]
+                states[animal_id] = state
+            with self._lock:
+                self._states = states
+        except Exception as e:
+            print(f"Anomali durumu okunamadı: {e}")
+
+    def save(self) -> bool:
+        """Durumu diske yaz (yarım yazılmış dosya bırakmadan)"""
+        if self.checkpoint_file is None:
+            return False
+        # Anlık görüntü de kilit içinde alınır: eski görüntü yenisinin üstüne yazılmasın
+        with self._save_lock:
+            return self._write_checkpoint()
+
+    def _write_checkpoint(self) -> bool:
+        with self._lock:
+            animals = {
+                animal_id: {
+                    **{name: metric.to_dict() for name, metric in state.metrics.items()},
+                    "last_time": state.last_time,
+                    "flags": list(state.flags),
+                }
+                for animal_id, state in self._states.items()
+            }
+            self._updates_since_save = 0
+            self._last_save = time.monotonic()
+        try:
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checkpoint_file.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({"version": self.VERSION, "animals": animals}, separators=(",", ":")))
+            os.replace(tmp_path, self.checkpoint_file)
+            return True
+        except Exception as e:
+            print(f"Anomali durumu kaydedilemedi: {e}")
+            return False
+
+    def save_if_dirty(self) -> bool:
+        if self._updates_since_save:
+            return self.save()
+        return False
+
+
+_anomaly_detector: Optional[AnomalyDetector] = None
+
+
+def get_anomaly_detector() -> AnomalyDetector:
+    """Uygulama genelinde paylaşılan dedektörü döndür (kayıtlı durumla)"""
+    global _anomaly_detector
+    if _anomaly_detector is None:
+        _anomaly_detector = AnomalyDetector(ANOMALY_CONFIG, ANOMALY_CONFIG["checkpoint_file"])
+    return _anomaly_detector
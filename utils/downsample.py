@@ -0,0 +1,62 @@
+"""
+Zaman serileri için LTTB (Largest-Triangle-Three-Buckets) örnek azaltma.
+
+Grafikte ekran genişliğinden fazla nokta çizmek görsel bilgi katmaz; LTTB
+tepe/dip noktalarını koruyarak seriyi piksel sayısı kadar noktaya indirir.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    LTTB ile seçilen noktaların indekslerini döndür.
+
+    x artan sırada olmalı; NaN içermeyen seriler beklenir.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # İlk ve son nokta sabit; aradaki n-2 nokta n_out-2 kovaya bölünür
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    ends = edges[1:]
+
+    # Her kovanın bir sonraki kovasının ortalaması (tek geçişte, vektörel)
+    counts = (ends - starts).astype(float)
+    avg_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = starts[i], ends[i]
+        ax, ay = x[a], y[a]
+        # Önceki seçili nokta, aday ve sonraki kova ortalamasının oluşturduğu üçgen alanı
+        area = np.abs((ax - next_x[i]) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y[i] - ay))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Seriyi LTTB ile n_out noktaya indir"""
+    idx = lttb_indices(x, y, n_out)
+    return x[idx], y[idx]
+
+
+def downsample_window(x: np.ndarray, y: np.ndarray, x_min: float, x_max: float,
+                      n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [x_min, x_max] görünür aralığındaki noktaları (kenarlarda birer komşu ile)
+    n_out noktaya indir. x artan sırada olmalı.
+    """
+    lo = max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x_max, side="right")) + 1, len(x))
+    return lttb(x[lo:hi], y[lo:hi], n_out)
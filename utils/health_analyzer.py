@@ -2,18 +2,38 @@
 Rule-Based AI Engine for Animal Health Monitoring
 Ateş kontrolü ve kilo kaybı analizi yapar
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
+from config import HEALTH_RULES
 from models.animal import Animal
+from utils.health_rules import get_health_rules
+
+# analyze_herd() durum kodları (büyük olan baskındır)
+STATUS_UNKNOWN = -1
+STATUS_GOOD = 0
+STATUS_WARNING = 1
+STATUS_CRITICAL = 2
+STATUS_NAMES = {
+    STATUS_UNKNOWN: "UNKNOWN",
+    STATUS_GOOD: "GOOD",
+    STATUS_WARNING: "WARNING",
+    STATUS_CRITICAL: "CRITICAL",
+}
 
 
 class HealthAnalyzer:
     """Hayvan sağlık durumunu analiz eden Rule-Based AI Engine"""
     
+    # Varsayılan eşikler (tabloda olmayan türler). Türe/yaşa özel eşikler
+    # config.HEALTH_RULES'ten derlenen tablodan (utils.health_rules) okunur.
+    
     # Kritik ateş eşiği (°C)
-    CRITICAL_TEMPERATURE_THRESHOLD = 39.5
+    CRITICAL_TEMPERATURE_THRESHOLD = HEALTH_RULES["default"]["critical_temp"]
+    
+    # Yüksek (uyarı) ateş eşiği (°C)
+    WARNING_TEMPERATURE_THRESHOLD = HEALTH_RULES["default"]["warning_temp"]
     
     # Kilo kaybı uyarı eşiği (%)
-    WEIGHT_LOSS_WARNING_THRESHOLD = 0.10  # %10
+    WEIGHT_LOSS_WARNING_THRESHOLD = HEALTH_RULES["default"]["weight_loss_pct"] / 100
     
     @staticmethod
     def analyze_health(animal: Animal, current_temperature: Optional[float] = None, 
@@ -35,9 +55,15 @@ class HealthAnalyzer:
         """
         alerts = []
         health_status = "GOOD"
+        # Türe ve yaşa göre eşikler (derlenmiş tablodan tek okuma)
+        warning_temp, critical_temp, loss_threshold = get_health_rules().thresholds_for(
+            animal.tur, animal.yas
+        )
         
         # 1. Ateş Kontrolü
-        temperature_result = HealthAnalyzer._check_temperature(current_temperature)
+        temperature_result = HealthAnalyzer._check_temperature(
+            current_temperature, warning_temp, critical_temp
+        )
         if temperature_result["status"] == "CRITICAL":
             health_status = "CRITICAL"
             alerts.append({
@@ -55,7 +81,7 @@ class HealthAnalyzer:
             })
         
         # 2. Kilo Kaybı Analizi
-        weight_result = HealthAnalyzer._check_weight_loss(animal, current_weight)
+        weight_result = HealthAnalyzer._check_weight_loss(animal, current_weight, loss_threshold)
         if weight_result["status"] == "WARNING":
             if health_status != "CRITICAL":
                 health_status = "WARNING"
@@ -73,12 +99,20 @@ class HealthAnalyzer:
         }
     
     @staticmethod
-    def _check_temperature(temperature: Optional[float]) -> Dict[str, Any]:
+    def _check_temperature(temperature: Optional[float],
+                           warning_threshold: Optional[float] = None,
+                           critical_threshold: Optional[float] = None) -> Dict[str, Any]:
         """
         Ateş kontrolü yapar
         
-        Rule: Temperature > 39.5°C ise CRITICAL
+        Rule: Temperature > kritik eşik (varsayılan 39.5°C) ise CRITICAL,
+              > uyarı eşiği (varsayılan 38.5°C) ise WARNING
         """
+        if warning_threshold is None:
+            warning_threshold = HealthAnalyzer.WARNING_TEMPERATURE_THRESHOLD
+        if critical_threshold is None:
+            critical_threshold = HealthAnalyzer.CRITICAL_TEMPERATURE_THRESHOLD
+
         if temperature is None:
             return {
                 "status": "UNKNOWN",
@@ -86,13 +120,13 @@ class HealthAnalyzer:
                 "temperature": None
             }
         
-        if temperature > HealthAnalyzer.CRITICAL_TEMPERATURE_THRESHOLD:
+        if temperature > critical_threshold:
             return {
                 "status": "CRITICAL",
-                "message": f"Kritik ateş: {temperature}°C (Eşik: {HealthAnalyzer.CRITICAL_TEMPERATURE_THRESHOLD}°C)",
+                "message": f"Kritik ateş: {temperature}°C (Eşik: {critical_threshold}°C)",
                 "temperature": temperature
             }
-        elif temperature > 38.5:  # Hafif yüksek ama kritik değil
+        elif temperature > warning_threshold:  # Hafif yüksek ama kritik değil
             return {
                 "status": "WARNING",
                 "message": f"Yüksek sıcaklık: {temperature}°C",
@@ -106,12 +140,15 @@ class HealthAnalyzer:
             }
     
     @staticmethod
-    def _check_weight_loss(animal: Animal, current_weight: Optional[float]) -> Dict[str, Any]:
+    def _check_weight_loss(animal: Animal, current_weight: Optional[float],
+                           loss_threshold: Optional[float] = None) -> Dict[str, Any]:
         """
         Kilo kaybı analizi yapar
         
-        Rule: Mevcut kilo, profil kilosundan %10 düşükse WARNING
+        Rule: Mevcut kilo, profil kilosundan eşik oranı (varsayılan %10) kadar düşükse WARNING
         """
+        if loss_threshold is None:
+            loss_threshold = HealthAnalyzer.WEIGHT_LOSS_WARNING_THRESHOLD
         if current_weight is None:
             return {
                 "status": "UNKNOWN",
@@ -140,7 +177,7 @@ class HealthAnalyzer:
         weight_loss = baseline_weight - current_weight
         loss_percentage = (weight_loss / baseline_weight) * 100
         
-        if loss_percentage >= (HealthAnalyzer.WEIGHT_LOSS_WARNING_THRESHOLD * 100):
+        if loss_percentage >= (loss_threshold * 100):
             return {
                 "status": "WARNING",
                 "message": f"Kilo kaybı tespit edildi: {current_weight:.1f} kg (Profil: {baseline_weight:.1f} kg, Kayıp: %{loss_percentage:.1f})",
@@ -157,11 +194,90 @@ class HealthAnalyzer:
                 "loss_percentage": loss_percentage
             }
     
+    @staticmethod
+    def herd_columns(animals: Sequence[Animal]):
+        """
+        Hayvan listesini analyze_herd() için sütunlara çevir:
+        (ateş, mevcut kilo, profil kilosu, tür kodu, yaş).
+        Liste görünümündeki gibi mevcut kilo = kilo alanı; eksik değerler NaN olur.
+        """
+        import numpy as np
+
+        temperatures = np.array(
+            [getattr(a, "temperature", None) for a in animals], dtype=float
+        )
+        current_weights = np.array(
+            [float(a.kilo) if a.kilo else None for a in animals], dtype=float
+        )
+        # Profil kilosu yoksa (tekil yoldaki gibi) kilo alanı kullanılır
+        baseline_weights = np.array(
+            [getattr(a, "baseline_weight", None) or (float(a.kilo) if a.kilo else None)
+             for a in animals],
+            dtype=float,
+        )
+        species = get_health_rules().codes_for([a.tur for a in animals])
+        ages = np.array([HealthAnalyzer._age_value(a.yas) for a in animals], dtype=float)
+        return temperatures, current_weights, baseline_weights, species, ages
+
+    @staticmethod
+    def _age_value(age) -> Optional[float]:
+        try:
+            return float(age) if age else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def analyze_herd(temperatures, current_weights, baseline_weights,
+                     species: Optional[Sequence[str]] = None, ages=None) -> "HerdAnalysis":
+        """
+        analyze_health() kurallarının tüm sürüye tek geçişte uygulanmış hali.
+
+        Girdiler aynı uzunlukta sayı dizileridir; eksik değer NaN ile gösterilir.
+        Profil kilosu eksik veya 0 ise (tekil yoldaki gibi) mevcut kilo profil kabul edilir.
+        species/ages verilirse türe ve yaş bandına özel eşikler uygulanır; species tür
+        adları veya (tekrar tekrar analiz için) HealthRules.codes_for() kodları olabilir.
+        Sonuç durum kodları ve kayıp yüzdeleridir; mesajlar sadece istenen hayvan
+        için HerdAnalysis.analysis_for() ile üretilir.
+        """
+        import numpy as np
+
+        temps = np.asarray(temperatures, dtype=float)
+        current = np.asarray(current_weights, dtype=float)
+        baseline = np.asarray(baseline_weights, dtype=float)
+        baseline = np.where(np.isnan(baseline) | (baseline == 0), current, baseline)
+
+        # Her hayvanın eşikleri: [tür, yaş bandı] tablosundan dizi indeksleme ile
+        rules = get_health_rules()
+        if species is None:
+            species_codes = np.zeros(temps.shape, dtype=np.intp)
+        elif isinstance(species, np.ndarray) and species.dtype.kind in "iu":
+            species_codes = species
+        else:
+            species_codes = rules.codes_for(species)
+        bands = rules.bands_for(ages if ages is not None else np.full(temps.shape, np.nan))
+        warning_temp, critical_temp, loss_threshold = rules.threshold_arrays(species_codes, bands)
+
+        # 1. Ateş kontrolü: 0 normal, 1 yüksek, 2 kritik (NaN karşılaştırmaları False döner)
+        temp_level = (temps > warning_temp).view(np.int8) + (temps > critical_temp).view(np.int8)
+
+        # 2. Kilo kaybı analizi (profil kilosu 0/eksikse yüzde NaN olur)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loss_percentage = (baseline - current) / baseline * 100
+        loss_percentage[baseline == 0] = np.nan
+        weight_level = (loss_percentage >= (loss_threshold * 100)).view(np.int8)
+
+        # Genel durum: en kötü sonuç (bilinmeyen değerler durumu etkilemez)
+        status = np.maximum(temp_level, weight_level)
+        return HerdAnalysis(status, temp_level, weight_level, loss_percentage,
+                            temps, current, baseline, species_codes, ages)
+    
     @staticmethod
     def update_animal_health_status(animal: Animal, temperature: Optional[float] = None,
                                      current_weight: Optional[float] = None) -> Animal:
         """
-        Hayvanın sağlık durumunu analiz edip günceller
+        Hayvanın sağlık durumunu analiz edip günceller.
+        Durum sadece güncel ölçümlerden ve kurallardan gelir (önceki durum korunmaz);
+        utils.health_status_sync de aynı şekilde hesaplar.
         
         Returns:
             Güncellenmiş Animal objesi
@@ -172,12 +288,67 @@ class HealthAnalyzer:
         if analysis["health_status"] == "CRITICAL":
             animal.saglik_durumu = "KRİTİK"
         elif analysis["health_status"] == "WARNING":
-            if animal.saglik_durumu != "KRİTİK":
-                animal.saglik_durumu = "UYARI"
+            animal.saglik_durumu = "UYARI"
         else:
-            # Eğer önceki durum kritik veya uyarı değilse, "İyi" olarak ayarla
-            if animal.saglik_durumu not in ["KRİTİK", "UYARI"]:
-                animal.saglik_durumu = "İyi"
+            animal.saglik_durumu = "İyi"
         
         return animal
 
+
+
+class HerdAnalysis:
+    """analyze_herd() sonucu: sürü genelinde durum kodları ve kayıp yüzdeleri"""
+
+    def __init__(self, status, temperature_level, weight_level, loss_percentage,
+                 temperatures, current_weights, baseline_weights, species_codes, ages=None):
+        self.status = status
+        self.temperature_level = temperature_level
+        self.weight_level = weight_level
+        self.loss_percentage = loss_percentage
+        self.temperatures = temperatures
+        self.current_weights = current_weights
+        self.baseline_weights = baseline_weights
+        self.species_codes = species_codes
+        self.ages = ages
+
+    def __len__(self):
+        return len(self.status)
+
+    @property
+    def temperature_status(self):
+        """Ateş durum kodları (veri yoksa STATUS_UNKNOWN) - ihtiyaç olunca hesaplanır"""
+        import numpy as np
+        return np.where(np.isnan(self.temperatures), np.int8(STATUS_UNKNOWN), self.temperature_level)
+
+    @property
+    def weight_status(self):
+        """Kilo durum kodları (hesaplanamıyorsa STATUS_UNKNOWN) - ihtiyaç olunca hesaplanır"""
+        import numpy as np
+        return np.where(np.isnan(self.loss_percentage), np.int8(STATUS_UNKNOWN), self.weight_level)
+
+    def status_name(self, index: int) -> str:
+        """'GOOD', 'WARNING' veya 'CRITICAL'"""
+        return STATUS_NAMES[int(self.status[index])]
+
+    def status_names(self) -> List[str]:
+        return [STATUS_NAMES[code] for code in self.status.tolist()]
+
+    def analysis_for(self, index: int) -> Dict[str, Any]:
+        """Tek bir hayvan için analyze_health() ile aynı sözlüğü (mesajlarla) üret"""
+        temperature = self._value(self.temperatures, index)
+        current_weight = self._value(self.current_weights, index)
+        baseline_weight = self._value(self.baseline_weights, index)
+
+        # Mesajlar tekil yolla aynı olsun diye sadece bu hayvan için tekil kurallar çalışır
+        animal = Animal({
+            "kilo": baseline_weight or 0.0,
+            "baseline_weight": baseline_weight,
+            "tur": get_health_rules().species_name(int(self.species_codes[index])),
+            "yas": self._value(self.ages, index) if self.ages is not None else 0,
+        })
+        return HealthAnalyzer.analyze_health(animal, temperature, current_weight)
+
+    @staticmethod
+    def _value(values, index: int) -> Optional[float]:
+        value = float(values[index])
+        return None if value != value else value  # NaN -> None
@@ -0,0 +1,109 @@
+"""
+Tür (ve yaş bandı) bazlı sağlık eşikleri.
+
+config.HEALTH_RULES bir kez okunur ve [tür, yaş bandı] boyutlu eşik dizilerine
+derlenir. Tekil analiz bu tablodan hazır bir demet okur; sürü analizi ise
+tüm hayvanların eşiklerini tek seferde dizi indeksleme ile alır.
+"""
+from bisect import bisect_right
+from itertools import repeat
+from typing import Dict, Optional, Sequence, Tuple
+
+from config import HEALTH_RULES
+
+# (uyarı ateşi, kritik ateş, kilo kaybı oranı)
+Thresholds = Tuple[float, float, float]
+
+
+class HealthRules:
+    """Derlenmiş kural tablosu"""
+
+    def __init__(self, rules: Dict):
+        default = rules["default"]
+        self.band_edges = [float(edge) for edge in rules.get("age_bands", [])]
+        n_bands = len(self.band_edges) + 1
+
+        # Kod 0: tabloda olmayan türler (varsayılan eşikler)
+        self.species_codes: Dict[str, int] = {}
+        self.rows = [self._compile(default, {}, n_bands)]
+        for name, species_rules in rules.get("species", {}).items():
+            self.species_codes[name] = len(self.rows)
+            self.rows.append(self._compile(default, species_rules, n_bands))
+
+        # Sürü analizi için düzleştirilmiş [tür, bant] dizileri (numpy ilk kullanımda yüklenir)
+        self._arrays = None
+
+    @staticmethod
+    def _compile(default: Dict, species_rules: Dict, n_bands: int) -> Tuple[Thresholds, ...]:
+        base = {**default, **{k: v for k, v in species_rules.items() if k != "bands"}}
+        bands = species_rules.get("bands", {})
+        row = []
+        for band in range(n_bands):
+            merged = {**base, **bands.get(band, bands.get(str(band), {}))}
+            row.append((
+                float(merged["warning_temp"]),
+                float(merged["critical_temp"]),
+                float(merged["weight_loss_pct"]) / 100,
+            ))
+        return tuple(row)
+
+    def species_name(self, code: int) -> str:
+        """Tür kodunun adı (0: tabloda olmayan türler için boş)"""
+        for name, species_code in self.species_codes.items():
+            if species_code == code:
+                return name
+        return ""
+
+    def band_of(self, age) -> int:
+        """Yaşın düştüğü bant; yaş bilinmiyorsa (0/boş) en yaşlı bant"""
+        try:
+            age = float(age) if age else None
+        except (TypeError, ValueError):
+            age = None
+        if age is None or not age > 0:
+            return len(self.band_edges)
+        return bisect_right(self.band_edges, age)
+
+    def thresholds_for(self, species: Optional[str], age=None) -> Thresholds:
+        """Tek bir hayvanın eşikleri"""
+        return self.rows[self.species_codes.get(species, 0)][self.band_of(age)]
+
+    def arrays(self):
+        """(uyarı, kritik, kayıp) -> düzleştirilmiş [tür * bant_sayısı + bant] numpy dizileri"""
+        if self._arrays is None:
+            import numpy as np
+            table = np.array(self.rows, dtype=float).reshape(-1, 3)
+            self._arrays = (table[:, 0].copy(), table[:, 1].copy(), table[:, 2].copy())
+        return self._arrays
+
+    def codes_for(self, species: Sequence[Optional[str]]):
+        """Tür adlarını tür kodlarına çevir (tabloda olmayanlar: 0)"""
+        import numpy as np
+        lookup = self.species_codes.get
+        return np.array(list(map(lookup, species, repeat(0))), dtype=np.intp)
+
+    def bands_for(self, ages):
+        """Yaş dizisini bant indekslerine çevir (NaN/0: en yaşlı bant)"""
+        import numpy as np
+        ages = np.asarray(ages, dtype=float)
+        ages = np.where(ages > 0, ages, np.nan)
+        # NaN, searchsorted'da sona yerleşir -> en yaşlı bant
+        return np.searchsorted(np.array(self.band_edges), ages, side="right")
+
+    def threshold_arrays(self, species_codes, bands):
+        """Her hayvan için (uyarı, kritik, kayıp) eşik dizileri"""
+        import numpy as np
+        warning, critical, loss = self.arrays()
+        flat = species_codes * (len(self.band_edges) + 1) + bands
+        return np.take(warning, flat), np.take(critical, flat), np.take(loss, flat)
+
+
+_health_rules: Optional[HealthRules] = None
+
+
+def get_health_rules() -> HealthRules:
+    """config.HEALTH_RULES'ten bir kez derlenen tabloyu döndür"""
+    global _health_rules
+    if _health_rules is None:
+        _health_rules = HealthRules(HEALTH_RULES)
+    return _health_rules
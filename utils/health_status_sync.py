@@ -0,0 +1,193 @@
+"""
+Kayıtlı sağlık durumunu (saglik_durumu) kurallarla güncel tutma.
+
+Durum eskiden sadece ekleme/düzenleme/ölçüm girişinde hesaplanıyordu; eşikler
+değişince kayıtlı durumlar kurallardan kopuyordu. Burada her hayvan için durumu
+etkileyen alanların parmak izi ve kural tablosunun sürümü (HEALTH_RULES özeti)
+saklanır. Sadece parmak izi değişen ("kirli") hayvanlar yeniden hesaplanır ve
+yalnızca durumu gerçekten değişenler, durum başına tek toplu güncellemeyle yazılır.
+"""
+import hashlib
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from config import CACHE_CONFIG, HEALTH_RULES
+from models.animal import Animal
+from utils.health_analyzer import (HealthAnalyzer, STATUS_CRITICAL, STATUS_GOOD,
+                                   STATUS_WARNING)
+
+# Durum kodu -> kayıtlı metin (update_animal_health_status ile aynı etiketler)
+STATUS_LABELS = {
+    STATUS_GOOD: "İyi",
+    STATUS_WARNING: "UYARI",
+    STATUS_CRITICAL: "KRİTİK",
+}
+
+
+def rules_version(rules: Dict[str, Any] = None) -> str:
+    """Kural tablosunun özeti; eşikler değişince tüm sürü yeniden hesaplanır"""
+    text = json.dumps(rules if rules is not None else HEALTH_RULES, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _fingerprint(animal: Animal, status: Optional[str] = None) -> int:
+    """Durumu etkileyen alanlar (ve kayıtlı durumun kendisi; status verilirse o) için kısa özet"""
+    key = (animal.tur, animal.yas, getattr(animal, "temperature", None), animal.kilo,
+           getattr(animal, "baseline_weight", None), status or animal.saglik_durumu)
+    return zlib.crc32(repr(key).encode("utf-8"))
+
+
+class HealthStatusSync:
+    """Kirli hayvan takibi + artımlı durum hesaplama ve toplu geri yazma"""
+
+    VERSION = 1
+
+    def __init__(self, state_file: Optional[str] = None):
+        self.state_file = Path(state_file) if state_file else None
+        self.rules_version = rules_version()
+        # Son yazılan/doğrulanan haliyle hayvan başına parmak izi
+        self._fingerprints: Dict[str, int] = {}
+        # Açıkça işaretlenenler (kayıt sonrası, silme vb.)
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._changed = False
+        if self.state_file is not None:
+            self.load()
+
+    def mark_dirty(self, animal_id):
+        with self._lock:
+            self._dirty.add(str(animal_id))
+
+    def forget(self, animal_id):
+        """Silinen hayvanın kaydını bırak"""
+        with self._lock:
+            self._fingerprints.pop(str(animal_id), None)
+            self._dirty.discard(str(animal_id))
+
+    def dirty_animals(self, animals: Sequence[Animal]) -> List[Animal]:
+        """Girdileri/kayıtlı durumu son hesaptan beri değişmiş (veya işaretlenmiş) hayvanlar"""
+        with self._lock:
+            fingerprints = self._fingerprints
+            dirty = self._dirty
+            return [
+                animal for animal in animals
+                if animal.id is not None and (
+                    str(animal.id) in dirty
+                    or fingerprints.get(str(animal.id)) != _fingerprint(animal)
+                )
+            ]
+
+    def recompute(self, animals: Sequence[Animal]) -> Dict[str, List[Animal]]:
+        """
+        Kirli hayvanların durumunu kurallara göre yeniden hesapla.
+
+        Returns: {yeni durum metni: [kayıtlı durumu farklı olan hayvanlar]}
+        """
+        dirty = self.dirty_animals(animals)
+        if not dirty:
+            return {}
+        analysis = HealthAnalyzer.analyze_herd(*HealthAnalyzer.herd_columns(dirty))
+        changes: Dict[str, List[Animal]] = {}
+        for animal, code in zip(dirty, analysis.status.tolist()):
+            label = STATUS_LABELS[code]
+            if animal.saglik_durumu != label:
+                changes.setdefault(label, []).append(animal)
+        # Değişmeyenler de doğrulandı; bir sonraki taramada atlanır
+        self._mark_clean(dirty, changes)
+        return changes
+
+    def sync(self, db, animals: Sequence[Animal]) -> Dict[str, str]:
+        """
+        (Arka planda) kirli hayvanların durumunu hesapla ve değişenleri veritabanına yaz.
+        Hayvan nesneleri değiştirilmez (önbellekte paylaşılırlar); yazılan durumlar
+        arayüz thread'inde uygulanmak üzere döndürülür.
+
+        Returns: {hayvan id: yazılan durum metni}
+        """
+        changes = self.recompute(animals)
+        if not changes:
+            self.save_if_dirty()
+            return {}
+        updates: Dict[str, str] = {}
+        for label, changed in changes.items():
+            ids = [str(animal.id) for animal in changed]
+            if not db.update_health_statuses({label: ids}):
+                # Yazılamayanlar bir sonraki senkronda tekrar denenir
+                with self._lock:
+                    self._dirty.update(ids)
+                continue
+            self._mark_clean(changed, status=label)
+            updates.update(dict.fromkeys(ids, label))
+        self.save()
+        return updates
+
+    def _mark_clean(self, animals: Sequence[Animal], pending: Dict[str, List[Animal]] = None,
+                    status: Optional[str] = None):
+        skip = {id(animal) for changed in (pending or {}).values() for animal in changed}
+        with self._lock:
+            for animal in animals:
+                if id(animal) in skip:
+                    continue
+                self._fingerprints[str(animal.id)] = _fingerprint(animal, status)
+                self._dirty.discard(str(animal.id))
+            self._changed = True
+
+    # -------- Kalıcılık --------
+
+    def load(self):
+        """Kayıtlı parmak izlerini oku; kural sürümü değiştiyse hepsi kirli sayılır"""
+        if self.state_file is None or not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION or data.get("rules_version") != self.rules_version:
+                return
+            with self._lock:
+                self._fingerprints = {str(k): int(v) for k, v in data.get("fingerprints", {}).items()}
+                self._dirty = set(data.get("dirty", []))
+        except Exception as e:
+            print(f"Sağlık durumu senkron kaydı okunamadı: {e}")
+
+    def save(self) -> bool:
+        """Parmak izlerini diske yaz (yarım yazılmış dosya bırakmadan)"""
+        if self.state_file is None:
+            return False
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "rules_version": self.rules_version,
+                "fingerprints": dict(self._fingerprints),
+                "dirty": sorted(self._dirty),
+            }
+            self._changed = False
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, self.state_file)
+            return True
+        except Exception as e:
+            print(f"Sağlık durumu senkron kaydı yazılamadı: {e}")
+            return False
+
+    def save_if_dirty(self) -> bool:
+        if self._changed:
+            return self.save()
+        return False
+
+
+_health_status_sync: Optional[HealthStatusSync] = None
+
+
+def get_health_status_sync() -> HealthStatusSync:
+    """Uygulama genelinde paylaşılan durum senkronunu döndür (kayıtlı parmak izleriyle)"""
+    global _health_status_sync
+    if _health_status_sync is None:
+        _health_status_sync = HealthStatusSync(CACHE_CONFIG["health_status_state_file"])
+    return _health_status_sync
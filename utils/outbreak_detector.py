@@ -0,0 +1,150 @@
+"""
+Sürü düzeyinde salgın taraması.
+
+Tek bir hayvanın ateşi HealthAnalyzer ile yakalanır; aynı türden birkaç hayvanın
+aynı gün ateşlenmesi ise bulaşıcı bir hastalığın erken işaretidir. Ölçümler
+gün × tür kovalarına ayrılır, her kovadaki ateşli hayvan oranı aynı türün
+önceki günlerdeki (kayan pencere) oranıyla karşılaştırılır. Tüm hesap numpy
+dizileri üzerinde yapılır; bir yıllık sürü kaydı saniyeler içinde taranır.
+"""
+from typing import Any, Dict, List, Sequence
+
+from config import OUTBREAK_CONFIG
+from models.animal import Animal
+from utils.health_rules import get_health_rules
+
+
+class OutbreakDetector:
+    """Gün × tür kovalarında ateşli hayvan sayısını kayan taban çizgisine göre değerlendirir"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        config = config or OUTBREAK_CONFIG
+        self.baseline_days = config["baseline_days"]
+        self.min_animals = config["min_animals"]
+        self.min_rate = config["min_rate"]
+        self.baseline_floor = config["baseline_floor"]
+        self.min_baseline_measurements = config["min_baseline_measurements"]
+        self.z_threshold = config["z_threshold"]
+
+    def detect(self, animals: Sequence[Animal], logs: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        animals: sürüdeki hayvanlar (tür, yaş ve eşikler için)
+        logs: get_herd_health_logs() sütunları (animal_id, measured_at, temperature)
+
+        Returns: en yeni gün önce olacak şekilde grup uyarıları
+        """
+        import numpy as np
+
+        if not animals or not logs.get("animal_id"):
+            return []
+
+        rules = get_health_rules()
+        index = {str(animal.id): i for i, animal in enumerate(animals)}
+        species_names, animal_group = np.unique(
+            np.array([animal.tur or "Diğer" for animal in animals], dtype=object),
+            return_inverse=True,
+        )
+        # Her hayvanın uyarı (ateş) eşiği: türüne ve yaş bandına göre
+        warning_temp, _, _ = rules.threshold_arrays(
+            rules.codes_for([animal.tur for animal in animals]),
+            rules.bands_for([animal.yas or 0 for animal in animals]),
+        )
+
+        # Ölçümleri hayvan indeksine, güne ve sayıya çevir (bilinmeyen hayvanlar atılır)
+        # Zamanı olmayan satırlar tarihe çevrilmeden atılır ("None" datetime64'e çevrilemez)
+        lookup = index.get
+        rows = [(lookup(str(a), -1), str(m)[:10], t)
+                for a, m, t in zip(logs["animal_id"], logs["measured_at"], logs["temperature"])
+                if m not in (None, "")]
+        if not rows:
+            return []
+        ids, dates, temperatures = zip(*rows)
+        animal_idx = np.array(ids, dtype=np.int64)
+        days = np.array(dates, dtype="datetime64[D]")
+        temps = np.array(temperatures, dtype=float)
+        keep = (animal_idx >= 0) & ~np.isnan(temps) & ~np.isnat(days)
+        animal_idx, days, temps = animal_idx[keep], days[keep], temps[keep]
+        if not len(animal_idx):
+            return []
+
+        first_day = days.min()
+        day_idx = (days - first_day).astype(np.int64)
+        n_days = int(day_idx.max()) + 1
+        n_animals = len(animals)
+        n_groups = len(species_names)
+
+        # Gün başına hayvan tekilleştirme: (gün, hayvan) -> o günkü en yüksek ateş
+        pair = day_idx * n_animals + animal_idx
+        order = np.lexsort((temps, pair))
+        pair, temps_sorted = pair[order], temps[order]
+        last_of_pair = np.r_[pair[1:] != pair[:-1], True]
+        pair, day_max = pair[last_of_pair], temps_sorted[last_of_pair]
+        pair_day, pair_animal = pair // n_animals, pair % n_animals
+        feverish = day_max > warning_temp[pair_animal]
+
+        # Gün × tür ızgarası: ölçülen ve ateşli hayvan sayıları
+        cell = animal_group[pair_animal] * n_days + pair_day
+        measured = np.bincount(cell, minlength=n_groups * n_days).reshape(n_groups, n_days)
+        fever = np.bincount(cell[feverish], minlength=n_groups * n_days).reshape(n_groups, n_days)
+
+        # Kayan taban çizgisi: önceki `baseline_days` gün (bugün hariç), kümülatif toplamlarla
+        window = self.baseline_days
+        def rolling(grid):
+            cumulative = np.concatenate([np.zeros((n_groups, 1)), np.cumsum(grid, axis=1)], axis=1)
+            end = np.arange(n_days)
+            start = np.maximum(end - window, 0)
+            return cumulative[:, end] - cumulative[:, start]
+        base_measured = rolling(measured)
+        base_fever = rolling(fever)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            baseline_rate = np.where(base_measured > 0, base_fever / base_measured, 0.0)
+            baseline_rate = np.maximum(baseline_rate, self.baseline_floor)
+            rate = np.where(measured > 0, fever / measured, 0.0)
+            # Binom yaklaşımıyla beklenenden sapma
+            expected = measured * baseline_rate
+            z = (fever - expected) / np.sqrt(expected * (1 - baseline_rate))
+
+        # Taban çizgisi oturmamış günler değerlendirilmez: türün ilk `baseline_days` günü ve
+        # önceki penceresinde yeterli ölçüm olmayan günler (yoksa olağan ateş oranı yüksek
+        # bir tür, ilk gününde alt sınıra göre salgın sanılır)
+        first_measured = np.argmax(measured > 0, axis=1)
+        established = (
+            (np.arange(n_days)[None, :] >= (first_measured + window)[:, None])
+            & (base_measured >= self.min_baseline_measurements)
+        )
+        flagged = (
+            established
+            & (fever >= self.min_animals)
+            & (rate >= self.min_rate)
+            & (z >= self.z_threshold)
+        )
+        groups, day_cells = np.nonzero(flagged)
+
+        alerts = []
+        for group, day in zip(groups.tolist(), day_cells.tolist()):
+            date = (first_day + np.timedelta64(day, "D")).astype(object)
+            alerts.append(self._alert(
+                date, species_names[group], int(fever[group, day]), int(measured[group, day]),
+                float(rate[group, day]), float(baseline_rate[group, day]), float(z[group, day]),
+            ))
+        alerts.sort(key=lambda alert: (alert["date"], alert["z"]), reverse=True)
+        return alerts
+
+    def _alert(self, date, species: str, fever_count: int, measured_count: int,
+               rate: float, baseline_rate: float, z: float) -> Dict[str, Any]:
+        level = "CRITICAL" if z >= 2 * self.z_threshold else "WARNING"
+        return {
+            "type": level,
+            "icon": "🦠",
+            "date": date,
+            "tur": species,
+            "fever_count": fever_count,
+            "measured_count": measured_count,
+            "rate": rate,
+            "baseline_rate": baseline_rate,
+            "z": z,
+            "message": (
+                f"{date.strftime('%d.%m.%Y')} - {species}: {measured_count} hayvandan "
+                f"{fever_count} tanesi ateşli (%{rate * 100:.0f}, olağan: %{baseline_rate * 100:.0f})"
+            ),
+        }
@@ -0,0 +1,207 @@
+"""
+Fotoğraflar için kalıcı HTTP disk önbelleği.
+
+Her URL, içeriği ve doğrulama bilgileri (ETag / Last-Modified / geçerlilik süresi)
+ile birlikte diskte saklanır. Süresi dolan kayıtlar koşullu istekle (304) doğrulanır,
+toplam boyut sınırı aşılınca en uzun süredir kullanılmayan dosyalar silinir (LRU).
+Küçük resimler (thumbs/ altında, aynı anahtarla) de bu sınıra sayılır ve URL'nin
+içeriğiyle birlikte silinir.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 4) -> requests.Session:
+    """Bağlantıları yeniden kullanan paylaşımlı HTTP oturumu oluştur."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PhotoDiskCache:
+    """URL anahtarlı, boyut sınırlı (LRU) ve yeniden doğrulamalı disk önbelleği."""
+
+    BODY_SUFFIX = ".bin"
+    META_SUFFIX = ".json"
+    THUMB_DIR = "thumbs"
+    THUMB_PATTERN = "*_*.jpg"
+
+    def __init__(self, cache_dir, max_bytes: int, session: Optional[requests.Session] = None,
+                 timeout: float = 10):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.thumb_dir = self.cache_dir / self.THUMB_DIR
+        self._lock = threading.Lock()
+        self._total_bytes = sum(
+            p.stat().st_size for p in self.cache_dir.glob(f"*{self.BODY_SUFFIX}")
+        ) + sum(p.stat().st_size for p in self.thumb_dir.glob(self.THUMB_PATTERN))
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return (self.cache_dir / f"{key}{self.BODY_SUFFIX}",
+                self.cache_dir / f"{key}{self.META_SUFFIX}")
+
+    def _read_meta(self, meta_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _touch(path: Path):
+        """LRU için son kullanım zamanını güncelle"""
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _max_age(response: requests.Response) -> float:
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-cache" in cache_control or "no-store" in cache_control:
+            return 0
+        match = re.search(r"max-age=(\d+)", cache_control)
+        return float(match.group(1)) if match else 0
+
+    def get_cached(self, url: str) -> Optional[bytes]:
+        """Ağa çıkmadan, diskte varsa içeriği döndür."""
+        body_path, _ = self._paths(self.key_for(url))
+        try:
+            data = body_path.read_bytes()
+        except OSError:
+            return None
+        self._touch(body_path)
+        return data
+
+    def fetch(self, url: str) -> Optional[bytes]:
+        """
+        URL içeriğini döndür. Taze kayıt diskten okunur, süresi dolmuş kayıt
+        ETag / Last-Modified ile doğrulanır; ağ hatasında eldeki kopya kullanılır.
+        """
+        key = self.key_for(url)
+        body_path, meta_path = self._paths(key)
+        meta = self._read_meta(meta_path) if body_path.exists() else None
+
+        if meta and meta.get("expires", 0) > time.time():
+            cached = self.get_cached(url)
+            if cached is not None:
+                return cached
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"Fotoğraf indirme hatası: {e}")
+            return self.get_cached(url)
+
+        if response.status_code == 304 and meta:
+            meta["expires"] = time.time() + self._max_age(response)
+            self._write_meta(meta_path, meta)
+            return self.get_cached(url)
+
+        if response.status_code != 200:
+            print(f"Fotoğraf indirilemedi ({response.status_code}): {url}")
+            return None
+
+        content = response.content
+        self._store(key, url, content, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "expires": time.time() + self._max_age(response),
+        })
+        return content
+
+    def store(self, url: str, content: bytes):
+        """Yüklenen bir dosyayı (ör. upload sonrası) önbelleğe doğrudan ekle."""
+        self._store(self.key_for(url), url, content, {"url": url, "expires": 0})
+
+    def _write_meta(self, meta_path: Path, meta: Dict[str, Any]):
+        tmp_path = meta_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_path)
+        except OSError as e:
+            print(f"Önbellek yazma hatası: {e}")
+
+    def _store(self, key: str, url: str, content: bytes, meta: Dict[str, Any]):
+        body_path, meta_path = self._paths(key)
+        tmp_path = body_path.with_suffix(".part")
+        with self._lock:
+            try:
+                old_size = body_path.stat().st_size if body_path.exists() else 0
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, body_path)
+            except OSError as e:
+                print(f"Önbellek yazma hatası: {e}")
+                return
+            self._total_bytes += len(content) - old_size
+            self._write_meta(meta_path, meta)
+            self._evict_if_needed()
+
+    def add_thumbnail(self, path: Path, old_size: int = 0):
+        """Yazılan küçük resmi boyut sınırına say (ThumbnailStore çağırır; old_size: üzerine yazılanın boyutu)."""
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes += size - old_size
+            self._evict_if_needed()
+
+    def _evict_if_needed(self):
+        """
+        Toplam boyut sınırı aşıldıysa en eski kullanılan kayıtları sil (kilit altında çağrılır).
+        Bir kayıt URL'nin içeriği ve küçük resimleridir; son kullanımı en yeni dosyasıdır.
+        """
+        if self._total_bytes <= self.max_bytes:
+            return
+        # anahtar -> [son kullanım, toplam boyut, dosyalar]
+        entries: Dict[str, list] = {}
+        files = [(path.stem, path) for path in self.cache_dir.glob(f"*{self.BODY_SUFFIX}")]
+        files += [(path.stem.rsplit("_", 1)[0], path) for path in self.thumb_dir.glob(self.THUMB_PATTERN)]
+        for key, path in files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = entries.setdefault(key, [0.0, 0, []])
+            entry[0] = max(entry[0], stat.st_mtime)
+            entry[1] += stat.st_size
+            entry[2].append(path)
+
+        for key, (_, size, paths) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+            (self.cache_dir / f"{key}{self.META_SUFFIX}").unlink(missing_ok=True)
+            self._total_bytes -= size
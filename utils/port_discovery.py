@@ -0,0 +1,189 @@
+"""
+RFID okuyucu (Arduino) seri port keşfi.
+
+Son çalışan portlar bellekte ve diskte tutulur; açılışta sadece hâlâ var olup
+olmadıklarına bakılır (ucuz). Tüm portların taranması yalnızca kayıtlı portlar
+açılamadığında veya yeni bir cihaz takıldığında yapılır. Takma/çıkarma Linux'ta
+pyudev kuruluysa udev bildirimiyle, aksi halde port listesinin periyodik
+karşılaştırılmasıyla fark edilir. SERIAL_CONFIG["readers"] ile sabitlenen
+okuyucular için keşif kullanılmaz; tartım istasyonunun cihazlarına
+(STATION_CONFIG) ayrılan portlar hiçbir zaman okuyucu sayılmaz.
+
+Tüm metotlar okuyucu thread'inden çağrılır; arayüz thread'ini bekletmez.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import serial.tools.list_ports
+
+from config import SERIAL_CONFIG, STATION_CONFIG
+
+
+def station_ports() -> Set[str]:
+    """Tartı/termometreye ayrılmış portlar (aynı portu iki okuyucu paylaşırsa baytlar bölünür)"""
+    ports = set()
+    for key in ("scale", "thermometer"):
+        device = STATION_CONFIG.get(key)
+        if device and device.get("port"):
+            ports.add(os.path.realpath(device["port"]))
+    return ports
+
+
+class PortDiscovery:
+    """Önbellekli, takma/çıkarmaya duyarlı port bulucu"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        config = config or SERIAL_CONFIG
+        self.rescan_interval = config["rescan_interval_seconds"]
+        self.cache_file = Path(config["port_cache_file"]) if config.get("port_cache_file") else None
+        self._lock = threading.Lock()
+        self._cached: List[str] = self._load_cached()
+        # Son taramada görülen cihazlar (periyodik karşılaştırma için; None: henüz bakılmadı)
+        self._known: Optional[Set[str]] = None
+        self._monitor = None
+        self._monitor_checked = False
+        # Kayıtlı bir port başarısız oldu; keşif thread'i tam tarama yapar
+        self.rescan_requested = threading.Event()
+
+    def find_ports(self) -> List[str]:
+        """Bağlanılacak portlar: kayıtlılardan hâlâ takılı olanlar, hiçbiri yoksa tarama"""
+        return self.cached_ports() or self.rescan()
+
+    def cached_ports(self) -> List[str]:
+        """Kayıtlı portlardan hâlâ takılı olanlar (tarama yapılmaz)"""
+        excluded = station_ports()
+        return [port for port in self._cached
+                if self.is_present(port) and os.path.realpath(port) not in excluded]
+
+    def rescan(self) -> List[str]:
+        """Tüm portları tara ve uygun olanları kaydet"""
+        found = self.matching_ports()
+        if found:
+            print(f"--> BULUNAN OKUYUCULAR: {', '.join(found)}")
+        else:
+            print("--> HİÇBİR UYGUN PORT BULUNAMADI!")
+        self._remember(found)
+        return found
+
+    def matching_ports(self) -> List[str]:
+        """Arduino'ya benzeyen tüm portlar (istasyon cihazlarının portları hariç)"""
+        ports = list(serial.tools.list_ports.comports())
+        with self._lock:
+            self._known = {p.device for p in ports}
+        excluded = station_ports()
+        return [p.device for p in ports
+                if self._looks_like_reader(p) and os.path.realpath(p.device) not in excluded]
+
+    def port_failed(self, port: str):
+        """Port açılamadı/koptu: kayıtlılardan çıkar ve yeniden tarama iste"""
+        if port in self._cached:
+            self._remember([p for p in self._cached if p != port])
+            self.rescan_requested.set()
+
+    def wait_for_change(self, timeout: float, should_continue=lambda: True) -> bool:
+        """
+        Cihaz takılana/çıkarılana ya da süre dolana kadar bekle.
+        Returns: değişiklik görüldüyse True
+        """
+        monitor = self._udev_monitor()
+        deadline = time.monotonic() + timeout
+        if monitor is not None:
+            while should_continue() and time.monotonic() < deadline:
+                # Kısa aralıklarla; böylece durdurma isteği de fark edilir
+                if monitor.poll(timeout=0.5) is not None:
+                    return True
+            return False
+
+        # pyudev yoksa: port listesini aralıklarla karşılaştır (comports ucuz değil)
+        with self._lock:
+            known = self._known
+        if known is None:
+            # Kayıtlı portlarla açıldıysa tarama yapılmadı; ilk liste karşılaştırma tabanıdır
+            # (boş kümeyle karşılaştırmak her açılışta sahte bir "takıldı" üretirdi)
+            known = {p.device for p in serial.tools.list_ports.comports()}
+            with self._lock:
+                if self._known is None:
+                    self._known = known
+        before = set(known)
+        next_check = time.monotonic() + self.rescan_interval
+        while should_continue() and time.monotonic() < deadline:
+            if time.monotonic() >= next_check:
+                current = {p.device for p in serial.tools.list_ports.comports()}
+                if current != before:
+                    with self._lock:
+                        self._known = current
+                    return True
+                next_check = time.monotonic() + self.rescan_interval
+            time.sleep(0.1)
+        return False
+
+    @staticmethod
+    def _looks_like_reader(port) -> bool:
+        # Mac için usbserial veya usbmodem
+        description = port.description or ""
+        return ("usbmodem" in port.device or "usbserial" in port.device or
+                "Arduino" in description or "CH340" in description)
+
+    @staticmethod
+    def is_present(port: str) -> bool:
+        # POSIX'te cihaz dosyasına bakmak yeterli; COM portlarında açmayı denemek kalır
+        if os.name == "nt":
+            return True
+        return os.path.exists(port)
+
+    def _udev_monitor(self):
+        """Linux'ta pyudev kuruluysa tty takma/çıkarma izleyicisi (yoksa None)"""
+        if not self._monitor_checked:
+            self._monitor_checked = True
+            try:
+                import pyudev
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by(subsystem="tty")
+                monitor.start()
+                self._monitor = monitor
+            except Exception:
+                # pyudev opsiyonel: kurulu değilse periyodik karşılaştırma kullanılır
+                pass
+        return self._monitor
+
+    # -------- Kalıcılık --------
+
+    def _remember(self, ports: List[str]):
+        with self._lock:
+            if ports == self._cached:
+                return
+            self._cached = list(ports)
+        if self.cache_file is None:
+            return
+        try:
+            if ports:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self.cache_file.write_text("\n".join(ports), encoding="utf-8")
+            elif self.cache_file.exists():
+                self.cache_file.unlink()
+        except Exception as e:
+            print(f"Port kaydı yazılamadı: {e}")
+
+    def _load_cached(self) -> List[str]:
+        if self.cache_file is None or not self.cache_file.exists():
+            return []
+        try:
+            return [line.strip() for line in self.cache_file.read_text(encoding="utf-8").splitlines()
+                    if line.strip()]
+        except Exception:
+            return []
+
+
+_port_discovery: Optional[PortDiscovery] = None
+
+
+def get_port_discovery() -> PortDiscovery:
+    """Uygulama genelinde paylaşılan port bulucuyu döndür."""
+    global _port_discovery
+    if _port_discovery is None:
+        _port_discovery = PortDiscovery(SERIAL_CONFIG)
+    return _port_discovery
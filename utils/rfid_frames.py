@@ -0,0 +1,325 @@
+"""
+RFID okuyucudan gelen ham baytları doğrulanmış kart kimliklerine ayırma.
+
+Her okuyucu biçimi için bir ayrıştırıcı vardır; hepsi feed(baytlar) ile parça parça
+beslenir, yarım kalan çerçeveyi bir sonraki okumaya kadar saklar ve sadece geçerli
+(biçimi/sağlama toplamı tutan) kimlikleri döndürür. Gürültü ve yarım satırlar
+uygulamaya (ve veritabanı aramalarına) ulaşmadan elenir.
+
+Seri porttan gelen parçalar yeniden kullanılan tek bir bytearray'de biriktirilir;
+her tam çerçeve için sadece bir kopya oluşturulur (bayt başına nesne yok).
+
+Biçim SERIAL_CONFIG["protocol"] (veya okuyucu başına "protocol") ile seçilir:
+    "line"     : satır sonu ile biten ASCII kimlik (mevcut Arduino çizimi)
+    "rdm6300"  : STX + 10 hex veri + 2 hex XOR sağlaması + ETX (125 kHz okuyucular)
+    "binary"   : başlangıç baytı + uzunluk + veri + XOR sağlaması
+Tartım istasyonundaki cihazlar da aynı okuyucu thread'iyle okunur; bunların
+ayrıştırıcıları kimlik yerine ölçüm değerini metin olarak döndürür:
+    "scale"       : tartı göstergesi satırları (ör. "ST,GS,+0000412.5kg" veya "412.5 kg")
+    "thermometer" : termometre satırları (ör. "38.6", "T=38.6C", "101.5F")
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Type
+
+
+class FrameParser(ABC):
+    """Ayrıştırıcı temeli: parça parça beslenir, geçerli kimlikleri döndürür"""
+
+    def __init__(self, max_frame_bytes: int = 64, **options):
+        self.max_frame_bytes = max_frame_bytes
+        self._buffer = bytearray()
+        # Elenen (bozuk/sağlaması tutmayan) çerçeve sayısı
+        self.rejected = 0
+        # Satır biçimleri: taşan satırın geri kalanı bir sonraki satır sonuna kadar atılır
+        self._discarding = False
+
+    @abstractmethod
+    def feed(self, data) -> List[str]:
+        """Yeni gelen baytları ekle, tamamlanan geçerli kimlikleri döndür"""
+        pass
+
+    def reset(self):
+        """Yarım kalmış çerçeveyi at (yeniden bağlanınca)"""
+        self._buffer.clear()
+        self._discarding = False
+
+    def _complete_lines(self, data) -> List[bytes]:
+        """
+        Satır sonu (\n) ile tamamlanan, boş olmayan satırlar (baştaki/sondaki boşluklar atılır).
+        Satır sonu gelmeden max_frame_bytes'ı aşan satır bozuk sayılır; başı atıldığı için
+        geri kalanı da kesik bir kimlik/ölçüm olur ve bir sonraki satır sonuna kadar atılır.
+        """
+        buffer = self._buffer
+        buffer += data
+        lines = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(buffer[start:end]).strip()
+            start = end + 1
+            if self._discarding:
+                self._discarding = False
+                self.rejected += 1
+                continue
+            if line:
+                lines.append(line)
+        if start:
+            del buffer[:start]
+        # Satır sonu gelmeden büyüyen veri bozuk sayılır (ör. yanlış baud hızı)
+        if len(buffer) > self.max_frame_bytes:
+            buffer.clear()
+            if not self._discarding:
+                self.rejected += 1
+                self._discarding = True
+        return lines
+
+
+class LineParser(FrameParser):
+    """
+    Satır sonu (\\n) ile biten ASCII kimlikler; \\r ve baştaki/sondaki boşluklar atılır.
+    Yazdırılamayan bayt içeren veya tag_pattern'e uymayan satırlar elenir.
+    """
+
+    DEFAULT_PATTERN = r"[0-9A-Za-z][0-9A-Za-z :\-]{2,30}[0-9A-Za-z]"
+
+    def __init__(self, max_frame_bytes: int = 64, tag_pattern: str = None, **options):
+        super().__init__(max_frame_bytes)
+        self._pattern = re.compile((tag_pattern or self.DEFAULT_PATTERN).encode("ascii"))
+
+    def feed(self, data) -> List[str]:
+        tags = []
+        for frame in self._complete_lines(data):
+            # Desen sadece ASCII karakterlere izin verir; gürültü baytları burada düşer
+            if self._pattern.fullmatch(frame):
+                tags.append(frame.decode("ascii"))
+            else:
+                self.rejected += 1
+        return tags
+
+
+class Rdm6300Parser(FrameParser):
+    """
+    RDM6300 / EM4100 biçimi: 0x02, 10 ASCII hex veri, 2 ASCII hex sağlama, 0x03.
+    Sağlama: 5 veri baytının XOR'u. Kimlik 10 hanelik büyük harf hex olarak döner.
+    """
+
+    STX = 0x02
+    ETX = 0x03
+    FRAME_LENGTH = 14
+
+    def feed(self, data) -> List[str]:
+        buffer = self._buffer
+        buffer += data
+        tags = []
+        start = 0
+        while True:
+            start = buffer.find(self.STX, start)
+            if start < 0:
+                # STX yoksa hiçbir bayt çerçeveye ait değil
+                buffer.clear()
+                return tags
+            if len(buffer) - start < self.FRAME_LENGTH:
+                break
+            frame = bytes(buffer[start + 1:start + self.FRAME_LENGTH - 1])
+            if buffer[start + self.FRAME_LENGTH - 1] == self.ETX and self._valid(frame):
+                tags.append(frame[:10].decode("ascii").upper())
+                start += self.FRAME_LENGTH
+            else:
+                # Bozuk çerçeve: bir sonraki STX'ten yeniden eşleş
+                self.rejected += 1
+                start += 1
+        if start:
+            del buffer[:start]
+        return tags
+
+    @staticmethod
+    def _valid(frame: bytes) -> bool:
+        try:
+            values = bytes.fromhex(frame.decode("ascii"))
+        except ValueError:
+            return False
+        checksum = 0
+        for value in values[:5]:
+            checksum ^= value
+        return checksum == values[5]
+
+
+class BinaryFrameParser(FrameParser):
+    """
+    İkili paket: başlangıç baytı (start_byte), uzunluk (1 bayt, veri uzunluğu), veri,
+    sağlama (uzunluk ve veri baytlarının XOR'u). Kimlik verinin büyük harf hex'i olarak döner.
+    """
+
+    def __init__(self, max_frame_bytes: int = 64, start_byte: int = 0xAA,
+                 min_length: int = 4, max_length: int = 16, **options):
+        super().__init__(max_frame_bytes)
+        self.start_byte = start_byte
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def feed(self, data) -> List[str]:
+        buffer = self._buffer
+        buffer += data
+        tags = []
+        start = 0
+        while True:
+            start = buffer.find(self.start_byte, start)
+            if start < 0:
+                buffer.clear()
+                return tags
+            if len(buffer) - start < 2:
+                break
+            length = buffer[start + 1]
+            if not self.min_length <= length <= self.max_length:
+                # Uzunluk baytı anlamsız: bu başlangıç baytı veri içindeymiş
+                self.rejected += 1
+                start += 1
+                continue
+            end = start + 2 + length + 1
+            if len(buffer) < end:
+                break
+            checksum = 0
+            for value in buffer[start + 1:end - 1]:
+                checksum ^= value
+            if checksum == buffer[end - 1]:
+                tags.append(bytes(buffer[start + 2:end - 1]).hex().upper())
+                start = end
+            else:
+                self.rejected += 1
+                start += 1
+        if start:
+            del buffer[:start]
+        return tags
+
+
+class _MeasurementLineParser(FrameParser):
+    """Satır sonu ile biten ölçüm satırları; her satır _parse_line ile değere çevrilir"""
+
+    NUMBER = re.compile(rb"([-+]?\s*\d+(?:[.,]\d+)?)\s*([A-Za-z]*)")
+
+    def feed(self, data) -> List[str]:
+        values = []
+        for line in self._complete_lines(data):
+            value = self._parse_line(line)
+            if value is None:
+                self.rejected += 1
+            elif value:
+                values.append(value)
+        return values
+
+    def _number(self, line: bytes):
+        """Satırdaki son sayı ve birimi (yoksa None)"""
+        matches = self.NUMBER.findall(line)
+        if not matches:
+            return None
+        number, unit = matches[-1]
+        try:
+            value = float(number.replace(b" ", b"").replace(b",", b"."))
+        except ValueError:
+            return None
+        return value, unit.decode("ascii").lower()
+
+    @abstractmethod
+    def _parse_line(self, line: bytes):
+        """Returns: ölçüm metni, "" (geçerli ama henüz/artık bildirilmeyecek) veya None (bozuk)"""
+        pass
+
+
+class ScaleParser(_MeasurementLineParser):
+    """
+    Tartı göstergesinin sürekli gönderdiği satırlar. Hayvan tartıya çıktığında sadece
+    bir kez, ağırlık oturunca bildirilir: satırda ST/US bayrağı varsa ona, yoksa art arda
+    `stable_readings` okumanın `stable_tolerance_kg` içinde kalmasına bakılır. Ağırlık
+    `empty_kg` altına inince (hayvan indi) bir sonraki hayvan için yeniden kurulur.
+    Kilo cinsinden, tek ondalıklı metin döner (lb okumaları çevrilir).
+    """
+
+    LB_TO_KG = 0.45359237
+
+    def __init__(self, max_frame_bytes: int = 64, empty_kg: float = 5.0, stable_readings: int = 3,
+                 stable_tolerance_kg: float = 0.5, **options):
+        super().__init__(max_frame_bytes)
+        self.empty_kg = empty_kg
+        self.stable_readings = stable_readings
+        self.stable_tolerance_kg = stable_tolerance_kg
+        self._recent: List[float] = []
+        self._armed = True
+
+    def _parse_line(self, line: bytes):
+        parsed = self._number(line)
+        if parsed is None:
+            return None
+        weight, unit = parsed
+        if unit in ("lb", "lbs"):
+            weight *= self.LB_TO_KG
+        elif unit not in ("", "kg"):
+            return None
+        if weight < self.empty_kg:
+            self._armed = True
+            self._recent.clear()
+            return ""
+        if not self._armed:
+            return ""
+        flag = line[:2].upper()
+        if flag in (b"ST", b"US"):
+            stable = flag == b"ST"
+        else:
+            recent = self._recent
+            recent.append(weight)
+            del recent[:-self.stable_readings]
+            stable = (len(recent) == self.stable_readings
+                      and max(recent) - min(recent) <= self.stable_tolerance_kg)
+        if not stable:
+            return ""
+        self._armed = False
+        self._recent.clear()
+        return f"{weight:.1f}"
+
+    def reset(self):
+        super().reset()
+        self._recent.clear()
+        self._armed = True
+
+
+class ThermometerParser(_MeasurementLineParser):
+    """Her satır bir ölçüm; °C cinsinden tek ondalıklı metin döner (F okumaları çevrilir)"""
+
+    def _parse_line(self, line: bytes):
+        parsed = self._number(line)
+        if parsed is None:
+            return None
+        temperature, unit = parsed
+        if unit == "f":
+            temperature = (temperature - 32) * 5 / 9
+        elif unit not in ("", "c"):
+            return None
+        return f"{temperature:.1f}"
+
+
+def normalize_tag(tag) -> str:
+    """Karşılaştırma için kimlik: büyük harf, boşluk/':'/'-' ayraçları olmadan"""
+    if not tag:
+        return ""
+    return re.sub(r"[\s:\-]", "", str(tag)).upper()
+
+
+# Yeni biçimler buraya eklenir
+PARSERS: Dict[str, Type[FrameParser]] = {
+    "line": LineParser,
+    "rdm6300": Rdm6300Parser,
+    "binary": BinaryFrameParser,
+    "scale": ScaleParser,
+    "thermometer": ThermometerParser,
+}
+
+
+def create_parser(protocol: str, config: Dict[str, Any] = None) -> FrameParser:
+    """Biçim adına göre ayrıştırıcı oluştur (seçenekler: SERIAL_CONFIG["protocol_options"])"""
+    if protocol not in PARSERS:
+        raise ValueError(f"Bilinmeyen RFID biçimi: {protocol}")
+    config = config or {}
+    options = dict(config.get("protocol_options", {}).get(protocol, {}))
+    return PARSERS[protocol](config.get("max_frame_bytes", 64), **options)
@@ -0,0 +1,203 @@
+"""
+Sürü yoklaması: ahır dolaşılırken okunan kartların sürü kayıtlarıyla karşılaştırılması.
+
+Yoklama boyunca okuyucu açık kalır; her okuma zaman damgasıyla oturuma eklenir
+(okuma başına sadece liste ekleme ve sayaç artırma). Oturum bitince sürünün
+rfid_tag dizinine karşı küme farklarıyla:
+    - eksikler     : kartı olup okunmayan hayvanlar
+    - beklenmeyen  : okunan ama sürüde kayıtlı olmayan kartlar
+    - çift okunan  : aynı oturumda ayrı geçişlerde tekrar okunan kartlar (iki kez sayılan hayvan)
+    - paylaşılan   : birden çok hayvana kayıtlı kartlar (veri hatası)
+hesaplanır. Her oturum JSON olarak saklanır; görülen/eksik hayvan id'leri özet olarak
+ayrıca yazılır, böylece bir önceki yoklamayla fark okumalar yeniden işlenmeden bulunur.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from config import ROLL_CALL_CONFIG
+from models.animal import Animal
+from utils.rfid_frames import normalize_tag
+
+
+def herd_tag_index(animals: Iterable[Animal]) -> Dict[str, List[Animal]]:
+    """Kart -> o karta kayıtlı hayvanlar (normalleştirilmiş kart; kartsızlar atlanır)"""
+    index: Dict[str, List[Animal]] = {}
+    for animal in animals:
+        tag = normalize_tag(animal.rfid_tag)
+        if tag:
+            index.setdefault(tag, []).append(animal)
+    return index
+
+
+class RollCallSession:
+    """Tek bir yoklama: okunan kartlar (sırasıyla, zaman damgalı) ve kart başına sayaç"""
+
+    VERSION = 1
+
+    def __init__(self, started_at: Optional[datetime] = None, duplicate_gap_seconds: Optional[float] = None):
+        self.duplicate_gap_seconds = (duplicate_gap_seconds if duplicate_gap_seconds is not None
+                                      else ROLL_CALL_CONFIG["duplicate_gap_seconds"])
+        self.started_at = started_at or datetime.now()
+        self.ended_at: Optional[datetime] = None
+        # Okumalar sütun sütun: kart, zaman (time.time), okuyucu
+        self.tags: List[str] = []
+        self.times: List[float] = []
+        self.readers: List[str] = []
+        # Kart -> okunma sayısı (ekleme sırası ilk görülme sırasıdır)
+        self.counts: Dict[str, int] = {}
+        # Kart -> ayrı geçiş sayısı ve son okunma anı (hayvan antende beklerken okumalar
+        # tekrar eder; arada duplicate_gap_seconds'tan uzun boşluk varsa yeni geçiştir)
+        self.passes: Dict[str, int] = {}
+        self._last_seen: Dict[str, float] = {}
+
+    def add(self, events) -> List[str]:
+        """
+        Okumaları (TagEvent) ekle.
+        Returns: oturumda ilk kez görülen kartlar
+        """
+        counts, passes, last_seen = self.counts, self.passes, self._last_seen
+        gap = self.duplicate_gap_seconds
+        new_tags = []
+        for event in events:
+            tag = normalize_tag(event.tag)
+            if not tag:
+                continue
+            timestamp = event.timestamp
+            self.tags.append(tag)
+            self.times.append(timestamp)
+            self.readers.append(event.reader_id)
+            previous = counts.get(tag, 0)
+            counts[tag] = previous + 1
+            if not previous:
+                new_tags.append(tag)
+                passes[tag] = 1
+            elif timestamp - last_seen[tag] > gap:
+                passes[tag] += 1
+            last_seen[tag] = timestamp
+        return new_tags
+
+    def end(self):
+        if self.ended_at is None:
+            self.ended_at = datetime.now()
+
+    @property
+    def read_count(self) -> int:
+        return len(self.tags)
+
+    def report(self, animals: Sequence[Animal]) -> Dict[str, Any]:
+        """Sürüyle karşılaştır (küme farkları; binlerce kart için milisaniyeler)"""
+        by_tag = herd_tag_index(animals)
+        expected = set(by_tag)
+        seen = set(self.counts)
+        present_tags = seen & expected
+        missing_tags = expected - seen
+        return {
+            "present": [animal for tag in present_tags for animal in by_tag[tag]],
+            "missing": sorted((animal for tag in missing_tags for animal in by_tag[tag]),
+                              key=lambda animal: ((animal.tur or ""), (animal.isim or ""))),
+            "unexpected": sorted(seen - expected),
+            "duplicate_reads": {tag: count for tag, count in self.passes.items() if count > 1},
+            "shared_tags": {tag: owners for tag, owners in by_tag.items() if len(owners) > 1},
+            "untagged": sum(1 for animal in animals if not normalize_tag(animal.rfid_tag)),
+            "expected_count": len(expected),
+        }
+
+    def summary(self, report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Önceki yoklamayla karşılaştırma için kaydedilen özet"""
+        summary = {
+            "started_at": self.started_at.isoformat(),
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "read_count": self.read_count,
+            "tag_count": len(self.counts),
+        }
+        if report is not None:
+            summary.update({
+                "seen_ids": sorted(str(animal.id) for animal in report["present"]),
+                "missing_ids": sorted(str(animal.id) for animal in report["missing"]),
+                "unexpected_tags": list(report["unexpected"]),
+            })
+        return summary
+
+    def to_dict(self, report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Kaydedilecek hali (listeler kopyalanır; arka planda yazılabilir)"""
+        return {
+            "version": self.VERSION,
+            "summary": self.summary(report),
+            "reads": {
+                "tag": list(self.tags),
+                "time": list(self.times),
+                "reader": list(self.readers),
+            },
+        }
+
+
+def diff_summaries(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    İki yoklama özetinin farkı (hayvan id'leri).
+
+    Returns: {"newly_missing": önceki yoklamada vardı, bu sefer yok,
+              "found": önceki yoklamada eksikti, bu sefer okundu,
+              "still_missing": iki yoklamada da eksik}
+    """
+    previous_seen = set(previous.get("seen_ids", []))
+    previous_missing = set(previous.get("missing_ids", []))
+    current_seen = set(current.get("seen_ids", []))
+    current_missing = set(current.get("missing_ids", []))
+    return {
+        "newly_missing": sorted(previous_seen & current_missing),
+        "found": sorted(previous_missing & current_seen),
+        "still_missing": sorted(previous_missing & current_missing),
+    }
+
+
+class RollCallStore:
+    """Yoklama oturumlarının diskteki kayıtları (oturum başına bir JSON dosyası)"""
+
+    def __init__(self, directory: Optional[str] = None, keep: Optional[int] = None):
+        self.directory = Path(directory or ROLL_CALL_CONFIG["sessions_dir"])
+        self.keep = keep if keep is not None else ROLL_CALL_CONFIG["keep_sessions"]
+
+    def path_for(self, session: RollCallSession) -> Path:
+        return self.directory / f"{session.started_at.strftime('%Y%m%d-%H%M%S')}.json"
+
+    def write(self, path: Path, data: Dict[str, Any]) -> bool:
+        """(Arka planda) oturumu yaz (yarım yazılmış dosya bırakmadan) ve eskileri sil"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Yoklama kaydı yazılamadı: {e}")
+            return False
+        if self.keep:
+            for old in self.sessions()[:-self.keep]:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return True
+
+    def sessions(self) -> List[Path]:
+        """Kayıtlı oturumlar, eskiden yeniye (dosya adı başlangıç zamanıdır)"""
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob("*.json"))
+
+    def latest_summary(self, exclude: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """Tamamlanmış en son yoklamanın özeti (yarım kalmış/otomatik kayıtlar atlanır)"""
+        for path in reversed(self.sessions()):
+            if path == exclude:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    summary = json.load(f).get("summary", {})
+            except Exception:
+                continue
+            if summary.get("ended_at") and "seen_ids" in summary:
+                return summary
+        return None
@@ -0,0 +1,66 @@
+"""
+Açılış süresi izleyicisi.
+
+İçe aktarma (import) ve başlatma adımlarının sürelerini kaydeder, bir zaman
+bütçesiyle karşılaştırır. Rapor için uygulamayı şöyle başlatın:
+
+    python main.py --trace-startup
+    VISIFARM_TRACE_STARTUP=1 python main.py
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+TRACE_FLAG = "--trace-startup"
+TRACE_ENV = "VISIFARM_TRACE_STARTUP"
+
+
+class StartupTracer:
+    """Açılış adımlarını (başlangıç, süre) olarak kaydeder."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []
+        self.enabled = TRACE_FLAG in sys.argv or os.getenv(TRACE_ENV, "") not in ("", "0")
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        """Bir adımın süresini ölç"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, (start - self.started_at) * 1000, (end - start) * 1000))
+
+    def mark(self, name: str):
+        """Süresiz bir olay (ör. 'ilk çizim') kaydet"""
+        self.phases.append((name, self.elapsed_ms(), 0.0))
+
+    def report(self, title: str) -> str:
+        lines = [f"--- AÇILIŞ İZİ: {title} ---"]
+        for name, start_ms, duration_ms in self.phases:
+            lines.append(f"{start_ms:9.1f} ms  +{duration_ms:8.1f} ms  {name}")
+        lines.append(f"{self.elapsed_ms():9.1f} ms  toplam")
+        return "\n".join(lines)
+
+    def check_budget(self, title: str, budget_ms: float, since_ms: float = 0.0):
+        """
+        since_ms anından bu yana geçen süreyi bütçeyle karşılaştır; bütçe aşıldıysa
+        uyar, izleme açıksa tüm adımların dökümünü yazdır.
+        """
+        elapsed = self.elapsed_ms() - since_ms
+        if self.enabled:
+            print(self.report(title))
+        if elapsed > budget_ms:
+            print(f"⚠️ {title}: {elapsed:.0f} ms sürdü (bütçe: {budget_ms:.0f} ms). "
+                  f"Ayrıntı için: python main.py {TRACE_FLAG}")
+
+
+# Uygulama genelinde tek izleyici; main.py ilk iş olarak bunu içe aktarır
+tracer = StartupTracer()
@@ -0,0 +1,182 @@
+"""
+Tartım istasyonu: tartı ve termometre okumalarını son okunan RFID kartıyla eşleştirme.
+
+Hayvan geçitten geçerken kartı okunur, tartıya çıkınca ağırlık oturur, termometre
+ölçümü gelir. Her okuma `pair_window_seconds` içinde okunmuş karta bağlanır; kart
+okumadan önce gelen okumalar da pencere süresince bekletilip sonra gelen karta verilir.
+Beklenen tüm değerler geldiğinde (veya pencere dolduğunda) hayvanın ölçümü tamamlanır,
+doğrulanır ve sağlık durumu HealthAnalyzer ile o anda yeniden hesaplanır.
+
+Sınıf Qt'den bağımsızdır; okumalar ve zaman damgaları (time.time) dışarıdan verilir.
+Tamamlanan ölçümler MeasurementQueue ile biriktirilip toplu yazılır.
+"""
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from config import STATION_CONFIG
+from models.animal import Animal
+from utils.health_analyzer import HealthAnalyzer
+
+WEIGHT = "weight"
+TEMPERATURE = "temperature"
+
+
+class WeighingStation:
+    """RFID okumalarını tartı/termometre okumalarıyla zaman penceresine göre eşleştirir"""
+
+    def __init__(self, lookup: Callable[[str], Optional[Animal]],
+                 expected: Iterable[str] = (WEIGHT, TEMPERATURE), config: Dict[str, Any] = None):
+        """
+        lookup: kart -> hayvan (AnimalCache.get_by_rfid; arayüzü bekletmemeli)
+        expected: istasyondaki cihazlar; hepsi okununca ölçüm beklemeden tamamlanır
+        """
+        config = config or STATION_CONFIG
+        self.lookup = lookup
+        self.expected = set(expected)
+        self.window = config["pair_window_seconds"]
+        self.ranges = {
+            WEIGHT: tuple(config["weight_range_kg"]),
+            TEMPERATURE: tuple(config["temperature_range_c"]),
+        }
+        self.max_weight_change = config["max_weight_change"]
+        # Ölçülmekte olan hayvan: kart, hayvan, kartın son okunduğu an, son hareket anı,
+        # gelen değerler ve okunma anları
+        self._current: Optional[Dict[str, Any]] = None
+        # Henüz kartı okunmamış okumalar: (tür, değer, zaman)
+        self._orphans: Deque[Tuple[str, float, float]] = deque()
+        # Reddedilen okumalar ve nedenleri (ekranda gösterilip take_rejected ile boşaltılır)
+        self.rejected: List[Dict[str, Any]] = []
+
+    def on_tag(self, tag: str, timestamp: float) -> List[Dict[str, Any]]:
+        """Okunan kart; önceki hayvanın (varsa) tamamlanan ölçümünü döndürür"""
+        current = self._current
+        if current is not None and current["tag"] == tag:
+            # Hayvan hâlâ antende
+            current["tag_at"] = current["seen_at"] = timestamp
+            return []
+        finished = self._finish()
+        animal = self.lookup(tag)
+        if animal is None:
+            self._reject(tag, None, "Kayıtlı olmayan kart", timestamp)
+            return finished
+        self._current = {"tag": tag, "animal": animal, "tag_at": timestamp, "seen_at": timestamp,
+                         "values": {}, "read_at": {}}
+        # Kart okunmadan önce gelen okumalar bu hayvana aittir
+        orphans, self._orphans = self._orphans, deque()
+        for kind, value, read_at in orphans:
+            if timestamp - read_at <= self.window:
+                self._current["values"][kind] = value
+                self._current["read_at"][kind] = read_at
+        return finished + self._finish_if_complete()
+
+    def on_reading(self, kind: str, value: float, timestamp: float) -> List[Dict[str, Any]]:
+        """Tartı (WEIGHT) veya termometre (TEMPERATURE) okuması"""
+        low, high = self.ranges[kind]
+        if not low <= value <= high:
+            self._reject(self._current["tag"] if self._current else None, None,
+                         f"Geçersiz {'kilo' if kind == WEIGHT else 'ateş'}: {value:g}", timestamp)
+            return []
+        current = self._current
+        if current is not None and timestamp - current["seen_at"] <= self.window:
+            # Aynı cihazdan ikinci okuma: kart arada yeniden okunduysa aynı hayvanın tekrar
+            # ölçümüdür (son okunan geçerli), okunmadıysa sıradaki hayvana aittir
+            if kind not in current["values"] or current["read_at"][kind] < current["tag_at"]:
+                current["values"][kind] = value
+                current["read_at"][kind] = current["seen_at"] = timestamp
+                return self._finish_if_complete()
+        finished = self._finish()
+        self._orphans.append((kind, value, timestamp))
+        return finished
+
+    def tick(self, now: float) -> List[Dict[str, Any]]:
+        """Periyodik çağrılır: penceresi dolan hayvanı tamamla, eski okumaları at"""
+        while self._orphans and now - self._orphans[0][2] > self.window:
+            kind, value, read_at = self._orphans.popleft()
+            self._reject(None, None, f"Kartsız okuma ({'kilo' if kind == WEIGHT else 'ateş'}: {value:g})",
+                         read_at)
+        if self._current is not None and now - self._current["seen_at"] > self.window:
+            return self._finish()
+        return []
+
+    def take_rejected(self) -> List[Dict[str, Any]]:
+        rejected, self.rejected = self.rejected, []
+        return rejected
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """İstasyon kapanırken: yarım kalan ölçümü de tamamla"""
+        return self._finish()
+
+    def _finish_if_complete(self) -> List[Dict[str, Any]]:
+        if self._current is not None and self.expected <= set(self._current["values"]):
+            return self._finish()
+        return []
+
+    def _finish(self) -> List[Dict[str, Any]]:
+        current, self._current = self._current, None
+        if current is None or not current["values"]:
+            return []
+        animal: Animal = current["animal"]
+        values = current["values"]
+        weight = values.get(WEIGHT)
+        temperature = values.get(TEMPERATURE)
+        measured_at = datetime.utcfromtimestamp(current["seen_at"])
+
+        previous = float(animal.kilo) if animal.kilo not in (None, "") else None
+        if weight is not None and previous and abs(weight - previous) / previous > self.max_weight_change:
+            # Tartıda iki hayvan veya yanlış kart olabilir; ateş yine de kaydedilir
+            self._reject(current["tag"], animal, f"Şüpheli kilo: {weight:g} (kayıtlı {previous:g})",
+                         current["seen_at"])
+            weight = None
+            if temperature is None:
+                return []
+
+        # Durum güncel bir kopyada hesaplanır (yazılamazsa bellekteki satır değişmemiş olur)
+        updated = Animal(animal.to_dict())
+        if weight is not None:
+            updated.kilo = weight
+        if temperature is not None:
+            updated.temperature = temperature
+        updated = HealthAnalyzer.update_animal_health_status(
+            updated, temperature, weight if weight is not None else previous,
+        )
+        return [{
+            "tag": current["tag"],
+            "animal": updated,
+            "animal_id": animal.id,
+            "weight": weight,
+            "temperature": temperature,
+            "measured_at": measured_at,
+        }]
+
+    def _reject(self, tag: Optional[str], animal: Optional[Animal], reason: str, timestamp: float):
+        self.rejected.append({
+            "tag": tag,
+            "animal": animal,
+            "reason": reason,
+            "time": datetime.fromtimestamp(timestamp),
+        })
+
+
+class MeasurementQueue:
+    """Tamamlanan ölçümleri toplu yazım için biriktirir (arayüz thread'inde kullanılır)"""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self._pending: List[Dict[str, Any]] = []
+
+    def add(self, measurements: List[Dict[str, Any]]) -> bool:
+        """Ekle; bir parti doldurduysa True"""
+        self._pending.extend(measurements)
+        return len(self._pending) >= self.batch_size
+
+    def take(self) -> List[Dict[str, Any]]:
+        """Bekleyenlerin hepsini al (yazılamazsa requeue ile geri konur)"""
+        batch, self._pending = self._pending, []
+        return batch
+
+    def requeue(self, batch: List[Dict[str, Any]]):
+        self._pending[:0] = batch
+
+    def __len__(self):
+        return len(self._pending)
@@ -0,0 +1,164 @@
+"""
+Arka plan görev katmanı: veritabanı / ağ işlemleri QThreadPool üzerinde çalışır.
+
+submit() bir TaskFuture döndürür; sonuç arayüz thread'inde finished/failed
+sinyalleriyle gelir. İptal edilen görevin sonucu hiçbir zaman teslim edilmez.
+Aynı anahtarla (key) gönderilen yeni görev, öncekini otomatik iptal eder
+(ör. arama kutusuna yazarken sadece son aramanın sonucu gösterilir).
+"""
+from typing import Callable, Dict, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from config import TASK_CONFIG
+
+
+class TaskFuture(QObject):
+    """Arka plandaki tek bir işlemin sonucu."""
+
+    # İşlem başarıyla bittiğinde (dönüş değeri)
+    finished = pyqtSignal(object)
+    # İşlem hata verdiğinde (hata mesajı)
+    failed = pyqtSignal(str)
+
+    # Worker thread'inden arayüz thread'ine kuyruklanır: (sonuç, hata)
+    _completed = pyqtSignal(object, object)
+
+    def __init__(self, key: Optional[str] = None):
+        super().__init__()
+        self.key = key
+        self.result = None
+        self.error: Optional[str] = None
+        self._cancelled = False
+        self._done = False
+        # Görev bittiğinde (iptal edilmiş olsa da) arayüz thread'inde çağrılır
+        self._on_done: Optional[Callable] = None
+        self._completed.connect(self._deliver)
+
+    def then(self, on_finished: Callable = None, on_failed: Callable = None) -> "TaskFuture":
+        """Sinyallere kısayol: future.then(ok_fn, hata_fn)"""
+        if on_finished is not None:
+            self.finished.connect(on_finished)
+        if on_failed is not None:
+            self.failed.connect(on_failed)
+        return self
+
+    def cancel(self):
+        """Sonucu yok say; görev henüz başlamadıysa hiç çalıştırılmaz."""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _deliver(self, result, error):
+        # Arayüz thread'inde
+        self._done = True
+        if self._on_done is not None:
+            self._on_done(self)
+        if self._cancelled:
+            return
+        if error is not None:
+            self.error = error
+            self.failed.emit(error)
+        else:
+            self.result = result
+            self.finished.emit(result)
+
+
+class _Task(QRunnable):
+    def __init__(self, future: TaskFuture, fn: Callable, args, kwargs):
+        super().__init__()
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        if self.future.is_cancelled():
+            self.future._completed.emit(None, None)
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"Arka plan görevi hatası: {e}")
+            self.future._completed.emit(None, str(e))
+            return
+        self.future._completed.emit(result, None)
+
+
+class TaskRunner(QObject):
+    """Eşzamanlılık sınırı olan görev havuzu."""
+
+    def __init__(self, max_workers: int = 4):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_workers)
+        # Bitene kadar referans tutulur (aksi halde Python nesneyi toplayabilir)
+        self._active: Set[TaskFuture] = set()
+        self._tasks: Dict[TaskFuture, _Task] = {}
+        self._by_key: Dict[str, TaskFuture] = {}
+
+    def submit(self, fn: Callable, *args, key: Optional[str] = None, **kwargs) -> TaskFuture:
+        """
+        fn(*args, **kwargs) çağrısını havuzda çalıştır.
+        key verilirse aynı anahtarlı, henüz bitmemiş görev iptal edilir.
+        """
+        if key is not None:
+            self.cancel(key)
+        future = TaskFuture(key)
+        task = _Task(future, fn, args, kwargs)
+        task.setAutoDelete(False)
+        future._on_done = self._forget
+        self._active.add(future)
+        self._tasks[future] = task
+        if key is not None:
+            self._by_key[key] = future
+        self.pool.start(task)
+        return future
+
+    def is_pending(self, key: str) -> bool:
+        """Bu anahtarla çalışan/bekleyen bir görev var mı?"""
+        return key in self._by_key
+
+    def cancel(self, key: str):
+        """Anahtara ait bekleyen/çalışan görevi iptal et"""
+        future = self._by_key.get(key)
+        if future is not None:
+            self.cancel_future(future)
+
+    def cancel_future(self, future: TaskFuture):
+        future.cancel()
+        task = self._tasks.get(future)
+        # Kuyrukta bekliyorsa havuzdan çıkar; çalışıyorsa sonucu yok sayılır
+        if task is not None and self.pool.tryTake(task):
+            self._forget(future)
+        elif future.key is not None and self._by_key.get(future.key) is future:
+            del self._by_key[future.key]
+
+    def cancel_all(self):
+        for future in list(self._active):
+            self.cancel_future(future)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Tüm görevlerin bitmesini bekle (kapanışta kullanılır)"""
+        return self.pool.waitForDone(msecs)
+
+    def _forget(self, future: TaskFuture):
+        self._active.discard(future)
+        self._tasks.pop(future, None)
+        if future.key is not None and self._by_key.get(future.key) is future:
+            del self._by_key[future.key]
+
+
+_task_runner: Optional[TaskRunner] = None
+
+
+def get_task_runner() -> TaskRunner:
+    """Uygulama genelinde paylaşılan görev havuzunu döndür."""
+    global _task_runner
+    if _task_runner is None:
+        _task_runner = TaskRunner(TASK_CONFIG["max_workers"])
+    return _task_runner